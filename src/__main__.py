@@ -1,32 +1,34 @@
-# Fast API imports
-import uvicorn
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+"""
+Entry point of the API: the FastAPI app and a command-line interface.
 
+Commands (`python -m src <command> --help` lists the options of each):
+- serve: Starts the API under uvicorn right away (the default without a command).
+- seed: Drops and seeds the fixture collections, optionally the user collection too.
+- drop: Drops the fixture collections, every collection (--all) or the user collection (--user).
+- export-types: Writes the fields of the domain models to output.txt as TypeScript interfaces.
+- test: Runs the test suite in parallel; extra arguments are passed to pytest.
+"""
+
+# Fast API imports
+import argparse
 import subprocess
 import sys
 
-from src import env
-from src.domain.language import Language
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
 
-# Import domain for output.txt
-from src.domain.blog import Blog
-from src.domain.book import Book
-from src.domain.contact import Contact
-from src.domain.experiences import Experiences
-from src.domain.language_data import LanguageData
-from src.domain.links import Links
-from src.domain.projects import Projects
-from src.domain.article import Article
-from src.domain.dev_api import DevAritcle, User
+from src import env
+from src.services import logs
 
+# Queue-based structured logging, configured before the services below log anything
+logs.configure()
 
-from src.services import db
+from src.services import db, compression, content_storage, http_client, jobs, json_response, metrics
 from src.services.routers import routers
 from src.tags_metadata import tags_metadata
-from src.utils.domain_to_txt import write_fields_to_txt
 
-app = FastAPI(openapi_tags=tags_metadata)
+# Responses are rendered with orjson (src.services.json_response) unless a route returns its own response
+app = FastAPI(openapi_tags=tags_metadata, default_response_class=json_response.ORJSONResponse)
 
 # Configure CORS settings
 app.add_middleware(
@@ -37,61 +39,148 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+# Compress responses of at least COMPRESSION_MIN_SIZE bytes with brotli or gzip (inside the metrics, so they see the
+# compressed sizes)
+app.add_middleware(compression.CompressionMiddleware)
+
+# Record per-route latency, in-flight requests, response sizes and Mongo time
+app.add_middleware(metrics.MetricsMiddleware, router=app.router)
+
+# Bind a request ID (X-Request-ID) to every log record of the request (outermost, so all middleware logs carry it)
+app.add_middleware(logs.RequestIdMiddleware)
+
+# Create the MongoDB client once the app starts (importing the app doesn't connect)
+@app.on_event('startup')
+def connect_database():
+    db.connect()
+
+
+# Stop the background jobs and close the shared HTTP client of the external APIs
+@app.on_event('shutdown')
+async def stop_background_work():
+    jobs.shutdown()
+    await http_client.close()
+
+
+# Make sure the newest-first reads are indexed, in either storage mode
+@app.on_event('startup')
+def prepare_content_storage():
+    content_storage.ensure_indexes()
+
+
 # Check health for this initialization
 @app.get('/healthy')
 def health_check():
     return {'status': 'healthy'}
 
+# Per-route performance metrics in Prometheus text format
+@app.get('/metrics', include_in_schema=False)
+def get_metrics():
+    content, content_type = metrics.render()
+    return Response(content=content, media_type=content_type)
+
+
 # Loop through and register all routers
 for router, prefix, tags in routers:
     app.include_router(router, prefix=prefix, tags=tags)
 
 
-def run_tests():
-    """Run pytest and return True if all tests pass."""
-    result = subprocess.run(["pytest", "--html=test/html_report/report.html", "--self-contained-html"])
+def run_tests(pytest_args: list[str] = ()) -> bool:
+    """Run pytest on one worker per CPU (pytest-xdist, a database per worker) and return True if all tests pass."""
+    result = subprocess.run(
+        ["pytest", "-n", "auto", "--html=test/html_report/report.html", "--self-contained-html", *pytest_args])
     return result.returncode == 0  # 0 means success, non-zero means failure
 
-if __name__ == '__main__':
 
-    yes = input('Type "y" if you want to drop the entire DATABASE: ').strip().lower()
-    if yes == 'y':
-        print('drop_all_collections() initialized')
-        db.drop_all_collections()
-        # optionally re-seed here
-    else:
-        print('Database drop and seed skipped')
+def serve(args):
+    import uvicorn
+
+    # Several worker processes need the app as an import string, one worker serves the already imported app
+    target = 'src.__main__:app' if args.workers > 1 else app
+    uvicorn.run(target, host=args.host, port=args.port, workers=args.workers, loop=args.loop, http=args.http,
+                log_level=args.log_level, proxy_headers=args.proxy_headers)
 
-    # Confirm if you want to drop and seed a database
-    yes = input('Type "y" if you want to run drop and seed: ').strip().lower()
-    if yes == 'y':
-        print('drop() and seed() initialized')
-        db.drop()
-        db.seed()
-    else:
-        print('Database drop and seed skipped')
 
-    # Confirm if you want to drop and seed users database
-    drop_user = input('If you want to drop user type "y": ').strip().lower()
-    if drop_user == 'y':
+def seed(args):
+    db.drop()
+    db.seed()
+    if args.user:
         db.drop_user()
         db.seed_user()
-    else:
-        print('User drop and seed skipped')
-
-    # Confirm if you want to write fields to output.txt
-    yes_doc = input('Type "y" if you want to write the document and press enter: ').strip().lower()
-    if yes_doc == 'y':
-        print('Writing fields to output.txt...')
-        write_fields_to_txt(
-            [Blog, Experiences, Contact, Links, Projects, Book, Language, Article, DevAritcle, User, LanguageData])
-        print('Done! Fields have been written to output.txt')
-    else:
-        print('Document writing aborted')
 
-    if run_tests():
-        print("✅ All tests passed! Starting FastAPI application...")
-        uvicorn.run(app, host="127.0.0.1", port=env.PORT)
+
+def drop(args):
+    if args.all:
+        db.drop_all_collections()
     else:
-        print("❌ Tests failed! Fix issues before running the application.")
-        sys.exit(1)
+        db.drop()
+        if args.user:
+            db.drop_user()
+
+
+def export_types(args):
+    from src.domain.article import Article
+    from src.domain.blog import Blog
+    from src.domain.book import Book
+    from src.domain.contact import Contact
+    from src.domain.dev_api import DevAritcle, User
+    from src.domain.experiences import Experiences
+    from src.domain.language import Language
+    from src.domain.language_data import LanguageData
+    from src.domain.links import Links
+    from src.domain.projects import Projects
+    from src.utils.domain_to_txt import write_fields_to_txt
+
+    write_fields_to_txt(
+        [Blog, Experiences, Contact, Links, Projects, Book, Language, Article, DevAritcle, User, LanguageData])
+    print('Fields have been written to output.txt')
+
+
+def test(args):
+    sys.exit(0 if run_tests(args.pytest_args) else 1)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m src', description='Run the API or manage its database.')
+    commands = parser.add_subparsers(title='commands', metavar='<command>')
+
+    serve_parser = commands.add_parser('serve', help='start the API under uvicorn (default)')
+    serve_parser.add_argument('--host', default=env.HOST, help='bind address (default: HOST or 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=env.PORT, help='bind port (default: PORT)')
+    serve_parser.add_argument('--workers', type=int, default=env.WORKERS, help='worker processes (default: WORKERS or 1)')
+    serve_parser.add_argument('--loop', choices=['auto', 'asyncio', 'uvloop'], default='auto',
+                              help='event loop; auto picks uvloop when it is installed')
+    serve_parser.add_argument('--http', choices=['auto', 'h11', 'httptools'], default='auto',
+                              help='HTTP parser; auto picks httptools when it is installed')
+    serve_parser.add_argument('--log-level', default='info', help='uvicorn log level')
+    serve_parser.add_argument('--proxy-headers', action='store_true',
+                              help='trust X-Forwarded-* headers (behind a reverse proxy)')
+    serve_parser.set_defaults(command=serve)
+
+    seed_parser = commands.add_parser('seed', help='drop and seed the fixture collections')
+    seed_parser.add_argument('--user', action='store_true', help='drop and seed the user collection too')
+    seed_parser.set_defaults(command=seed)
+
+    drop_parser = commands.add_parser('drop', help='drop the fixture collections')
+    drop_parser.add_argument('--all', action='store_true', help='drop ALL collections of the database')
+    drop_parser.add_argument('--user', action='store_true', help='drop the user collection too')
+    drop_parser.set_defaults(command=drop)
+
+    export_parser = commands.add_parser('export-types', help='write the domain models to output.txt for the frontend')
+    export_parser.set_defaults(command=export_types)
+
+    test_parser = commands.add_parser('test', help='run the test suite in parallel (other arguments go to pytest)')
+    test_parser.set_defaults(command=test)
+
+    # Without a command the API is served with the default options; unknown arguments are only allowed for `test`
+    argv = sys.argv[1:] if argv is None else argv
+    args, unknown = parser.parse_known_args(argv or ['serve'])
+    if unknown and args.command is not test:
+        parser.error(f"unrecognized arguments: {' '.join(unknown)}")
+    args.pytest_args = unknown
+    return args
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+    arguments.command(arguments)
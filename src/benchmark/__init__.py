@@ -0,0 +1,5 @@
+"""
+Performance benchmarks and load tests of the API.
+
+Run `python -m src.benchmark --help` for the in-process benchmark of the public API hot paths.
+"""
@@ -0,0 +1,159 @@
+"""
+In-process benchmark of the public API hot paths.
+
+Drives the app through the Starlette test client (no network, no uvicorn) against either mongomock or a local
+mongod, so the numbers measure the app itself: routing, validation, serialization and the database calls.
+
+Scenarios:
+- `<collection>.all`, `.by_id`, `.limited`: `all_data` / `data_by_id` / `limited_data` for every model route
+- `language.<category>`: the `/language/*` category routes
+- `login`: POST /login/ (password hashing included)
+- `current_user`: a protected route, i.e. token decoding plus `get_current_user`
+
+Results (throughput, mean, p50, p90, p99 per scenario) are printed and saved as JSON; pass `--baseline` with an
+earlier results file to fail when a scenario regressed.
+
+Usage:
+    python -m src.benchmark --backend mongomock --output benchmark.json
+    python -m src.benchmark --backend mongod --mongo-url mongodb://localhost:27017 --baseline benchmark.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from src.benchmark.runner import compare, configure_environment, measure, summarize
+
+BENCHMARK_USER = 'benchmark'
+BENCHMARK_PASSWORD = 'benchmark'
+
+# Documents generated per collection group (see src.services.synthetic); multiplied by --scale
+VOLUMES = {'articles': 15 * 200, 'qa': 15 * 200, 'blog': 300, 'book': 100, 'projects': 100, 'language_data': 1000}
+
+# Model routes benchmarked with all_data / data_by_id / limited_data: (name, URL prefix, collection)
+MODEL_ROUTES = [
+    ('blog', '/blog', 'blog'),
+    ('book', '/book', 'book'),
+    ('projects', '/projects', 'projects'),
+    ('experiences', '/experiences', 'experiences'),
+    ('links', '/links', 'links'),
+    ('python_qa', '/qa/python', 'python_qa'),
+    ('python_articles', '/article/python', 'python_articles'),
+]
+
+LANGUAGE_ROUTES = [
+    'programming-languages', 'frameworks-frontend', 'frameworks-backend', 'mobile-development', 'database-management',
+    'devops', 'ui-ux-design', 'testing', 'version-control', 'operating-system', 'ides',
+]
+
+
+def _prepare_data(scale: float):
+    from src.domain.language_data import LanguageData
+    from src.domain.user import User
+    from src.language_groups import languages_of_interests
+    from src.services import db, fixtures, synthetic
+    from src.services.security import make_hash
+
+    db.drop_all_collections()
+    synthetic.fill({group: int(count * scale) for group, count in VOLUMES.items()})
+    for collection in ('experiences', 'links'):
+        fixtures.load_fixture(collection, db.process)
+
+    # Make every category route return data
+    tags = {tag for name, group in vars(languages_of_interests).items() if name.isupper() for tag in group}
+    db.process.language_data.insert_many([
+        LanguageData(tag=tag, count=random.randrange(10 ** 6)).model_dump(by_alias=True) for tag in sorted(tags)
+    ])
+
+    user = User(username=BENCHMARK_USER, hashed_password=make_hash(BENCHMARK_PASSWORD), disabled=False)
+    db.process.user.insert_one(user.model_dump(by_alias=True))
+
+
+def _scenarios(client, app) -> dict:
+    from src.services import db
+    from src.services.content_storage import resolve
+
+    paths = {route.path for route in app.routes}
+    scenarios = {}
+
+    for name, prefix, collection in MODEL_ROUTES:
+        physical, base_filter = resolve(collection)
+        ids = [document['_id'] for document in db.process[physical].find(base_filter, {'_id': 1}).limit(1000)]
+        scenarios[f'{name}.all'] = lambda prefix=prefix: client.get(f'{prefix}/')
+        if ids:
+            scenarios[f'{name}.by_id'] = lambda prefix=prefix, ids=ids: client.get(f'{prefix}/{random.choice(ids)}')
+        if f'{prefix}/limited/' in paths:
+            scenarios[f'{name}.limited'] = lambda prefix=prefix: client.get(f'{prefix}/limited/', params={'limit': 4})
+
+    for category in LANGUAGE_ROUTES:
+        scenarios[f'language.{category}'] = lambda category=category: client.get(f'/language/{category}')
+
+    login = {'username': BENCHMARK_USER, 'password': BENCHMARK_PASSWORD}
+    scenarios['login'] = lambda: client.post('/login/', data=login)
+    token = client.post('/login/', data=login).json()['access_token']
+    scenarios['current_user'] = lambda: client.post('/admin/', headers={'Authorization': f'Bearer {token}'})
+    return scenarios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the public API hot paths in-process.')
+    parser.add_argument('--backend', choices=['mongomock', 'mongod'], default='mongomock')
+    parser.add_argument('--mongo-url', default='mongodb://localhost:27017', help='mongod to use with --backend mongod')
+    parser.add_argument('--database', default='benchmark', help='database the benchmark drops and fills')
+    parser.add_argument('--scale', type=float, default=1.0, help='multiplier of the generated data volumes')
+    parser.add_argument('--iterations', type=int, default=200, help='measured calls per scenario')
+    parser.add_argument('--warmup', type=int, default=10, help='unmeasured calls per scenario')
+    parser.add_argument('--only', default='', help='run only scenarios whose name starts with this prefix')
+    parser.add_argument('--output', default='benchmark.json', help='file the JSON results are written to')
+    parser.add_argument('--baseline', help='earlier results file; exit with status 1 if a scenario regressed')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against the baseline')
+    args = parser.parse_args(argv)
+
+    configure_environment(args.backend, args.mongo_url, args.database)
+    random.seed(0)
+
+    from fastapi.testclient import TestClient
+    from src.__main__ import app
+
+    _prepare_data(args.scale)
+    client = TestClient(app)  # Without startup events: no schedulers or index builds during the measurement
+    results = {}
+    for name, call in _scenarios(client, app).items():
+        if not name.startswith(args.only):
+            continue
+        response = call()
+        if response.status_code != 200:
+            raise SystemExit(f'{name}: unexpected status {response.status_code}')
+        results[name] = summarize(measure(call, args.iterations, args.warmup))
+        print(f"{name:40} {results[name]['rps']:>9} req/s  p50 {results[name]['p50_ms']:>8} ms"
+              f"  p99 {results[name]['p99_ms']:>8} ms")
+
+    report = {
+        'meta': {
+            'backend': args.backend,
+            'scale': args.scale,
+            'iterations': args.iterations,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f'Results written to {args.output}')
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file)['results'], args.tolerance)
+        for line in regressions:
+            print(f'REGRESSION {line}')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
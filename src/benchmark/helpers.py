@@ -0,0 +1,84 @@
+"""
+Benchmark of the read helpers in `src.utils.router_helpers`, without HTTP and without the response cache.
+
+Fills `python_articles` (validated as `Article`) and `language_data` (`LanguageData`) with synthetic documents and times
+the helpers directly, so the numbers show the cost of reading and validating documents into models and of
+serializing them:
+
+- `all_data`: every document into a model
+- `all_data+dump`: the same, plus dumping the models to dicts by alias (what a JSON response needs)
+- `limited_data`: the newest `--limit` documents
+- `data_by_id`: one document by `_id`
+- `stream_data`: the whole NDJSON stream of the collection
+- `validate`, `dump`: validation of already read documents into models, and dumping the models, without the database
+
+Usage:
+    python -m src.benchmark.helpers --articles 2000 --tags 5000 --output helpers.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+
+from src.benchmark.runner import configure_environment, measure, summarize
+
+
+def _drain(response) -> int:
+    async def read():
+        return sum([len(chunk) async for chunk in response.body_iterator])
+    return asyncio.run(read())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the read helpers of router_helpers.')
+    parser.add_argument('--backend', choices=['mongomock', 'mongod'], default='mongomock')
+    parser.add_argument('--mongo-url', default='mongodb://localhost:27017', help='mongod to use with --backend mongod')
+    parser.add_argument('--database', default='benchmark', help='database the benchmark drops and fills')
+    parser.add_argument('--articles', type=int, default=2000, help='documents in python_articles')
+    parser.add_argument('--tags', type=int, default=5000, help='documents in language_data')
+    parser.add_argument('--limit', type=int, default=50, help='limit of limited_data')
+    parser.add_argument('--iterations', type=int, default=20, help='measured calls per scenario')
+    parser.add_argument('--output', default='helpers.json', help='file the JSON results are written to')
+    args = parser.parse_args(argv)
+
+    configure_environment(args.backend, args.mongo_url, args.database)
+    random.seed(0)
+
+    from src.domain.article import Article
+    from src.domain.language_data import LanguageData
+    from src.services import db, synthetic
+    from src.utils.router_helpers import _list_adapter, all_data, data_by_id, limited_data, stream_data
+
+    db.drop_all_collections()
+    synthetic.fill({'articles': args.articles * len(synthetic.TECHNOLOGIES), 'language_data': args.tags})
+    ids = [document['_id'] for document in db.process.python_articles.find({}, {'_id': 1})]
+
+    scenarios = {}
+    for collection, model in (('python_articles', Article), ('language_data', LanguageData)):
+        scenarios[f'{collection}.all_data'] = lambda c=collection, m=model: all_data(c, m)
+        scenarios[f'{collection}.all_data+dump'] = lambda c=collection, m=model: [
+            document.model_dump(mode='json', by_alias=True) for document in all_data(c, m)
+        ]
+        scenarios[f'{collection}.stream_data'] = lambda c=collection, m=model: _drain(stream_data(c, m))
+        documents = list(db.process[collection].find())
+        models = _list_adapter(model).validate_python(documents)
+        scenarios[f'{collection}.validate'] = lambda m=model, d=documents: _list_adapter(m).validate_python(d)
+        scenarios[f'{collection}.dump'] = lambda models=models: [
+            document.model_dump(mode='json', by_alias=True) for document in models
+        ]
+    scenarios['python_articles.limited_data'] = lambda: limited_data('python_articles', Article, args.limit)
+    scenarios['python_articles.data_by_id'] = lambda: data_by_id('python_articles', Article, random.choice(ids))
+
+    results = {}
+    for name, call in scenarios.items():
+        results[name] = summarize(measure(call, args.iterations, warmup=2))
+        print(f"{name:40} mean {results[name]['mean_ms']:>10} ms  p99 {results[name]['p99_ms']:>10} ms")
+
+    with open(args.output, 'w') as file:
+        json.dump({'results': results}, file, indent=2)
+    print(f'Results written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+HTTP load test of the app against local stubs of its upstream APIs.
+
+Starts the stub of dev.to, GitHub and StackOverflow (`src.benchmark.stubs`) and the app under uvicorn, each in its
+own process, points the app's upstream URLs at the stub and sends concurrent traffic from this process for a fixed
+duration. The stub's latency, error rate and rate limiting are configurable, so the app's behavior under upstream
+slowness and failures can be measured without network access.
+
+Per route it reports the number of requests, aggregate throughput, p50/p90/p99 latency and the status codes, printed
+and written as JSON.
+
+Usage:
+    python -m src.benchmark.loadtest --concurrency 50 --duration 30 --latency-ms 300 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter
+
+import httpx
+
+from src.benchmark.runner import configure_environment, summarize
+from src.benchmark.stubs import StubConfig, create_app, upstream_environment
+
+DEFAULT_ROUTES = ['/dev/python', '/dev/angular', '/github/', '/language/tags', '/healthy']
+STARTUP_TIMEOUT = 30  # Seconds to wait for the stub and the app to accept requests
+
+
+def _run_stub(port: int, config: StubConfig):
+    import uvicorn
+    uvicorn.run(create_app(config), host='127.0.0.1', port=port, log_level='warning')
+
+
+def _run_app(port: int, stub_url: str, backend: str, mongo_url: str, database: str):
+    os.environ.update(upstream_environment(stub_url))
+    configure_environment(backend, mongo_url, database)
+
+    import uvicorn
+    from src.__main__ import app
+    uvicorn.run(app, host='127.0.0.1', port=port, log_level='warning')
+
+
+def _wait_until_ready(url: str):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit(f'{url} did not become ready within {STARTUP_TIMEOUT} s')
+
+
+async def generate_traffic(base_url: str, routes: list[str], concurrency: int, duration: float,
+                           timeout: float) -> dict[str, list[tuple[str, float]]]:
+    """
+    Sends requests from `concurrency` workers for `duration` seconds, cycling through `routes`.
+
+    Returns:
+        dict[str, list[tuple[str, float]]]: Per route, the (status, latency in seconds) of every request; the status
+        is the HTTP status code or the name of the transport error.
+    """
+    samples = {route: [] for route in routes}
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def worker(offset: int):
+            number = offset
+            while time.monotonic() < deadline:
+                route = routes[number % len(routes)]
+                number += 1
+                start = time.perf_counter()
+                try:
+                    status = str((await client.get(route)).status_code)
+                except httpx.TransportError as e:
+                    status = type(e).__name__
+                samples[route].append((status, time.perf_counter() - start))
+
+        await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    return samples
+
+
+def report(samples: dict[str, list[tuple[str, float]]], duration: float) -> dict[str, dict]:
+    """
+    Summarizes the samples per route: latency percentiles, aggregate throughput and status code counts.
+    """
+    results = {}
+    for route, route_samples in samples.items():
+        if not route_samples:
+            continue
+        summary = summarize([latency for _, latency in route_samples])
+        summary['rps'] = round(len(route_samples) / duration, 1)
+        summary['statuses'] = dict(Counter(status for status, _ in route_samples))
+        results[route] = summary
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load-test the app against local stubs of its upstream APIs.')
+    parser.add_argument('--backend', choices=['mongomock', 'mongod'], default='mongomock')
+    parser.add_argument('--mongo-url', default='mongodb://localhost:27017', help='mongod to use with --backend mongod')
+    parser.add_argument('--database', default='loadtest', help='database used by the app under test')
+    parser.add_argument('--app-port', type=int, default=8765)
+    parser.add_argument('--stub-port', type=int, default=8766)
+    parser.add_argument('--routes', default=','.join(DEFAULT_ROUTES), help='comma-separated app routes to request')
+    parser.add_argument('--concurrency', type=int, default=20, help='concurrent clients')
+    parser.add_argument('--duration', type=float, default=15, help='seconds of traffic')
+    parser.add_argument('--timeout', type=float, default=30, help='client timeout per request in seconds')
+    parser.add_argument('--latency-ms', type=float, default=100, help='stub latency per upstream response')
+    parser.add_argument('--jitter-ms', type=float, default=50, help='random extra stub latency')
+    parser.add_argument('--error-rate', type=float, default=0, help='share of upstream responses that are a 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0, help='share of upstream responses rate-limited')
+    parser.add_argument('--stackoverflow-backoff', type=int, default=0, help='backoff seconds sent by StackOverflow')
+    parser.add_argument('--output', default='loadtest.json', help='file the JSON results are written to')
+    args = parser.parse_args(argv)
+
+    config = StubConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                        rate_limit_rate=args.rate_limit_rate, stackoverflow_backoff=args.stackoverflow_backoff)
+    stub_url = f'http://127.0.0.1:{args.stub_port}'
+    app_url = f'http://127.0.0.1:{args.app_port}'
+
+    # Fresh interpreters, so the app reads the stub URLs and database from the environment set in _run_app
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=_run_stub, args=(args.stub_port, config), daemon=True),
+        context.Process(target=_run_app, args=(args.app_port, stub_url, args.backend, args.mongo_url, args.database),
+                        daemon=True),
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        _wait_until_ready(f'{stub_url}/health')
+        _wait_until_ready(f'{app_url}/healthy')
+
+        routes = [route.strip() for route in args.routes.split(',') if route.strip()]
+        samples = asyncio.run(generate_traffic(app_url, routes, args.concurrency, args.duration, args.timeout))
+        results = report(samples, args.duration)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.join()
+
+    for route, result in results.items():
+        print(f"{route:30} {result['iterations']:>7} req {result['rps']:>8} req/s  p50 {result['p50_ms']:>9} ms  "
+              f"p99 {result['p99_ms']:>9} ms  {result['statuses']}")
+
+    with open(args.output, 'w') as file:
+        json.dump({'config': vars(args), 'results': results}, file, indent=2)
+    print(f'Results written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
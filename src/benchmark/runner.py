@@ -0,0 +1,86 @@
+"""
+Timing, summarizing and comparing benchmark scenarios.
+
+Functions:
+- configure_environment: Points the app at the benchmark database (mongomock or a local mongod).
+- measure: Calls a scenario repeatedly and returns the latency of every call.
+- summarize: Reduces latencies to throughput, mean, p50, p90 and p99.
+- compare: Lists the scenarios whose p50 / p99 regressed against a baseline.
+"""
+
+import os
+import statistics
+import time
+from typing import Callable
+
+
+def configure_environment(backend: str, mongo_url: str, database: str):
+    """
+    Points the app at the benchmark database; must run before anything from `src` reads the environment.
+
+    With the 'mongomock' backend `pymongo.MongoClient` is replaced by mongomock's client, so no server is needed.
+    """
+    os.environ['ENV'] = 'development'
+    os.environ['DB_DEV'] = mongo_url
+    os.environ['DB_PROCESS'] = database
+    os.environ['LOG_LEVEL'] = 'WARNING'
+    for name, default in (('PORT', '8000'), ('SECRET_KEY', 'benchmark-secret'), ('ALGORITHM', 'HS256')):
+        os.environ.setdefault(name, default)
+
+    if backend == 'mongomock':
+        import mongomock
+        import pymongo
+        pymongo.MongoClient = mongomock.MongoClient
+
+
+def measure(call: Callable[[], object], iterations: int, warmup: int = 5) -> list[float]:
+    """
+    Runs `call` `warmup` times unmeasured, then `iterations` times, and returns each call's latency in seconds.
+    """
+    for _ in range(warmup):
+        call()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summarize(latencies: list[float]) -> dict:
+    """
+    Returns the number of calls, throughput (calls per second) and mean / p50 / p90 / p99 latency in milliseconds.
+    """
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    else:
+        percentiles = latencies * 99
+    return {
+        'iterations': len(latencies),
+        'rps': round(len(latencies) / sum(latencies), 1),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 3),
+        'p50_ms': round(percentiles[49] * 1000, 3),
+        'p90_ms': round(percentiles[89] * 1000, 3),
+        'p99_ms': round(percentiles[98] * 1000, 3),
+    }
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float = 0.2) -> list[str]:
+    """
+    Compares results with a baseline of the same format.
+
+    Returns:
+        list[str]: One line per scenario whose p50 or p99 is more than `tolerance` (a fraction) slower than the
+        baseline; empty when nothing regressed.
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for metric in ('p50_ms', 'p99_ms'):
+            if before[metric] and result[metric] > before[metric] * (1 + tolerance):
+                change = result[metric] / before[metric] - 1
+                regressions.append(f'{name}: {metric} {before[metric]} -> {result[metric]} (+{change:.0%})')
+    return regressions
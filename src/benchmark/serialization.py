@@ -0,0 +1,85 @@
+"""
+Benchmark of JSON serialization for large lists of models.
+
+Encodes lists of 1k and 10k synthetic `Article` (or `DevAritcle`) models the ways the app can produce a list response
+and reports the time per list:
+
+- `jsonable_encoder+json`: FastAPI's default, `jsonable_encoder` and the stdlib `json` (the previous app default)
+- `jsonable_encoder+orjson`: a route returning models with the app's `ORJSONResponse`
+- `dict+orjson`: `model.model_dump(mode='json', by_alias=True)` and orjson, as used for cached lists and NDJSON streams
+
+Every strategy's output is checked against the first one before timing.
+
+Usage:
+    python -m src.benchmark.serialization --sizes 1000,10000 --model article --output serialization.json
+"""
+
+import argparse
+import json
+import random
+
+from src.benchmark.runner import configure_environment, measure, summarize
+
+
+def _articles(count: int):
+    from src.domain.article import Article
+    from src.services.synthetic import generate
+    return [Article(**document) for document in generate('python_articles', count)]
+
+
+def _dev_articles(count: int):
+    from src.domain.dev_api import DevAritcle
+    rng = random.Random(0)
+    return [
+        DevAritcle(
+            type_of='article', title=f'Article {number}', description='Stubbed dev.to article ' * 5,
+            url=f'https://dev.to/a/{number}', cover_image=None, published_at='2024-01-01T00:00:00Z', tag_list=['python', 'webdev'],
+            user={'name': f'Author {rng.randrange(1000)}', 'profile_image': 'https://dev.to/a.png'},
+        )
+        for number in range(count)
+    ]
+
+
+def _strategies():
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from src.services.json_response import ORJSONResponse, dumps
+    return {
+        'jsonable_encoder+json': lambda models: JSONResponse(jsonable_encoder(models)).body,
+        'jsonable_encoder+orjson': lambda models: ORJSONResponse(jsonable_encoder(models)).body,
+        'dict+orjson': lambda models: dumps([model.model_dump(mode='json', by_alias=True) for model in models]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark JSON serialization of large model lists.')
+    parser.add_argument('--sizes', default='1000,10000', help='comma-separated list lengths')
+    parser.add_argument('--model', choices=['article', 'dev_article'], default='article')
+    parser.add_argument('--iterations', type=int, default=20, help='measured encodings per strategy and size')
+    parser.add_argument('--output', default='serialization.json', help='file the JSON results are written to')
+    args = parser.parse_args(argv)
+
+    # Nothing is read from a database, but the app modules need their environment before they are imported
+    configure_environment('mongomock', 'mongodb://localhost:27017', 'benchmark')
+    strategies = _strategies()
+
+    make = _articles if args.model == 'article' else _dev_articles
+    results = {}
+    for size in (int(size) for size in args.sizes.split(',')):
+        models = make(size)
+        expected = json.loads(next(iter(strategies.values()))(models))
+        for name, encode in strategies.items():
+            if json.loads(encode(models)) != expected:
+                raise SystemExit(f'{name}: output differs from the default encoding')
+            key = f'{args.model}.{size}.{name}'
+            results[key] = summarize(measure(lambda: encode(models), args.iterations, warmup=2))
+            print(f"{key:45} mean {results[key]['mean_ms']:>10} ms  p99 {results[key]['p99_ms']:>10} ms")
+
+    with open(args.output, 'w') as file:
+        json.dump({'results': results}, file, indent=2)
+    print(f'Results written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Local stub of the upstream APIs the app depends on: dev.to, GitHub and StackOverflow.
+
+One FastAPI app serves all three under different prefixes, so the app under test can be pointed at it with
+`DEV_TO_API_URL`, `GITHUB_API_URL` and `STACK_URL`. Every response can be delayed (fixed latency plus random jitter),
+and a configurable share of requests fails with a 500 or is rate-limited (429 with `Retry-After` for dev.to and
+GitHub, a `throttle_violation` error for StackOverflow, like the real APIs).
+
+Routes:
+- GET /health: Readiness check
+- GET /devto/articles?tag=: A list of dev.to articles
+- GET /github/users/{user}/repos?per_page=&page=: One page of GitHub repositories
+- GET /stackoverflow/tags?page=: One page of StackOverflow tags
+
+Functions:
+- create_app: Builds the stub app for a `StubConfig`.
+- upstream_environment: Returns the environment variables pointing the app at a running stub.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 0  # Added to every response
+    jitter_ms: float = 0  # Random extra latency, uniformly 0..jitter_ms
+    error_rate: float = 0  # Share of requests answered with a 500
+    rate_limit_rate: float = 0  # Share of requests answered with a rate-limit response
+    devto_articles: int = 30  # Articles per dev.to response
+    github_repos: int = 45  # Repositories of the GitHub user, paginated by per_page
+    stackoverflow_items: int = 100  # Tags per StackOverflow page
+    stackoverflow_backoff: int = 0  # Seconds of `backoff` returned with every StackOverflow page (0: none)
+    seed: int = 0
+
+
+def _devto_article(tag: str, number: int) -> dict:
+    return {
+        'type_of': 'article',
+        'title': f'{tag.capitalize()} article {number}',
+        'description': f'Stubbed dev.to article {number} about {tag}. ' * 3,
+        'url': f'https://dev.to/stub/{tag}-{number}',
+        'cover_image': None,
+        'published_at': '2024-01-01T00:00:00Z',
+        'tag_list': [tag, 'webdev', 'programming'],
+        'user': {'name': f'Author {number}', 'profile_image': 'https://dev.to/stub.png', 'website_url': None},
+    }
+
+
+def _github_repo(user: str, number: int) -> dict:
+    return {
+        'id': number,
+        'name': f'repo-{number}',
+        'full_name': f'{user}/repo-{number}',
+        'private': number % 10 == 0,
+        'html_url': f'https://github.com/{user}/repo-{number}',
+        'description': f'Stubbed repository {number}',
+        'language': 'Python',
+        'stargazers_count': number * 3,
+    }
+
+
+def create_app(config: StubConfig) -> FastAPI:
+    """
+    Builds the stub app; `config` is read on every request, so it can be changed while the stub is running.
+    """
+    app = FastAPI()
+    rng = random.Random(config.seed)
+
+    async def upstream(payload, rate_limited):
+        delay = config.latency_ms + rng.uniform(0, config.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        roll = rng.random()
+        if roll < config.error_rate:
+            return JSONResponse({'message': 'stubbed upstream error'}, status_code=500)
+        if roll < config.error_rate + config.rate_limit_rate:
+            return rate_limited()
+        return JSONResponse(payload)
+
+    def too_many_requests():
+        return JSONResponse({'message': 'rate limited'}, status_code=429, headers={'Retry-After': '1'})
+
+    @app.get('/health')
+    async def health():
+        return {'status': 'healthy'}
+
+    @app.get('/devto/articles')
+    async def devto_articles(tag: str = 'programming'):
+        return await upstream([_devto_article(tag, number) for number in range(config.devto_articles)],
+                              too_many_requests)
+
+    @app.get('/github/users/{user}/repos')
+    async def github_repos(user: str, per_page: int = 30, page: int = 1):
+        numbers = range((page - 1) * per_page, min(page * per_page, config.github_repos))
+        return await upstream([_github_repo(user, number) for number in numbers], too_many_requests)
+
+    @app.get('/stackoverflow/tags')
+    async def stackoverflow_tags(page: int = 1):
+        items = [{'name': f'tag-{page}-{number}', 'count': 10 ** 6 // (page * number + 1)}
+                 for number in range(config.stackoverflow_items)]
+        payload = {'items': items, 'has_more': True}
+        if config.stackoverflow_backoff:
+            payload['backoff'] = config.stackoverflow_backoff
+        return await upstream(payload, lambda: JSONResponse({
+            'error_id': 502, 'error_message': 'too many requests from this IP', 'error_name': 'throttle_violation',
+        }, status_code=400))
+
+    return app
+
+
+def upstream_environment(base_url: str) -> dict[str, str]:
+    """
+    Returns the environment variables that point the app's upstream calls at a stub running on `base_url`.
+    """
+    return {
+        'DEV_TO_API_URL': f'{base_url}/devto',
+        'GITHUB_API_URL': f'{base_url}/github',
+        'STACK_URL': f'{base_url}/stackoverflow/tags?page={{}}',
+        'GITHUB': 'stub-user',
+    }
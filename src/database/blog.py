@@ -1,33 +0,0 @@
-import datetime
-
-from src.domain.blog import Blog
-
-blog = [
-    Blog(
-        title='Test Naslov 1',
-        kategorija='angular',
-        podnaslov='Test Podnaslov 1',
-        author='Danilo Jezernik',
-        datum_vnosa=datetime.datetime.now(),
-        vsebina='<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. Etiam dictum pellentesque ornare. Integer pulvinar, diam sed consequat pulvinar, justo tortor cursus metus, gravida tincidunt orci sapien vitae orci. Integer id facilisis erat, ac commodo urna. Sed congue ante aliquet magna tempor laoreet. Mauris vel nisl porta, venenatis quam id, consequat est. Praesent vulputate et ipsum a posuere. Vestibulum arcu magna, iaculis sit amet pharetra sodales, aliquet vitae elit. Aenean nec mi urna. Etiam sit amet laoreet quam. Aenean a risus quis diam consectetur volutpat. Nulla facilisi. Proin tempor accumsan risus, vitae vulputate diam aliquet a.</p><p>Quisque accumsan luctus elit vel tempus. Mauris at justo vestibulum, feugiat ipsum sit amet, sollicitudin nisl. Aliquam at tincidunt nunc. Vivamus quis lacinia leo, quis ornare justo. Proin elit nunc, mattis at fermentum a, rutrum eget turpis. Aenean posuere arcu vel ipsum eleifend, sed pharetra risus placerat. Donec sem sapien, mattis ut convallis eget, tincidunt a lacus. Pellentesque vel lectus eros. Vestibulum finibus fringilla ipsum vitae vehicula. Nulla aliquam eleifend bibendum. Donec vitae lacinia odio, a consequat velit. Morbi volutpat condimentum justo, nec tempor dui venenatis ac. Maecenas porttitor enim vel urna condimentum dignissim.</p><p>Suspendisse interdum mauris et ligula aliquet, at gravida nulla maximus. Sed augue arcu, interdum sit amet consectetur non, faucibus vel magna. Quisque ac ex justo. Praesent scelerisque nibh nec lacinia pulvinar. Nullam nisl est, consequat ut dolor at, placerat venenatis risus. Donec aliquet pulvinar ex, nec hendrerit justo pulvinar varius. Pellentesque eget mauris eu purus accumsan cursus eget vel lorem.</p><p>Morbi sed dolor malesuada justo iaculis varius. Donec maximus tempus scelerisque. Mauris in lacus varius, tristique lacus vel, ornare justo. Donec tincidunt, purus sed feugiat fringilla, massa purus suscipit purus, vitae blandit augue sem ut sapien. Nulla at lorem volutpat, rutrum lacus ut, bibendum ex. Interdum et malesuada fames ac ante ipsum primis in faucibus. Duis sagittis mi ut lacus tincidunt, varius venenatis diam congue. Nam blandit orci a nisi porttitor, eget euismod nulla varius. Sed venenatis arcu in scelerisque laoreet. Nam vitae placerat nunc. Phasellus rhoncus erat ut maximus maximus. Curabitur quis consectetur quam.</p><p>Aliquam tincidunt lectus in elit laoreet, ac pretium eros porttitor. Sed et mauris tincidunt, maximus ante sit amet, tristique erat. Maecenas non consectetur nibh, a tempus ipsum. Pellentesque quis nunc non nisi gravida fringilla sed ut quam. Praesent malesuada velit et pharetra placerat. Nam metus diam, vulputate ut venenatis sit amet, consectetur vitae enim. Mauris sed neque luctus, interdum lectus vitae, placerat ante. Vivamus sed ullamcorper tellus. Sed viverra felis metus, quis efficitur dui fermentum in. Pellentesque sed elit vel erat gravida vestibulum vestibulum eget lacus.</p><p>Etiam sed imperdiet tortor. Fusce porta quam lectus, vitae porta metus placerat vel. Vivamus quis porttitor dolor. Aenean sodales turpis ac nulla dictum, laoreet fermentum arcu hendrerit. Class aptent taciti sociosqu ad litora torquent per conubia nostra, per inceptos himenaeos. Sed pharetra elit quis sem blandit, eu ornare sem mollis. Phasellus eu bibendum est, ac cursus dui. Aenean vel dictum dolor, in condimentum turpis. In hac habitasse platea dictumst. Interdum et malesuada fames ac ante ipsum primis in faucibus. Sed aliquam scelerisque eros non congue. Nullam posuere urna ac diam iaculis varius.</p>',
-        image='test1.jpg'
-    ).dict(by_alias=True),
-    Blog(
-        title='Test Naslov 2',
-        kategorija='angular',
-        podnaslov='Test Podnaslov 2',
-        author='Danilo Jezernik',
-        datum_vnosa=datetime.datetime.now(),
-        vsebina='<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. Etiam dictum pellentesque ornare. Integer pulvinar, diam sed consequat pulvinar, justo tortor cursus metus, gravida tincidunt orci sapien vitae orci. Integer id facilisis erat, ac commodo urna. Sed congue ante aliquet magna tempor laoreet. Mauris vel nisl porta, venenatis quam id, consequat est. Praesent vulputate et ipsum a posuere. Vestibulum arcu magna, iaculis sit amet pharetra sodales, aliquet vitae elit. Aenean nec mi urna. Etiam sit amet laoreet quam. Aenean a risus quis diam consectetur volutpat. Nulla facilisi. Proin tempor accumsan risus, vitae vulputate diam aliquet a.</p><p>Quisque accumsan luctus elit vel tempus. Mauris at justo vestibulum, feugiat ipsum sit amet, sollicitudin nisl. Aliquam at tincidunt nunc. Vivamus quis lacinia leo, quis ornare justo. Proin elit nunc, mattis at fermentum a, rutrum eget turpis. Aenean posuere arcu vel ipsum eleifend, sed pharetra risus placerat. Donec sem sapien, mattis ut convallis eget, tincidunt a lacus. Pellentesque vel lectus eros. Vestibulum finibus fringilla ipsum vitae vehicula. Nulla aliquam eleifend bibendum. Donec vitae lacinia odio, a consequat velit. Morbi volutpat condimentum justo, nec tempor dui venenatis ac. Maecenas porttitor enim vel urna condimentum dignissim.</p><p>Suspendisse interdum mauris et ligula aliquet, at gravida nulla maximus. Sed augue arcu, interdum sit amet consectetur non, faucibus vel magna. Quisque ac ex justo. Praesent scelerisque nibh nec lacinia pulvinar. Nullam nisl est, consequat ut dolor at, placerat venenatis risus. Donec aliquet pulvinar ex, nec hendrerit justo pulvinar varius. Pellentesque eget mauris eu purus accumsan cursus eget vel lorem.</p><p>Morbi sed dolor malesuada justo iaculis varius. Donec maximus tempus scelerisque. Mauris in lacus varius, tristique lacus vel, ornare justo. Donec tincidunt, purus sed feugiat fringilla, massa purus suscipit purus, vitae blandit augue sem ut sapien. Nulla at lorem volutpat, rutrum lacus ut, bibendum ex. Interdum et malesuada fames ac ante ipsum primis in faucibus. Duis sagittis mi ut lacus tincidunt, varius venenatis diam congue. Nam blandit orci a nisi porttitor, eget euismod nulla varius. Sed venenatis arcu in scelerisque laoreet. Nam vitae placerat nunc. Phasellus rhoncus erat ut maximus maximus. Curabitur quis consectetur quam.</p><p>Aliquam tincidunt lectus in elit laoreet, ac pretium eros porttitor. Sed et mauris tincidunt, maximus ante sit amet, tristique erat. Maecenas non consectetur nibh, a tempus ipsum. Pellentesque quis nunc non nisi gravida fringilla sed ut quam. Praesent malesuada velit et pharetra placerat. Nam metus diam, vulputate ut venenatis sit amet, consectetur vitae enim. Mauris sed neque luctus, interdum lectus vitae, placerat ante. Vivamus sed ullamcorper tellus. Sed viverra felis metus, quis efficitur dui fermentum in. Pellentesque sed elit vel erat gravida vestibulum vestibulum eget lacus.</p><p>Etiam sed imperdiet tortor. Fusce porta quam lectus, vitae porta metus placerat vel. Vivamus quis porttitor dolor. Aenean sodales turpis ac nulla dictum, laoreet fermentum arcu hendrerit. Class aptent taciti sociosqu ad litora torquent per conubia nostra, per inceptos himenaeos. Sed pharetra elit quis sem blandit, eu ornare sem mollis. Phasellus eu bibendum est, ac cursus dui. Aenean vel dictum dolor, in condimentum turpis. In hac habitasse platea dictumst. Interdum et malesuada fames ac ante ipsum primis in faucibus. Sed aliquam scelerisque eros non congue. Nullam posuere urna ac diam iaculis varius.</p>',
-        image='test2.jpg'
-    ).dict(by_alias=True),
-    Blog(
-        title='Test Naslov 3',
-        kategorija='angular',
-        podnaslov='Test Podnaslov 3',
-        author='Danilo Jezernik',
-        datum_vnosa=datetime.datetime.now(),
-        vsebina='<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. Etiam dictum pellentesque ornare. Integer pulvinar, diam sed consequat pulvinar, justo tortor cursus metus, gravida tincidunt orci sapien vitae orci. Integer id facilisis erat, ac commodo urna. Sed congue ante aliquet magna tempor laoreet. Mauris vel nisl porta, venenatis quam id, consequat est. Praesent vulputate et ipsum a posuere. Vestibulum arcu magna, iaculis sit amet pharetra sodales, aliquet vitae elit. Aenean nec mi urna. Etiam sit amet laoreet quam. Aenean a risus quis diam consectetur volutpat. Nulla facilisi. Proin tempor accumsan risus, vitae vulputate diam aliquet a.</p><p>Quisque accumsan luctus elit vel tempus. Mauris at justo vestibulum, feugiat ipsum sit amet, sollicitudin nisl. Aliquam at tincidunt nunc. Vivamus quis lacinia leo, quis ornare justo. Proin elit nunc, mattis at fermentum a, rutrum eget turpis. Aenean posuere arcu vel ipsum eleifend, sed pharetra risus placerat. Donec sem sapien, mattis ut convallis eget, tincidunt a lacus. Pellentesque vel lectus eros. Vestibulum finibus fringilla ipsum vitae vehicula. Nulla aliquam eleifend bibendum. Donec vitae lacinia odio, a consequat velit. Morbi volutpat condimentum justo, nec tempor dui venenatis ac. Maecenas porttitor enim vel urna condimentum dignissim.</p><p>Suspendisse interdum mauris et ligula aliquet, at gravida nulla maximus. Sed augue arcu, interdum sit amet consectetur non, faucibus vel magna. Quisque ac ex justo. Praesent scelerisque nibh nec lacinia pulvinar. Nullam nisl est, consequat ut dolor at, placerat venenatis risus. Donec aliquet pulvinar ex, nec hendrerit justo pulvinar varius. Pellentesque eget mauris eu purus accumsan cursus eget vel lorem.</p><p>Morbi sed dolor malesuada justo iaculis varius. Donec maximus tempus scelerisque. Mauris in lacus varius, tristique lacus vel, ornare justo. Donec tincidunt, purus sed feugiat fringilla, massa purus suscipit purus, vitae blandit augue sem ut sapien. Nulla at lorem volutpat, rutrum lacus ut, bibendum ex. Interdum et malesuada fames ac ante ipsum primis in faucibus. Duis sagittis mi ut lacus tincidunt, varius venenatis diam congue. Nam blandit orci a nisi porttitor, eget euismod nulla varius. Sed venenatis arcu in scelerisque laoreet. Nam vitae placerat nunc. Phasellus rhoncus erat ut maximus maximus. Curabitur quis consectetur quam.</p><p>Aliquam tincidunt lectus in elit laoreet, ac pretium eros porttitor. Sed et mauris tincidunt, maximus ante sit amet, tristique erat. Maecenas non consectetur nibh, a tempus ipsum. Pellentesque quis nunc non nisi gravida fringilla sed ut quam. Praesent malesuada velit et pharetra placerat. Nam metus diam, vulputate ut venenatis sit amet, consectetur vitae enim. Mauris sed neque luctus, interdum lectus vitae, placerat ante. Vivamus sed ullamcorper tellus. Sed viverra felis metus, quis efficitur dui fermentum in. Pellentesque sed elit vel erat gravida vestibulum vestibulum eget lacus.</p><p>Etiam sed imperdiet tortor. Fusce porta quam lectus, vitae porta metus placerat vel. Vivamus quis porttitor dolor. Aenean sodales turpis ac nulla dictum, laoreet fermentum arcu hendrerit. Class aptent taciti sociosqu ad litora torquent per conubia nostra, per inceptos himenaeos. Sed pharetra elit quis sem blandit, eu ornare sem mollis. Phasellus eu bibendum est, ac cursus dui. Aenean vel dictum dolor, in condimentum turpis. In hac habitasse platea dictumst. Interdum et malesuada fames ac ante ipsum primis in faucibus. Sed aliquam scelerisque eros non congue. Nullam posuere urna ac diam iaculis varius.</p>',
-        image='test3.jpg'
-    ).dict(by_alias=True),
-]
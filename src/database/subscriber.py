@@ -10,12 +10,12 @@ subscriber = [
         email=env.EMAIL_1,
         confirmed=False,
         datum_vnosa=datetime.datetime.now()
-    ).dict(by_alias=True),
+    ).model_dump(by_alias=True),
     Subscriber(
         name='Dani',
         surname='Jez',
         email=env.EMAIL_2,
         confirmed=False,
         datum_vnosa=datetime.datetime.now()
-    ).dict(by_alias=True)
+    ).model_dump(by_alias=True)
 ]
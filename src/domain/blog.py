@@ -4,9 +4,11 @@ from typing import Optional
 from bson import ObjectId
 from pydantic import BaseModel, Field
 
+from src.domain.object_id import PyObjectId
+
 
 class Blog(BaseModel):
-    id: Optional[str] = Field(alias='_id', default_factory=lambda: str(ObjectId()))
+    id: Optional[PyObjectId] = Field(alias='_id', default_factory=ObjectId)
     title: str
     kategorija: str
     podnaslov: str
@@ -3,18 +3,20 @@ import datetime
 from pydantic import BaseModel, Field
 from bson import ObjectId
 
+from src.domain.object_id import PyObjectId
+
 class User(BaseModel):
     name: str
     profile_image: str
-    website_url: Optional[str]  # This might be null, so it's optional
+    website_url: Optional[str] = None  # This might be null, so it's optional
 
 class DevAritcle(BaseModel):
-    id: Optional[str] = Field(alias='_id', default_factory=lambda: str(ObjectId()))
+    id: Optional[PyObjectId] = Field(alias='_id', default_factory=ObjectId)
     type_of: str
     title: str
     description: str
     url: str
-    cover_image: Optional[str]
+    cover_image: Optional[str] = None
     published_at: datetime.datetime
     tag_list: List[str]
     user: User
@@ -5,9 +5,11 @@ from typing import List, Optional
 from bson import ObjectId
 from pydantic import BaseModel, Field
 
+from src.domain.object_id import PyObjectId
+
 
 class LanguageData(BaseModel):
-    id: Optional[str] = Field(alias='_id', default_factory=lambda: str(ObjectId()))
+    id: Optional[PyObjectId] = Field(alias='_id', default_factory=ObjectId)
     tag: str
     count: int
     last_updated: datetime.datetime = Field(default_factory=datetime.datetime.now)
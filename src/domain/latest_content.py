@@ -0,0 +1,19 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from src.domain.article import Article
+from src.domain.language import Language
+
+
+class LatestArticle(Article):
+    technology: str
+
+
+class LatestQA(Language):
+    technology: str
+
+
+class LatestContent(BaseModel):
+    articles: List[LatestArticle] = []
+    qa: List[LatestQA] = []
@@ -0,0 +1,47 @@
+"""
+The `_id` type of the domain models: a native MongoDB ObjectId in the database, a 24-character hex string in JSON.
+
+Documents are stored with ObjectId keys (12 bytes in the `_id` index instead of a 24-character string) and read back
+without conversion; validation only checks the type. At the API edge ids are serialized as their hex string, and
+hex strings (path parameters, request bodies) are validated into ObjectIds.
+
+Existing collections with string ids are converted by `src.services.id_migration`.
+
+Functions:
+- object_id: Converts an id from a URL or a client to the value stored in `_id`.
+"""
+
+from typing import Annotated
+
+from bson import ObjectId
+from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
+
+
+def _validate(value) -> ObjectId:
+    if isinstance(value, ObjectId):
+        return value
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    raise ValueError('must be a 24-character hex ObjectId')
+
+
+def _serialize(value: ObjectId) -> str:
+    return str(value)
+
+
+PyObjectId = Annotated[
+    ObjectId,
+    PlainValidator(_validate),
+    PlainSerializer(_serialize, when_used='json'),
+    WithJsonSchema({'type': 'string', 'pattern': '^[0-9a-fA-F]{24}$'}),
+]
+
+
+def object_id(_id: str | ObjectId) -> ObjectId | str:
+    """
+    Returns the ObjectId of a hex id, so it can be used in a `_id` query. Values that aren't a valid ObjectId are
+    returned unchanged: they match no document instead of failing the request.
+    """
+    if isinstance(_id, str) and ObjectId.is_valid(_id):
+        return ObjectId(_id)
+    return _id
@@ -0,0 +1,22 @@
+import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SearchHit(BaseModel):
+    id: str = Field(alias='_id')
+    kind: str
+    technology: Optional[str] = None
+    title: str
+    snippet: str
+    score: float
+    datum_vnosa: Optional[datetime.datetime] = None
+
+
+class SearchResponse(BaseModel):
+    query: str
+    page: int
+    page_size: int
+    total: int
+    results: List[SearchHit]
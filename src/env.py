@@ -5,6 +5,10 @@ from dotenv import load_dotenv
 load_dotenv()
 PORT = int(os.getenv('PORT'))
 
+# uvicorn bind address and number of worker processes of `python -m src serve`
+HOST = os.getenv('HOST') or '127.0.0.1'
+WORKERS = int(os.getenv('WORKERS') or 1)
+
 # Environment setting
 ENV = os.getenv('ENV', 'production')
 
@@ -13,6 +17,34 @@ DB_MAIN = str(os.getenv('DB_MAIN'))
 DB_DEV = str(os.getenv('DB_DEV', 'mongodb://localhost:27017'))
 DB_PROCESS = str(os.getenv('DB_PROCESS'))
 
+# Database of the test suite: 'mongod' (a per-worker database on DB_DEV / DB_MAIN) or 'mongomock' (in memory)
+TEST_DB_BACKEND = os.getenv('TEST_DB_BACKEND') or 'mongod'
+
+# Article/QA storage layout: 'collections' (one collection per technology) or 'unified' (single articles/qa collections)
+CONTENT_STORAGE = os.getenv('CONTENT_STORAGE') or 'collections'
+
+# Number of documents per cursor batch / chunk when list routes are streamed (?stream=true)
+STREAM_BATCH_SIZE = int(os.getenv('STREAM_BATCH_SIZE') or 500)
+
+# Seconds a cached response is kept at most; writes through the API invalidate it earlier
+CACHE_TTL = int(os.getenv('CACHE_TTL') or 300)
+
+# Responses smaller than this many bytes are sent uncompressed (gzip / brotli)
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE') or 1024)
+
+# Search backend: 'mongo' (MongoDB text indexes) or 'memory' (in-process BM25 inverted index)
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND') or 'mongo'
+
+# MongoDB commands taking at least this many milliseconds are kept in the slow-query log (/admin/queries/slow)
+SLOW_QUERY_MS = int(os.getenv('SLOW_QUERY_MS') or 100)
+
+# Number of slow commands kept in the slow-query log; the oldest are dropped first
+SLOW_QUERY_LOG_SIZE = int(os.getenv('SLOW_QUERY_LOG_SIZE') or 200)
+
+# Logging: minimum level and output format ('json' lines or plain 'text')
+LOG_LEVEL = os.getenv('LOG_LEVEL') or 'INFO'
+LOG_FORMAT = os.getenv('LOG_FORMAT') or 'json'
+
 # Fast API security
 ALGORITHM = str(os.getenv('ALGORITHM'))
 SECRET_KEY = str(os.getenv('SECRET_KEY'))
@@ -27,9 +59,13 @@ PASSWORD_LOGIN = str(os.getenv('PASSWORD_LOGIN'))
 OPENAI_API_KEY = str(os.getenv('OPENAI_API_KEY'))
 STACK_URL = str(os.getenv('STACK_URL'))
 
+# dev.to API base URL (overridden by the load-test harness to point at a local stub)
+DEV_TO_API_URL = os.getenv('DEV_TO_API_URL') or 'https://dev.to/api'
+
 # GitHub
 GITHUB = str(os.getenv('GITHUB'))
 GITHUB_TOKEN = str(os.getenv('GITHUB_TOKEN'))
+GITHUB_API_URL = os.getenv('GITHUB_API_URL') or 'https://api.github.com'
 
 # Newsletter
 DOMAIN = str(os.getenv('DOMAIN'))
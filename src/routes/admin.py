@@ -1,10 +1,17 @@
 """
 Route is used to get to the admin page where all the settings are
+
+Routes:
+- POST /: Checks that the user is logged in
+- GET /queries/slow: Slow MongoDB commands (newest first) with their filter shape and whether they used a COLLSCAN
+- GET /queries/stats: Latency totals per collection and command
+- GET /jobs: Scheduled background jobs with their next run time, recent runs and lease holder
 """
 
 from fastapi import APIRouter, Depends
 
 from src.domain.user import User
+from src.services import jobs, leases, query_log
 from src.services.security import get_current_user
 
 router = APIRouter()
@@ -14,3 +21,21 @@ router = APIRouter()
 @router.post("/")
 async def post(current_user: User = Depends(get_current_user)):
     return {'msg': 'Ste vpisani!'}
+
+
+# Slow-query log
+@router.get("/queries/slow")
+async def get_slow_queries(current_user: User = Depends(get_current_user)) -> list[dict]:
+    return query_log.slow_queries()
+
+
+# Latency per collection and command
+@router.get("/queries/stats")
+async def get_query_stats(current_user: User = Depends(get_current_user)) -> list[dict]:
+    return query_log.command_stats()
+
+
+# Background jobs: schedule, run history and which worker holds the job's lease
+@router.get("/jobs")
+async def get_jobs(current_user: User = Depends(get_current_user)) -> list[dict]:
+    return [{**job, 'lease': leases.holder(job['id'])} for job in jobs.job_status()]
@@ -18,18 +18,21 @@ from fastapi import APIRouter, Depends
 from src.domain.user import User
 from src.domain.article import Article
 from src.services.security import get_current_user
-from src.utils.router_helpers import all_data, data_by_id, limited_data, add_data, edit_data, delete_data
+from src.utils.router_helpers import all_data, cached_all_data, stream_data, data_by_id, limited_data, add_data, \
+    edit_data, delete_data
 
 router = APIRouter()
 
 # Public Routes
 
 @router.get('/', operation_id='get_all_angular_public')
-async def get_all_angular_public_article() -> list[Article]:
+async def get_all_angular_public_article(stream: bool = False) -> list[Article]:
     """
     Retrieve all Angular records from the database.
     """
-    return all_data('angular_articles', Article)
+    if stream:
+        return stream_data('angular_articles', Article)
+    return cached_all_data('angular_articles', Article)
 
 
 @router.get('/{_id}', operation_id='get_angular_by_id_public')
@@ -51,10 +54,12 @@ async def get_limited_angular_article(limit: int = 4) -> list[Article]:
 # Private Routes (Require authentication)
 
 @router.get('/admin/', operation_id='get_all_angular_private')
-async def get_all_angular_private_article(current_user: User = Depends(get_current_user)) -> list[Article]:
+async def get_all_angular_private_article(stream: bool = False, current_user: User = Depends(get_current_user)) -> list[Article]:
     """
     Retrieve all Angular records from the database for authenticated users.
     """
+    if stream:
+        return stream_data('angular_articles', Article)
     return all_data('angular_articles', Article)
 
 
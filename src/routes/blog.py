@@ -17,7 +17,8 @@ Private Routes (Require authentication):
 from fastapi import APIRouter, Depends
 from src.domain.blog import Blog
 from src.domain.user import User
-from src.utils.router_helpers import all_data, data_by_id, limited_data, add_data, edit_data, delete_data
+from src.utils.router_helpers import all_data, cached_all_data, stream_data, data_by_id, limited_data, add_data, \
+    edit_data, delete_data
 from src.services.security import get_current_user
 
 router = APIRouter()
@@ -26,11 +27,13 @@ router = APIRouter()
 # Public Routes
 
 @router.get('/', operation_id='get_all_blogs_public')
-async def get_all_blogs_public():
+async def get_all_blogs_public(stream: bool = False):
     """
     Retrieves all blogs from the database.
     """
-    return all_data('blog', Blog)
+    if stream:
+        return stream_data('blog', Blog)
+    return cached_all_data('blog', Blog)
 
 
 @router.get('/{_id}', operation_id='get_blog_by_id_public')
@@ -52,10 +55,12 @@ async def get_limited_blogs(limit: int = 4) -> list[Blog]:
 # Private Routes (Require authentication)
 
 @router.get('/admin/', operation_id='get_all_blogs_private')
-async def get_all_blogs_private(current_user: str = Depends(get_current_user)) -> list[Blog]:
+async def get_all_blogs_private(stream: bool = False, current_user: str = Depends(get_current_user)) -> list[Blog]:
     """
     Retrieves all blogs from the database for authenticated users.
     """
+    if stream:
+        return stream_data('blog', Blog)
     return all_data('blog', Blog)
 
 
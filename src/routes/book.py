@@ -17,7 +17,7 @@ from fastapi import APIRouter, Depends
 from src.domain.book import Book
 from src.domain.user import User
 from src.services.security import get_current_user
-from src.utils.router_helpers import all_data, data_by_id, add_data, edit_data, delete_data
+from src.utils.router_helpers import all_data, cached_all_data, data_by_id, add_data, edit_data, delete_data
 
 router = APIRouter()
 
@@ -28,7 +28,7 @@ async def get_all_book_public() -> list[Book]:
     """
     Retrieve all books from the database.
     """
-    return all_data('book', Book)
+    return cached_all_data('book', Book)
 
 
 @router.get('/{_id}', operation_id='get_book_by_id_public')
@@ -9,7 +9,7 @@ Routes Overview:
 from fastapi import APIRouter, HTTPException
 
 from src.domain.contact import Contact
-from src.services import db, emails
+from src.services import db, emails, stats
 from src.template import email_template
 
 router = APIRouter()
@@ -54,4 +54,5 @@ async def client_sent_email_public(emailing: Contact):
         "datum_vnosa": emailing.datum_vnosa
     }
     db.process.email.insert_one(email_data)
+    stats.count_message()
     return {"message": "Message was sent"}
@@ -0,0 +1,26 @@
+"""
+Content Routes:
+
+Public Routes:
+1. GET /latest/ - Retrieve the newest articles and QA across all technologies in one request.
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter, Query
+
+from src.domain.latest_content import LatestContent
+from src.services.latest_content import LATEST_CONTENT_MAX, latest_content
+
+router = APIRouter()
+
+
+@router.get('/latest/', operation_id='get_latest_content')
+async def get_latest_content(
+        limit: int = Query(4, ge=1, le=LATEST_CONTENT_MAX),
+        kind: Literal['article', 'qa'] | None = None,
+) -> LatestContent:
+    """
+    Retrieve the `limit` newest articles and QA (or only one kind) across all technologies, newest first.
+    """
+    return latest_content(limit, kind)
@@ -17,7 +17,7 @@ from fastapi import APIRouter, Depends
 from src.domain.experiences import Experiences
 from src.domain.user import User
 from src.services.security import get_current_user
-from src.utils.router_helpers import all_data, data_by_id, add_data, edit_data, delete_data
+from src.utils.router_helpers import all_data, cached_all_data, data_by_id, add_data, edit_data, delete_data
 
 router = APIRouter()
 
@@ -29,7 +29,7 @@ async def get_all_experiences_public() -> list[Experiences]:
     """
     Retrieve all experiences from the database.
     """
-    return all_data('experiences', Experiences)
+    return cached_all_data('experiences', Experiences)
 
 
 @router.get('/{_id}', operation_id='get_experiences_by_id_public')
@@ -1,9 +1,9 @@
 # Import necessary modules and libraries
-import httpx  # Library for making HTTP requests
 from fastapi import APIRouter, HTTPException   # Importing APIRouter from FastAPI framework
 
 # Importing environment variables from src folder
 from src import env
+from src.services import http_client
 
 # Creating an instance of APIRouter
 router = APIRouter()
@@ -26,30 +26,30 @@ async def get_repo():
         'Authorization': f'token {env.GITHUB_TOKEN}'
     }
 
-    async with httpx.AsyncClient() as client:
-        while True:
-            url = f"https://api.github.com/users/{env.GITHUB}/repos?per_page={per_page}&page={page}"
-            response = await client.get(url, headers=headers)
+    client = http_client.get_client()  # Shared client, keeps the connection to GitHub alive
+    while True:
+        url = f"{env.GITHUB_API_URL}/users/{env.GITHUB}/repos?per_page={per_page}&page={page}"
+        response = await client.get(url, headers=headers)
 
-            # Check if the response status code is not 200 (OK)
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail=f"Error fetching repositories: {response.text}")
+        # Check if the response status code is not 200 (OK)
+        if response.status_code != 200:
+            raise HTTPException(status_code=response.status_code, detail=f"Error fetching repositories: {response.text}")
 
-            try:
-                page_repos = response.json()
-            except ValueError:
-                raise HTTPException(status_code=500, detail="Invalid JSON response from GitHub API")
+        try:
+            page_repos = response.json()
+        except ValueError:
+            raise HTTPException(status_code=500, detail="Invalid JSON response from GitHub API")
 
-            # Check if the response contains repositories
-            if not page_repos:
-                break  # Exit the loop if there are no more repositories
+        # Check if the response contains repositories
+        if not page_repos:
+            break  # Exit the loop if there are no more repositories
 
-            # Filter public repositories and add them to the list
-            public_repos = [repo for repo in page_repos if not repo.get('private')]
-            repos.extend(public_repos)
+        # Filter public repositories and add them to the list
+        public_repos = [repo for repo in page_repos if not repo.get('private')]
+        repos.extend(public_repos)
 
-            # Increment page number for the next set of repositories
-            page += 1
+        # Increment page number for the next set of repositories
+        page += 1
 
     # Returning the fetched repositories as a dictionary
     return {'repos': repos}
\ No newline at end of file
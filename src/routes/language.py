@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import APIRouter, Depends
 from datetime import datetime, timedelta
 
@@ -6,9 +8,12 @@ from src.domain.user import User
 from src.language_groups.languages_of_interests import LANGUAGES_OF_INTEREST, FRAMEWORKS_FRONTEND, FRAMEWORKS_BACKEND, \
     MOBILE_DEVELOPMENT, DATABASE_AND_DATA_MANAGEMENT, CLOUD_AND_DEVOPS, UI_UX_AND_DESIGN, TESTING_AND_AUTOMATION, \
     VERSION_CONTROL_AND_COLLABORATION, OPERATING_SYSTEMS_AND_PLATFORMS, TOOLS_AND_IDES
-from src.services import db
+from src.services import db, leases
 from src.services.language_manager import update_tags_in_db, start_scheduler
 from src.services.security import get_current_user
+from src.utils.router_helpers import stream_data
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -36,8 +41,12 @@ async def get_tags():
         tags = list(db.process.language_data.find({}, {"_id": 0, "tag": 1, "count": 1}))
         return tags
     else:
-        # If the data is stale (older than 24 hours), trigger an update from the external API
-        await update_tags_in_db()
+        # If the data is stale (older than 24 hours), trigger an update from the external API;
+        # if it fails, the stale tags are returned
+        try:
+            await update_tags_in_db(owner=leases.call_owner())
+        except Exception as e:
+            logger.error('Error updating tags: %s', e)
 
         # After updating, fetch the newly updated tags from the database
         tags = list(db.process.language_data.find({}, {"_id": 0, "tag": 1, "count": 1}))
@@ -46,13 +55,16 @@ async def get_tags():
 
 # This route is for fetching all the tags, without any update logic
 @router.get('/', operation_id='get_tags_preview')
-async def get_language_tags_preview(current_user: User = Depends(get_current_user)):
+async def get_language_tags_preview(stream: bool = False, current_user: User = Depends(get_current_user)):
     """
     Fetches a preview of all language tags from the database.
 
     Returns:
         - A list of LanguageData objects, each representing a programming language tag and its count.
     """
+    if stream:
+        return stream_data('language_data', LanguageData)
+
     # Fetch all documents (language tags) from the database
     cursor = db.process.language_data.find()
 
@@ -66,22 +78,25 @@ async def startup_event():
     """
     Event handler for application startup.
 
-    Starts the background scheduler that updates the Stack Overflow tags every 24 hours.
+    Schedules the Stack Overflow tag update every 24 hours on the app's event loop.
     This ensures that the data in the database stays up-to-date without requiring manual triggers.
     """
-    # Start the background scheduler to trigger the update process every 24 hours
+    # Schedule the update process every 24 hours
     start_scheduler()
 
 
 # Route to fetch tags that belong to the list of programming languages of interest
 @router.get('/programming-languages', operation_id='get_languages_of_interest')
-async def get_languages_of_interest():
+async def get_languages_of_interest(stream: bool = False):
     """
     Fetches tags related to programming languages of interest from the database.
 
     Returns:
         - A list of LanguageData objects containing only the relevant programming languages.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": LANGUAGES_OF_INTEREST}})
+
     # Query the database to find all documents (tags) where the 'tag' is in the LANGUAGES_OF_INTEREST list
     cursor = db.process.language_data.find({"tag": {"$in": LANGUAGES_OF_INTEREST}})
 
@@ -91,13 +106,16 @@ async def get_languages_of_interest():
 
 # Route to fetch frontend frameworks from the database
 @router.get('/frameworks-frontend', operation_id='get_frameworks_frontend')
-async def get_frameworks_frontend():
+async def get_frameworks_frontend(stream: bool = False):
     """
     Fetches tags related to frontend frameworks from the database.
 
     Returns:
         - A list of LanguageData objects containing only frontend frameworks.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": FRAMEWORKS_FRONTEND}})
+
     # Query the database to find all documents where the 'tag' is in the FRAMEWORKS_FRONTEND list
     cursor = db.process.language_data.find({"tag": {"$in": FRAMEWORKS_FRONTEND}})
 
@@ -107,13 +125,16 @@ async def get_frameworks_frontend():
 
 # Route to fetch backend frameworks from the database
 @router.get('/frameworks-backend', operation_id='get_frameworks_backend')
-async def get_frameworks_backend():
+async def get_frameworks_backend(stream: bool = False):
     """
     Fetches tags related to backend frameworks from the database.
 
     Returns:
         - A list of LanguageData objects containing only backend frameworks.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": FRAMEWORKS_BACKEND}})
+
     # Query the database to find all documents where the 'tag' is in the FRAMEWORKS_BACKEND list
     cursor = db.process.language_data.find({"tag": {"$in": FRAMEWORKS_BACKEND}})
 
@@ -123,13 +144,16 @@ async def get_frameworks_backend():
 
 # Route to fetch tags related to mobile development
 @router.get('/mobile-development', operation_id='get_mobile_dev')
-async def get_mobile_dev():
+async def get_mobile_dev(stream: bool = False):
     """
     Fetches tags related to mobile development technologies from the database.
 
     Returns:
         - A list of LanguageData objects containing only mobile development tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": MOBILE_DEVELOPMENT}})
+
     # Query the database to find all documents where the 'tag' is in the MOBILE_DEVELOPMENT list
     cursor = db.process.language_data.find({"tag": {"$in": MOBILE_DEVELOPMENT}})
 
@@ -139,13 +163,16 @@ async def get_mobile_dev():
 
 # Route to fetch tags related to databases and data management
 @router.get('/database-management', operation_id='get_database')
-async def get_database():
+async def get_database(stream: bool = False):
     """
     Fetches tags related to databases and data management technologies from the database.
 
     Returns:
         - A list of LanguageData objects containing only database-related tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": DATABASE_AND_DATA_MANAGEMENT}})
+
     # Query the database to find all documents where the 'tag' is in the DATABASE_AND_DATA_MANAGEMENT list
     cursor = db.process.language_data.find({"tag": {"$in": DATABASE_AND_DATA_MANAGEMENT}})
 
@@ -155,13 +182,16 @@ async def get_database():
 
 # Route to fetch tags related to cloud and DevOps technologies
 @router.get('/devops', operation_id='get_devops')
-async def get_devops():
+async def get_devops(stream: bool = False):
     """
     Fetches tags related to cloud and DevOps technologies from the database.
 
     Returns:
         - A list of LanguageData objects containing only cloud and DevOps-related tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": CLOUD_AND_DEVOPS}})
+
     # Query the database to find all documents where the 'tag' is in the CLOUD_AND_DEVOPS list
     cursor = db.process.language_data.find({"tag": {"$in": CLOUD_AND_DEVOPS}})
 
@@ -171,13 +201,16 @@ async def get_devops():
 
 # Route to fetch tags related to UI/UX and design technologies
 @router.get('/ui-ux-design', operation_id='get_ui_ux_design')
-async def get_ui_ux_design():
+async def get_ui_ux_design(stream: bool = False):
     """
     Fetches tags related to UI/UX design technologies from the database.
 
     Returns:
         - A list of LanguageData objects containing only UI/UX design-related tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": UI_UX_AND_DESIGN}})
+
     # Query the database to find all documents where the 'tag' is in the UI_UX_AND_DESIGN list
     cursor = db.process.language_data.find({"tag": {"$in": UI_UX_AND_DESIGN}})
 
@@ -187,13 +220,16 @@ async def get_ui_ux_design():
 
 # Route to fetch tags related to testing and automation technologies
 @router.get('/testing', operation_id='get_testing')
-async def get_testing():
+async def get_testing(stream: bool = False):
     """
     Fetches tags related to testing and automation technologies from the database.
 
     Returns:
         - A list of LanguageData objects containing only testing and automation-related tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": TESTING_AND_AUTOMATION}})
+
     # Query the database to find all documents where the 'tag' is in the TESTING_AND_AUTOMATION list
     cursor = db.process.language_data.find({"tag": {"$in": TESTING_AND_AUTOMATION}})
 
@@ -203,13 +239,16 @@ async def get_testing():
 
 # Route to fetch tags related to version control and collaboration tools
 @router.get('/version-control', operation_id='get_version_control')
-async def get_version_control():
+async def get_version_control(stream: bool = False):
     """
     Fetches tags related to version control and collaboration tools from the database.
 
     Returns:
         - A list of LanguageData objects containing only version control and collaboration-related tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": VERSION_CONTROL_AND_COLLABORATION}})
+
     # Query the database to find all documents where the 'tag' is in the VERSION_CONTROL_AND_COLLABORATION list
     cursor = db.process.language_data.find({"tag": {"$in": VERSION_CONTROL_AND_COLLABORATION}})
 
@@ -219,13 +258,16 @@ async def get_version_control():
 
 # Route to fetch tags related to operating systems and platforms
 @router.get('/operating-system', operation_id='get_operating_system')
-async def get_operating_system():
+async def get_operating_system(stream: bool = False):
     """
     Fetches tags related to operating systems and platforms from the database.
 
     Returns:
         - A list of LanguageData objects containing only operating systems and platforms-related tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": OPERATING_SYSTEMS_AND_PLATFORMS}})
+
     # Query the database to find all documents where the 'tag' is in the OPERATING_SYSTEMS_AND_PLATFORMS list
     cursor = db.process.language_data.find({"tag": {"$in": OPERATING_SYSTEMS_AND_PLATFORMS}})
 
@@ -235,13 +277,16 @@ async def get_operating_system():
 
 # Route to fetch tags related to development tools and IDEs
 @router.get('/ides', operation_id='get_ides')
-async def get_ides():
+async def get_ides(stream: bool = False):
     """
     Fetches tags related to development tools and IDEs from the database.
 
     Returns:
         - A list of LanguageData objects containing only development tools and IDE-related tags.
     """
+    if stream:
+        return stream_data('language_data', LanguageData, {"tag": {"$in": TOOLS_AND_IDES}})
+
     # Query the database to find all documents where the 'tag' is in the TOOLS_AND_IDES list
     cursor = db.process.language_data.find({"tag": {"$in": TOOLS_AND_IDES}})
 
@@ -17,7 +17,7 @@ from fastapi import APIRouter, Depends
 from src.domain.links import Links
 from src.domain.user import User
 from src.services.security import get_current_user
-from src.utils.router_helpers import all_data, data_by_id, add_data, edit_data, delete_data
+from src.utils.router_helpers import all_data, cached_all_data, data_by_id, add_data, edit_data, delete_data
 
 router = APIRouter()
 
@@ -28,7 +28,7 @@ async def get_all_links_public() -> list[Links]:
     """
     Retrieves all links from the database.
     """
-    return all_data('links', Links)
+    return cached_all_data('links', Links)
 
 
 @router.get('/{_id}', operation_id='get_link_by_id')
@@ -3,6 +3,7 @@ Routes Overview:
 1. POST / - User authentication route to get an access token.
 """
 
+import logging
 from datetime import timedelta
 from typing import Annotated
 
@@ -14,6 +15,7 @@ from src.services.security import authenticate_user, create_access_token
 
 # Create a new APIRouter instance for this module
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 # Route for user authentication and getting an access token
@@ -32,8 +34,8 @@ async def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm,
 
     # Authenticate the user using the provided username and password
     user = authenticate_user(form_data.username, form_data.password)
-    print(f"User authenticated: {user}")
     if not user:
+        logger.info('Failed login', extra={'username': form_data.username})
         # Raise an exception if the authentication fails
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -41,6 +43,8 @@ async def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm,
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    logger.info('User authenticated', extra={'username': form_data.username})
+
     # Set the expiration time for the access token to 30 minutes
     access_token_expires = timedelta(minutes=30)
 
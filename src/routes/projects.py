@@ -17,7 +17,7 @@ from fastapi import APIRouter, Depends
 from src.domain.projects import Projects
 from src.domain.user import User
 from src.services.security import get_current_user
-from src.utils.router_helpers import all_data, data_by_id, add_data, edit_data, delete_data
+from src.utils.router_helpers import all_data, cached_all_data, data_by_id, add_data, edit_data, delete_data
 
 router = APIRouter()
 
@@ -29,7 +29,7 @@ async def get_all_projects_public() -> list[Projects]:
     """
     Retrieve all projects from the database.
     """
-    return all_data('projects', Projects)
+    return cached_all_data('projects', Projects)
 
 
 @router.get('/{_id}', operation_id='get_projects_by_id_public')
@@ -18,18 +18,21 @@ from fastapi import APIRouter, Depends, HTTPException
 from src.domain.language import Language
 from src.domain.user import User
 from src.services.security import get_current_user
-from src.utils.router_helpers import all_data, data_by_id, limited_data, add_data, edit_data, delete_data
+from src.utils.router_helpers import all_data, cached_all_data, stream_data, data_by_id, limited_data, add_data, \
+    edit_data, delete_data
 
 router = APIRouter()
 
 # Public Routes
 
 @router.get('/', operation_id='get_all_sql_public')
-async def get_all_sql_public() -> list[Language]:
+async def get_all_sql_public(stream: bool = False) -> list[Language]:
     """
     Retrieve all sql records from the database.
     """
-    return all_data('sql_qa', Language)
+    if stream:
+        return stream_data('sql_qa', Language)
+    return cached_all_data('sql_qa', Language)
 
 
 @router.get('/{_id}', operation_id='get_sql_by_id_public')
@@ -51,10 +54,12 @@ async def get_limited_sql(limit: int = 4) -> list[Language]:
 # Private Routes (Require authentication)
 
 @router.get('/admin/', operation_id='get_all_sql_private')
-async def get_all_sql_private(current_user: User = Depends(get_current_user)) -> list[Language]:
+async def get_all_sql_private(stream: bool = False, current_user: User = Depends(get_current_user)) -> list[Language]:
     """
     Retrieve all sql records from the database for authenticated users.
     """
+    if stream:
+        return stream_data('sql_qa', Language)
     return all_data('sql_qa', Language)
 
 
@@ -0,0 +1,54 @@
+"""
+Search Routes:
+
+Public Routes:
+1. GET /?q= - Full-text search across the blog and all article and QA collections with ranking, pagination and highlighted snippets.
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src import env
+from src.domain.search import SearchResponse
+from src.services import search, search_index
+from src.services.technologies import TECHNOLOGIES
+
+router = APIRouter()
+
+# Upper bound for `page`: the backends read `page * page_size` hits per collection to rank a page, so deep pages would
+# make every collection return and merge (nearly) its whole result set
+SEARCH_MAX_PAGE = 20
+
+
+@router.get('/', operation_id='search_content')
+async def search_content(
+        q: str = Query(..., min_length=2, max_length=200),
+        kind: Literal['article', 'qa', 'blog'] | None = None,
+        technology: str | None = None,
+        page: int = Query(1, ge=1, le=SEARCH_MAX_PAGE),
+        page_size: int = Query(10, ge=1, le=50),
+) -> SearchResponse:
+    """
+    Searches the blog and the articles and QA of every technology at once (or only the given kind / technology).
+
+    Hits are ranked by relevance (MongoDB textScore, or BM25 with `SEARCH_BACKEND=memory`); every hit contains a snippet of the matching text with the matches wrapped in <mark>.
+    """
+    if technology is not None and technology not in TECHNOLOGIES:
+        raise HTTPException(status_code=404, detail=f'Technology ({technology}) does not exist')
+
+    backend = search_index if env.SEARCH_BACKEND == 'memory' else search
+    return backend.search(q, kind=kind, technology=technology, page=page, page_size=page_size)
+
+
+# This function is called when the FastAPI app starts
+@router.on_event("startup")
+async def startup_event():
+    """
+    Prepares the configured search backend: builds the in-memory index, or makes sure every searchable
+    collection has its text index.
+    """
+    if env.SEARCH_BACKEND == 'memory':
+        search_index.build()
+    else:
+        search.ensure_text_indexes()
@@ -0,0 +1,28 @@
+"""
+Content counts for the admin dashboard, read from the pre-aggregated counters (see `src.services.stats`).
+
+Routes:
+- GET /: Articles and QA per technology, documents per content collection, subscribers and received messages
+- POST /rebuild: Recounts the counters from the collections
+"""
+
+from fastapi import APIRouter, Depends
+
+from src.domain.user import User
+from src.services import stats
+from src.services.security import get_current_user
+
+router = APIRouter()
+
+
+# Counts from the counters document: one document read instead of scanning the collections
+@router.get("/", operation_id="get_stats")
+async def get_stats(current_user: User = Depends(get_current_user)) -> dict:
+    return stats.counters()
+
+
+# Recount the counters, e.g. after documents were written without going through the API
+@router.post("/rebuild", operation_id="rebuild_stats")
+async def rebuild_stats(current_user: User = Depends(get_current_user)) -> dict:
+    stats.rebuild()
+    return stats.counters()
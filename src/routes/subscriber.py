@@ -11,13 +11,17 @@ Routes Overview:
 
 from datetime import timedelta
 
+import bson
+
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.responses import RedirectResponse
+from pymongo import ReturnDocument
 
 from src import env
+from src.domain.object_id import object_id
 from src.domain.subscriber import Subscriber
 from src.domain.user import User
-from src.services import db, security, emails
+from src.services import db, security, emails, stats
 from src.services.security import get_current_user
 
 router = APIRouter()
@@ -53,7 +57,7 @@ async def get_subscriber_id(_id: str, current_user: User = Depends(get_current_u
     """
 
     # Retrieve a blog by its ID from the database
-    cursor = db.process.subscriber.find_one({'_id': _id})
+    cursor = db.process.subscriber.find_one({'_id': object_id(_id)})
     if cursor is None:
         raise HTTPException(status_code=400, detail=f"Subscriber by ID:{_id} does not exist")
     else:
@@ -76,11 +80,12 @@ async def post_subscriber(subscriber: Subscriber, current_user: User = Depends(g
     """
 
     # Add a new blog to the database
-    subscriber_dict = subscriber.dict(by_alias=True)
+    subscriber_dict = subscriber.model_dump(by_alias=True)
     insert_result = db.process.subscriber.insert_one(subscriber_dict)
 
     # Check if the insertion was acknowledged and update the blog's ID
     if insert_result.acknowledged:
+        stats.count_subscriber(subscriber.confirmed)
         subscriber_dict['_id'] = str(insert_result.inserted_id)
         return Subscriber(**subscriber_dict)
     else:
@@ -105,21 +110,23 @@ async def edit_subscriber(_id: str, subscriber: Subscriber,
     """
 
     # Edit an existing subscriber by its ID in the database
-    subscriber = subscriber.dict(by_alias=True)
+    subscriber = subscriber.model_dump(by_alias=True)
     del subscriber['_id']
 
-    # Update the newsletter in the database
-    cursor = db.process.subscriber.update_one({'_id': _id}, {'$set': subscriber})
+    # Update the newsletter in the database; the previous document is returned by the same atomic update, so
+    # concurrent edits can't both see the old confirmation state and move the counters twice
+    previous = db.process.subscriber.find_one_and_update(
+        {'_id': object_id(_id)}, {'$set': subscriber}, return_document=ReturnDocument.BEFORE,
+    )
 
-    # Check if the newsletter was successfully updated
-    if cursor.modified_count > 0:
-        # Retrieve the updated newsletter from the database
-        updated_document = db.process.subscriber.find_one({'_id': _id})
+    # Check if the newsletter was found and changed by the update (compared as stored: BSON keeps milliseconds)
+    stored = bson.decode(bson.encode(subscriber))
+    if previous and any(previous.get(field) != value for field, value in stored.items()):
+        if previous.get('confirmed', False) != subscriber['confirmed']:
+            stats.move_subscriber(subscriber['confirmed'])
 
-        # Check if the updated newsletter exists
-        if updated_document:
-            updated_document['_id'] = str(updated_document['_id'])
-            return Subscriber(**updated_document)
+        updated_document = {**previous, **stored, '_id': str(previous['_id'])}
+        return Subscriber(**updated_document)
 
     # Return None if the newsletter was not updated
     return None
@@ -143,10 +150,11 @@ async def delete_subscriber(_id: str, current_user: User = Depends(get_current_u
     """
 
     # Attempt to delete the blog from the database
-    delete_result = db.process.subscriber.delete_one({'_id': _id})
+    deleted = db.process.subscriber.find_one_and_delete({'_id': object_id(_id)}, {'confirmed': 1})
 
     # Check if the blog was successfully deleted
-    if delete_result.deleted_count > 0:
+    if deleted is not None:
+        stats.count_subscriber(deleted.get('confirmed', False), -1)
         return {"message": "Subscriber deleted successfully"}
     else:
         # Raise an exception if the blog was not found for deletion
@@ -171,7 +179,7 @@ async def subscribe(subscriber: Subscriber):
     """
 
     # Create an access token with a short expiration time
-    token = security.create_access_token(data={'user_id': subscriber.id}, expires_delta=timedelta(minutes=10))
+    token = security.create_access_token(data={'user_id': str(subscriber.id)}, expires_delta=timedelta(minutes=10))
 
     # Generate the confirmation email's HTML content
     body = confirmation_newsletter_email.html(link=f'{env.DOMAIN}/subscribers/confirm/{token}', name=subscriber.name,
@@ -183,7 +191,8 @@ async def subscribe(subscriber: Subscriber):
         return HTTPException(status_code=500, detail="Email not sent")
 
     # Insert the subscriber's data into the database
-    db.process.subscriber.insert_one(subscriber.dict(by_alias=True))
+    db.process.subscriber.insert_one(subscriber.model_dump(by_alias=True))
+    stats.count_subscriber(subscriber.confirmed)
 
     return {"message": "Message was sent"}
 
@@ -206,7 +215,10 @@ async def confirm(token: str):
     # Extract the user_id from the confirmation token
     payload = await security.get_payload(token=token)
 
-    # Mark the subscriber as confirmed in the database
-    db.process.subscriber.update_one({"_id": payload['user_id']}, {"$set": {"confirmed": True}})
+    # Mark the subscriber as confirmed in the database (counted once, even if the link is opened again)
+    result = db.process.subscriber.update_one({"_id": object_id(payload['user_id']), "confirmed": {"$ne": True}},
+                                              {"$set": {"confirmed": True}})
+    if result.modified_count > 0:
+        stats.move_subscriber(True)
 
     return RedirectResponse(url=f'{env.DOMAIN}/index', status_code=status.HTTP_303_SEE_OTHER)
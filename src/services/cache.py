@@ -0,0 +1,80 @@
+"""
+Small in-process cache for computed responses, invalidated by the write helpers.
+
+Entries live in named namespaces. A namespace declares which collections it is computed from (`depends_on`), and
+every write to one of those collections drops the whole namespace (`invalidate`, called from
+`router_helpers._after_write`). The cache is per process, so entries also expire after `CACHE_TTL` seconds; that
+bounds how long other workers serve data computed before a write they didn't see.
+
+Values are computed outside the lock, so a write can invalidate a namespace while one of its values is being
+computed from the old data. Every invalidation bumps the namespace's generation, and a computed value is only stored
+if the generation is still the one read before computing it; otherwise it is returned but not cached.
+
+Functions:
+- depends_on: Declares the collections a namespace is computed from.
+- cached: Returns the cached value for (namespace, key), computing and storing it on a miss.
+- invalidate: Drops every namespace that depends on the written collection.
+- clear: Drops all cached entries.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+from src import env
+
+_entries: dict[str, dict[Hashable, tuple[float, Any]]] = {}  # namespace -> key -> (expires at, value)
+_dependents: dict[str, set[str]] = {}  # collection -> namespaces computed from it
+_generations: dict[str, int] = {}  # namespace -> number of invalidations
+_epoch = 0  # Number of `clear` calls, part of every generation
+_lock = threading.Lock()
+
+
+def depends_on(namespace: str, collections: list[str]):
+    """
+    Declares that the entries of `namespace` are computed from `collections`.
+    """
+    with _lock:
+        for collection in collections:
+            _dependents.setdefault(collection, set()).add(namespace)
+
+
+def cached(namespace: str, key: Hashable, compute: Callable[[], Any], ttl: int = env.CACHE_TTL) -> Any:
+    """
+    Returns the cached value for (namespace, key); on a miss or after `ttl` seconds it is computed and stored again.
+    """
+    now = time.monotonic()
+    entry = _entries.get(namespace, {}).get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    generation = _generation(namespace)
+    value = compute()
+    with _lock:
+        if _generation(namespace) == generation:  # Not invalidated while computing
+            _entries.setdefault(namespace, {})[key] = (now + ttl, value)
+    return value
+
+
+def _generation(namespace: str) -> tuple[int, int]:
+    return _epoch, _generations.get(namespace, 0)
+
+
+def invalidate(collection: str):
+    """
+    Drops every namespace computed from `collection`.
+    """
+    with _lock:
+        for namespace in _dependents.get(collection, ()):
+            _entries.pop(namespace, None)
+            _generations[namespace] = _generations.get(namespace, 0) + 1
+
+
+def clear():
+    """
+    Drops all cached entries.
+    """
+    global _epoch
+    with _lock:
+        _entries.clear()
+        _epoch += 1
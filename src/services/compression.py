@@ -0,0 +1,210 @@
+"""
+HTTP response compression: gzip, and brotli when the optional `brotli` package is installed.
+
+`CompressionMiddleware` compresses every response of at least `COMPRESSION_MIN_SIZE` bytes with the best encoding the
+client accepts (`br` before `gzip`). Streamed responses (NDJSON) are compressed chunk by chunk. Responses that already
+have a `Content-Encoding`, and media types that are compressed anyway (images, PDF, ...), are passed through.
+
+Cached responses don't need the middleware: a `PrecompressedBody` keeps the compressed variants of a body next to it,
+each one compressed at a higher level (gzip 9, brotli 5) the first time a client asks for it, in the threadpool so a
+large body doesn't block the event loop. Brotli stays at quality 5: quality 11 takes seconds for a list of a few MB
+for a few percent smaller output. Cached together with the body (see
+`src.services.cache`), a body is compressed once per write instead of once per request, and `PrecompressedResponse`
+picks the variant matching the request's `Accept-Encoding`.
+
+Classes:
+- CompressionMiddleware: Pure ASGI middleware compressing responses on the fly.
+- PrecompressedBody: A response body with its lazily built compressed variants.
+- PrecompressedResponse: Serves the variant of a `PrecompressedBody` the client accepts.
+
+Functions:
+- accepted_encoding: Picks the encoding for an `Accept-Encoding` header.
+"""
+
+import threading
+import zlib
+from dataclasses import dataclass, field
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+
+from src import env
+
+try:
+    import brotli
+except ImportError:  # Optional: without brotli, responses are gzip-compressed only
+    brotli = None
+
+# Encodings in order of preference
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# Levels of on-the-fly compression (per request) and of precompressed bodies (once per write)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+PRECOMPRESSED_GZIP_LEVEL = 9
+PRECOMPRESSED_BROTLI_QUALITY = 5
+
+# Media types that are not compressed again
+INCOMPRESSIBLE_TYPES = ('image/', 'video/', 'audio/', 'application/pdf', 'application/zip', 'application/gzip')
+
+
+def accepted_encoding(accept_encoding: str) -> str | None:
+    """
+    Returns the preferred encoding of ENCODINGS that the `Accept-Encoding` header allows (q > 0), or None.
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(','):
+        name, _, parameters = part.strip().partition(';')
+        quality = parameters.strip().removeprefix('q=')
+        try:
+            if parameters and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(name.strip())
+
+    for encoding in ENCODINGS:
+        if encoding in accepted or '*' in accepted:
+            return encoding
+    return None
+
+
+def _compressor(encoding: str, level: int):
+    if encoding == 'br':
+        return brotli.Compressor(quality=level)
+    return zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+
+
+def compress(body: bytes, encoding: str, level: int | None = None) -> bytes:
+    """
+    Compresses a whole body with `encoding` ('br' or 'gzip'), by default at the precompression level.
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=PRECOMPRESSED_BROTLI_QUALITY if level is None else level)
+    compressor = _compressor(encoding, PRECOMPRESSED_GZIP_LEVEL if level is None else level)
+    return compressor.compress(body) + compressor.flush()
+
+
+class _Stream:
+    """
+    Compresses a streamed body chunk by chunk, flushing after every chunk so the client receives it right away.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        self.compressor = _compressor(encoding, BROTLI_QUALITY if encoding == 'br' else GZIP_LEVEL)
+
+    def chunk(self, data: bytes, last: bool) -> bytes:
+        if self.encoding == 'br':
+            return self.compressor.process(data) + (self.compressor.finish() if last else self.compressor.flush())
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing responses of at least `minimum_size` bytes with gzip or brotli.
+    """
+
+    def __init__(self, app, minimum_size: int = env.COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = accepted_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None  # The http.response.start message, held back until the first body chunk is seen
+        stream = None  # Set once the response is being compressed
+
+        async def send_compressed(message):
+            nonlocal start, stream
+            if message['type'] == 'http.response.start':
+                start = message
+                return
+            if message['type'] != 'http.response.body' or start is None:
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if stream is None:
+                headers = MutableHeaders(raw=list(start['headers']))
+                start['headers'] = headers.raw
+                if ('content-encoding' in headers or headers.get('content-type', '').startswith(INCOMPRESSIBLE_TYPES)
+                        or (not more_body and len(body) < self.minimum_size)):
+                    await send(start)
+                    start = None  # Pass the rest of the response through
+                    await send(message)
+                    return
+
+                stream = _Stream(encoding)
+                headers['Content-Encoding'] = encoding
+                headers.add_vary_header('Accept-Encoding')
+                del headers['Content-Length']
+                body = stream.chunk(body, last=not more_body)
+                if not more_body:
+                    headers['Content-Length'] = str(len(body))
+                await send(start)
+            else:
+                body = stream.chunk(body, last=not more_body)
+
+            await send({'type': 'http.response.body', 'body': body, 'more_body': more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+@dataclass
+class PrecompressedBody:
+    """
+    A response body and its compressed variants, built on first use per encoding and kept with the body.
+    """
+    body: bytes
+    media_type: str = 'application/json'
+    variants: dict[str, bytes] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def variant(self, encoding: str | None) -> bytes:
+        """
+        Returns the body compressed with `encoding`, or the plain body for None.
+        """
+        if encoding is None:
+            return self.body
+        compressed = self.variants.get(encoding)
+        if compressed is None:
+            with self._lock:
+                compressed = self.variants.get(encoding)
+                if compressed is None:
+                    compressed = self.variants[encoding] = compress(self.body, encoding)
+        return compressed
+
+
+class PrecompressedResponse(Response):
+    """
+    Sends the variant of a `PrecompressedBody` matching the request's `Accept-Encoding`, with `Content-Encoding` set
+    (bodies smaller than `COMPRESSION_MIN_SIZE` are sent plain). `CompressionMiddleware` leaves it as it is.
+    """
+
+    def __init__(self, content: PrecompressedBody, status_code: int = 200):
+        self.precompressed = content
+        super().__init__(content.body, status_code=status_code, media_type=content.media_type)
+
+    async def __call__(self, scope, receive, send):
+        encoding = None
+        if len(self.precompressed.body) >= env.COMPRESSION_MIN_SIZE:
+            encoding = accepted_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        self.headers.add_vary_header('Accept-Encoding')
+        if encoding is not None:
+            if encoding in self.precompressed.variants:
+                self.body = self.precompressed.variants[encoding]
+            else:  # First request for this encoding since the write: compress off the event loop
+                self.body = await run_in_threadpool(self.precompressed.variant, encoding)
+            self.headers['Content-Encoding'] = encoding
+            self.headers['Content-Length'] = str(len(self.body))
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,126 @@
+"""
+Storage layout of the per-technology article and QA collections.
+
+By default (`CONTENT_STORAGE=collections`) every technology has its own `<technology>_articles` and `<technology>_qa`
+collection. With `CONTENT_STORAGE=unified` all articles live in one `articles` collection and all QA in one `qa`
+collection, keyed by a `technology` field with a compound `(technology, datum_vnosa)` index, so cross-technology
+queries are a single round-trip.
+
+Routes and helpers keep using the logical per-technology names; `resolve` maps a logical name to the physical
+collection and the filter that selects its documents.
+
+Functions:
+- is_unified: Whether the unified storage mode is enabled.
+- resolve: Maps a logical collection name to (physical collection, base filter).
+- ensure_indexes: Creates the newest-first indexes of the sorted collections in the active storage mode.
+- migrate: Copies the per-technology collections into the unified collections.
+
+Run `python -m src.services.content_storage [--drop-source]` to migrate an existing database.
+"""
+
+import argparse
+
+from pymongo import ASCENDING, DESCENDING, ReplaceOne
+
+from src import env
+from src.services import db, stats
+from src.services.technologies import ARTICLE_COLLECTIONS, QA_COLLECTIONS, TECHNOLOGIES, article_collection, \
+    qa_collection
+
+UNIFIED_ARTICLES = 'articles'
+UNIFIED_QA = 'qa'
+UNIFIED_COLLECTIONS = [UNIFIED_ARTICLES, UNIFIED_QA]
+
+MIGRATION_BATCH_SIZE = 1000
+
+# Newest first, ties broken by _id so the order is deterministic; every index serving it ends with these keys
+NEWEST_FIRST = [('datum_vnosa', DESCENDING), ('_id', DESCENDING)]
+
+# Logical collections read newest first (`router_helpers.limited_data`, `latest_content`)
+SORTED_COLLECTIONS = ['blog', *ARTICLE_COLLECTIONS, *QA_COLLECTIONS]
+
+# logical collection -> (unified collection, technology)
+_UNIFIED = {
+    **{article_collection(technology): (UNIFIED_ARTICLES, technology) for technology in TECHNOLOGIES},
+    **{qa_collection(technology): (UNIFIED_QA, technology) for technology in TECHNOLOGIES},
+}
+
+
+def is_unified() -> bool:
+    return env.CONTENT_STORAGE == 'unified'
+
+
+def resolve(collection: str) -> tuple[str, dict]:
+    """
+    Maps a logical collection name to the physical collection it is stored in and the filter selecting its documents.
+
+    Examples (unified mode):
+        resolve('python_articles') -> ('articles', {'technology': 'python'})
+        resolve('blog') -> ('blog', {})
+    """
+    if is_unified() and collection in _UNIFIED:
+        physical, technology = _UNIFIED[collection]
+        return physical, {'technology': technology}
+    return collection, {}
+
+
+def ensure_indexes():
+    """
+    Creates the indexes backing the newest-first reads; a no-op for indexes that already exist.
+
+    Every sorted collection gets an index on the equality fields of its `resolve` filter followed by NEWEST_FIRST:
+    (datum_vnosa, _id) on per-technology collections and the blog, (technology, datum_vnosa, _id) on the unified
+    collections, which also get a (datum_vnosa, _id) index for newest-first queries across all technologies. It runs
+    on startup and after seeding, filling and migrating, so the request path only reads.
+    """
+    indexes = {(physical, tuple((field, ASCENDING) for field in base_filter) + tuple(NEWEST_FIRST))
+               for physical, base_filter in map(resolve, SORTED_COLLECTIONS)}
+    if is_unified():
+        indexes |= {(collection, tuple(NEWEST_FIRST)) for collection in UNIFIED_COLLECTIONS}
+    for collection, keys in sorted(indexes):
+        db.process[collection].create_index(list(keys))
+
+
+def migrate(drop_source: bool = False) -> dict[str, int]:
+    """
+    Copies every per-technology article and QA collection into the unified collections.
+
+    Documents keep their `_id` and get a `technology` field; they are upserted by `_id`, so running the migration
+    again is safe. The source collections are only dropped when `drop_source` is set.
+
+    Returns:
+        dict[str, int]: Number of migrated documents per source collection.
+    """
+    ensure_indexes()
+    migrated = {}
+
+    for collection, (unified, technology) in _UNIFIED.items():
+        batch = []
+        count = 0
+        for document in db.process[collection].find():
+            document['technology'] = technology
+            batch.append(ReplaceOne({'_id': document['_id']}, document, upsert=True))
+            if len(batch) >= MIGRATION_BATCH_SIZE:
+                db.process[unified].bulk_write(batch, ordered=False)
+                count += len(batch)
+                batch = []
+        if batch:
+            db.process[unified].bulk_write(batch, ordered=False)
+            count += len(batch)
+
+        migrated[collection] = count
+        print(f"Migrated {count} documents: {collection} -> {unified}")
+
+        if drop_source:
+            db.process[collection].drop()
+            print(f"Dropped collection: {collection}")
+
+    stats.rebuild()
+    return migrated
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Migrate per-technology article/QA collections to unified storage.')
+    parser.add_argument('--drop-source', action='store_true', help='drop the per-technology collections afterwards')
+    args = parser.parse_args()
+    migrate(drop_source=args.drop_source)
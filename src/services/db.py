@@ -1,91 +1,182 @@
+"""
+MongoDB client, and the drop / seed functions of the development database.
+
+The client is created lazily: `connect` runs on app startup (or on the first access of `db.client` / `db.process`),
+so importing this module doesn't open a connection. Seed data is streamed from the NDJSON fixtures in
+`src/database/fixtures/` (see `src.services.fixtures`) only when seeding.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable
+
 from pymongo import MongoClient
+from pymongo.database import Database
+
 from src import env
+from src.services.metrics import MongoCommandTimer
+from src.services import query_log
+from src.services import content_storage, dev_articles, fixtures, stats
 
-# User data and all seedable collections
-from src.database.user import user
-from src.services.collections import collections
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Database client setup
 # ---------------------------------------------------------------------------
-# Use development MongoDB connection if in development mode, otherwise use production
-if env.ENV.lower() == 'development':
-    print(f"Using development MongoDB connection: {env.DB_DEV}")
-    client = MongoClient(env.DB_DEV)  # Connect to local MongoDB instance
-else:
-    print(f"Using production MongoDB connection")
-    client = MongoClient(env.DB_MAIN)  # Connect to production MongoDB instance
+_connect_lock = threading.Lock()
 
-process = client[env.DB_PROCESS]  # Select the database
+SEED_WORKERS = 8  # Collections dropped / seeded concurrently
+
+client: MongoClient  # Set by connect()
+process: Database  # Set by connect()
+
+
+def connect() -> Database:
+    """
+    Creates the MongoDB client and selects the database on the first call; later calls return the same database.
+    """
+    global client, process
+    database = globals().get('process')
+    if database is not None:
+        return database
+
+    with _connect_lock:
+        if 'process' not in globals():
+            # Command listeners: per-request Mongo time (metrics) and per-command latency / slow-query log (query_log);
+            # built here rather than at import time, because query_log imports this module
+            listeners = [MongoCommandTimer(), query_log.listener]
+            # Use development MongoDB connection if in development mode, otherwise use production
+            if env.ENV.lower() == 'development':
+                logger.info('Using development MongoDB connection: %s', env.DB_DEV)
+                client = MongoClient(env.DB_DEV, event_listeners=listeners)  # Connect to local MongoDB instance
+            else:
+                logger.info('Using production MongoDB connection')
+                client = MongoClient(env.DB_MAIN, event_listeners=listeners)  # Connect to production MongoDB instance
+            process = client[env.DB_PROCESS]  # Select the database
+    return process
+
+
+def __getattr__(name):
+    # `db.client` / `db.process` before startup: connect on first use
+    if name in ('client', 'process'):
+        connect()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _seed_collections() -> list[str]:
+    # The user collection has its own drop / seed functions
+    return [name for name in fixtures.fixture_collections() if name != 'user']
+
+
+# ---------------------------------------------------------------------------
+# Parallel bulk operations
+# ---------------------------------------------------------------------------
+def run_parallel(action: str, tasks: dict[str, Callable[[], object]]) -> dict[str, float]:
+    """
+    Runs one task per collection on a bounded thread pool (SEED_WORKERS) and logs how long each and all took.
+
+    Returns:
+        dict[str, float]: Seconds spent per collection.
+    """
+    def timed(task):
+        start = time.perf_counter()
+        task()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=SEED_WORKERS, thread_name_prefix=action) as executor:
+        futures = {name: executor.submit(timed, task) for name, task in tasks.items()}
+        timings = {name: future.result() for name, future in futures.items()}
+
+    for name, seconds in timings.items():
+        logger.info('%s collection: %s (%.3f s)', action, name, seconds)
+    logger.info('%s %d collections in %.3f s', action, len(timings), time.perf_counter() - start)
+    return timings
 
 
 # ---------------------------------------------------------------------------
 # DROP FUNCTIONS
 # ---------------------------------------------------------------------------
-def drop():
+def drop() -> dict[str, float]:
     """
-    Drops all pre-defined collections in the `collections` dictionary and
+    Drops every collection that has a seed fixture and
     also clears special 'dev' and other standalone collections.
-    """
-    # Drop Dev API collections (not part of the collections dict)
-    special_dev_collections = [
-        "dev_api_angular", "dev_api_vue", "dev_api_typescript",
-        "dev_api_python", "dev_api_javascript", "dev_api_mongodb"
-    ]
 
-    for dev_collection in special_dev_collections:
-        if dev_collection in process.list_collection_names():
-            process[dev_collection].drop()
-            print(f"Dropped special collection: {dev_collection}")
+    The existing collection names are fetched once and the drops run in parallel.
 
-    # Drop other standalone collections
-    if "language_data" in process.list_collection_names():
-        process.language_data.drop()
-        print("Dropped special collection: language_data")
+    Returns:
+        dict[str, float]: Seconds spent dropping each collection.
+    """
+    process = connect()
+
+    # The dev.to articles, language_data and the counters, the collections seeded from fixtures (except the user
+    # collection) and the unified article/QA collections
+    candidates = [dev_articles.DEV_ARTICLES, "language_data", stats.STATS_COLLECTION, *_seed_collections(),
+                  *content_storage.UNIFIED_COLLECTIONS]
 
-    # Drop collections defined in `collections` dict
-    for collection_name in collections.keys():
-        if collection_name in process.list_collection_names():
-            process[collection_name].drop()
-            print(f"Dropped collection: {collection_name}")
+    existing = set(process.list_collection_names())
+    return run_parallel('Dropped', {
+        name: partial(process.drop_collection, name) for name in dict.fromkeys(candidates) if name in existing
+    })
 
 
 def drop_user():
     """
     Drops the user collection only.
     """
+    process = connect()
     if "user" in process.list_collection_names():
         process.user.drop()
-        print("Dropped user collection")
+        logger.info('Dropped user collection')
 
 
-def drop_all_collections():
+def drop_all_collections() -> dict[str, float]:
     """
-    Drops ALL collections in the database.
+    Drops ALL collections in the database, in parallel.
     Use with caution!
+
+    Returns:
+        dict[str, float]: Seconds spent dropping each collection.
     """
-    for collection_name in process.list_collection_names():
-        process[collection_name].drop()
-        print(f"Dropped collection: {collection_name}")
+    process = connect()
+    return run_parallel('Dropped', {
+        name: partial(process.drop_collection, name) for name in process.list_collection_names()
+    })
 
 
 # ---------------------------------------------------------------------------
 # SEED FUNCTIONS
 # ---------------------------------------------------------------------------
-def seed():
+def seed() -> dict[str, float]:
     """
-    Inserts seed data into all collections defined in the `collections` dict.
+    Streams the seed fixture of every collection (except the user collection) into the database.
+
+    Article/QA seed data is written to the collection `content_storage.resolve` maps it to, so seeding also works
+    with `CONTENT_STORAGE=unified`. Fixtures are inserted in unordered `insert_many` batches, and the collections
+    are seeded in parallel. Afterwards the newest-first indexes are created and the content counters
+    (`src.services.stats`) are recounted.
+
+    Returns:
+        dict[str, float]: Seconds spent seeding each collection.
     """
-    for collection_name, data in collections.items():
-        if data:  # Only insert if seed data exists
-            process[collection_name].insert_many(data)
-            print(f"Seeded collection: {collection_name}")
+    process = connect()
+    timings = run_parallel('Seeded', {
+        collection_name: partial(fixtures.load_fixture, collection_name, process)
+        for collection_name in _seed_collections()
+    })
+
+    content_storage.ensure_indexes()
+    stats.rebuild()
+    return timings
 
 
 def seed_user():
     """
     Seeds the user collection with user data.
     """
-    if user:
-        process.user.insert_many(user)
-        print("Seeded user collection")
+    if fixtures.load_fixture('user', connect()):
+        logger.info('Seeded user collection')
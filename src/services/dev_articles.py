@@ -0,0 +1,113 @@
+"""
+Storage of the dev.to articles behind the `/dev/<tag>` routes.
+
+All articles live in one `dev_articles` collection, one document per article URL (unique index), with a `tags` array
+listing the feeds the article currently appears in. An article that dev.to returns for several tags is stored and
+refreshed once instead of once per `dev_api_<tag>` collection. A feed is read with `{'tags': tag}` sorted by newest
+`published_at`, served by the `(tags, published_at)` index.
+
+Refreshing a feed upserts its articles by URL, adds the tag to them and removes it from the articles that left the
+feed; articles that are in no feed anymore are deleted.
+
+Functions:
+- ensure_indexes: Creates the unique URL index and the (tags, published_at) index.
+- store: Replaces the articles of one feed.
+- feed: Returns the stored articles of one feed, newest first.
+- migrate: Copies the legacy per-tag `dev_api_<tag>` collections into `dev_articles`.
+
+Run `python -m src.services.dev_articles [--drop-source]` to migrate an existing database.
+"""
+
+import argparse
+
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.domain.dev_api import DevAritcle
+from src.services import db, stats
+
+DEV_ARTICLES = 'dev_articles'
+LEGACY_PREFIX = 'dev_api_'
+
+FEED_ORDER = [('published_at', DESCENDING)]
+
+
+def ensure_indexes():
+    """
+    Creates the unique index on `url` and the `(tags, published_at)` index serving `feed`.
+    """
+    db.process[DEV_ARTICLES].create_index('url', unique=True)
+    db.process[DEV_ARTICLES].create_index([('tags', ASCENDING), *FEED_ORDER])
+
+
+def _upsert(articles: list[DevAritcle], tag: str) -> list[UpdateOne]:
+    return [
+        UpdateOne(
+            {'url': article.url},
+            {
+                '$set': article.model_dump(by_alias=True, exclude={'id'}),
+                '$setOnInsert': {'_id': article.id},
+                '$addToSet': {'tags': tag},
+            },
+            upsert=True,
+        )
+        for article in articles
+    ]
+
+
+def store(tag: str, articles: list[DevAritcle]):
+    """
+    Makes `articles` the stored articles of the feed `tag`: upserts them by URL and takes the tag off every other
+    article, deleting the articles that are left without a tag.
+    """
+    collection = db.process[DEV_ARTICLES]
+    if articles:
+        try:
+            collection.bulk_write(_upsert(articles, tag), ordered=False)
+        except BulkWriteError:
+            # Another worker inserted some of the same URLs concurrently; now they exist, so the upserts update them
+            collection.bulk_write(_upsert(articles, tag), ordered=False)
+
+    collection.update_many({'tags': tag, 'url': {'$nin': [article.url for article in articles]}},
+                           {'$pull': {'tags': tag}})
+    collection.delete_many({'tags': {'$size': 0}})
+
+
+def feed(tag: str) -> list[dict]:
+    """
+    Returns the stored articles of the feed `tag`, newest first, without the `tags` array.
+    """
+    return list(db.process[DEV_ARTICLES].find({'tags': tag}, {'tags': 0}).sort(FEED_ORDER))
+
+
+def migrate(drop_source: bool = False) -> dict[str, int]:
+    """
+    Copies every `dev_api_<tag>` collection into `dev_articles`, merging the copies of an article by URL.
+
+    Returns:
+        dict[str, int]: Number of migrated documents per source collection.
+    """
+    ensure_indexes()
+    migrated = {}
+    for collection in sorted(db.process.list_collection_names()):
+        if not collection.startswith(LEGACY_PREFIX):
+            continue
+        articles = [DevAritcle.model_validate(document) for document in db.process[collection].find()]
+        if articles:
+            db.process[DEV_ARTICLES].bulk_write(_upsert(articles, collection.removeprefix(LEGACY_PREFIX)),
+                                                ordered=False)
+        migrated[collection] = len(articles)
+        print(f"Migrated {len(articles)} articles: {collection} -> {DEV_ARTICLES}")
+
+        if drop_source:
+            db.process[collection].drop()
+            print(f"Dropped collection: {collection}")
+    stats.rebuild()
+    return migrated
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Migrate the dev_api_<tag> collections to dev_articles.')
+    parser.add_argument('--drop-source', action='store_true', help='drop the dev_api_<tag> collections afterwards')
+    args = parser.parse_args()
+    migrate(drop_source=args.drop_source)
@@ -0,0 +1,121 @@
+"""
+Seed fixtures stored as NDJSON files in `src/database/fixtures/`.
+
+Every `<collection>.ndjson` file (or gzip-compressed `<collection>.ndjson.gz`) holds one JSON document per line. The
+loader streams a file line by line, validates every document against the collection's domain model (which also fills
+in defaults such as `_id` and `datum_vnosa`) and inserts it in batches, so a fixture of any size is seeded with
+constant memory.
+
+Functions:
+- fixture_collections: Lists the collections that have a fixture file.
+- read_fixture: Streams the validated documents of one fixture.
+- load_fixture: Streams a fixture into the database in batches.
+"""
+
+import gzip
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Type
+
+from pydantic import BaseModel, ValidationError
+from pymongo.database import Database
+
+from src.domain.article import Article
+from src.domain.blog import Blog
+from src.domain.book import Book
+from src.domain.contact import Contact
+from src.domain.email_data import EmailData
+from src.domain.experiences import Experiences
+from src.domain.language import Language
+from src.domain.language_data import LanguageData
+from src.domain.links import Links
+from src.domain.projects import Projects
+from src.domain.user import User
+from src.services import content_storage
+from src.services.technologies import TECHNOLOGIES, article_collection, qa_collection
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / 'database' / 'fixtures'
+FIXTURE_BATCH_SIZE = 1000  # Documents per insert_many
+
+# collection -> domain model its fixture documents are validated against
+FIXTURE_MODELS: dict[str, Type[BaseModel]] = {
+    'blog': Blog,
+    'sent_email_data': EmailData,
+    'links': Links,
+    'experiences': Experiences,
+    'contact': Contact,
+    'projects': Projects,
+    'book': Book,
+    'language_data': LanguageData,
+    'user': User,
+    **{qa_collection(technology): Language for technology in TECHNOLOGIES},
+    **{article_collection(technology): Article for technology in TECHNOLOGIES},
+}
+
+
+class FixtureError(ValueError):
+    """
+    Raised when a fixture line isn't valid JSON or doesn't match the collection's model.
+    """
+
+    def __init__(self, path: Path, line: int, error: Exception):
+        super().__init__(f"{path.name}:{line}: {error}")
+        self.path = path
+        self.line = line
+
+
+def _path(collection: str, fixtures_dir: Path) -> Path:
+    path = fixtures_dir / f'{collection}.ndjson'
+    compressed = path.with_name(path.name + '.gz')
+    return compressed if compressed.exists() else path
+
+
+def fixture_collections(fixtures_dir: Path = FIXTURES_DIR) -> list[str]:
+    """
+    Returns the collections with a fixture file, in file name order.
+    """
+    names = {path.name.split('.')[0] for path in fixtures_dir.glob('*.ndjson*')}
+    return sorted(names)
+
+
+def read_fixture(collection: str, fixtures_dir: Path = FIXTURES_DIR) -> Iterator[dict]:
+    """
+    Streams the documents of a collection's fixture, each validated against the collection's model.
+
+    Blank lines are skipped. Documents of collections without a model are passed through unvalidated.
+
+    Raises:
+        FixtureError: A line isn't valid JSON or fails validation.
+    """
+    path = _path(collection, fixtures_dir)
+    model = FIXTURE_MODELS.get(collection)
+    opener = gzip.open if path.suffix == '.gz' else open
+
+    with opener(path, 'rt', encoding='utf-8') as lines:
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                document = json.loads(line)
+                yield model.model_validate(document).model_dump(by_alias=True) if model else document
+            except (json.JSONDecodeError, ValidationError) as e:
+                raise FixtureError(path, number, e) from e
+
+
+def load_fixture(collection: str, database: Database, batch_size: int = FIXTURE_BATCH_SIZE,
+                 fixtures_dir: Path = FIXTURES_DIR) -> int:
+    """
+    Streams a fixture into the collection `content_storage.resolve` maps it to, `batch_size` documents per
+    unordered `insert_many`.
+
+    Returns:
+        int: Number of inserted documents.
+    """
+    physical, base_filter = content_storage.resolve(collection)
+    documents = read_fixture(collection, fixtures_dir)
+    count = 0
+    while batch := [{**document, **base_filter} for document in islice(documents, batch_size)]:
+        database[physical].insert_many(batch, ordered=False)
+        count += len(batch)
+    return count
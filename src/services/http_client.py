@@ -0,0 +1,43 @@
+"""
+Shared HTTP client for calls to external APIs (StackOverflow, GitHub, dev.to).
+
+One `httpx.AsyncClient` per event loop keeps connections to the upstream APIs alive across requests and scheduled
+jobs instead of opening a new connection pool for every call. The app uses one event loop per worker, so a worker has
+exactly one client; an event loop that is started later (e.g. by the test client) gets its own.
+
+Functions:
+- get_client: Returns the client of the running event loop.
+- close: Closes the client; called on app shutdown.
+"""
+
+import asyncio
+
+import httpx
+
+HTTP_TIMEOUT = 10  # Seconds to wait for an upstream API
+HTTP_MAX_CONNECTIONS = 100  # Open connections of the client across all upstream hosts
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Returns the shared client, creating it on first use in the running event loop.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS))
+        _client_loop = loop
+    return _client
+
+
+async def close():
+    """
+    Closes the shared client of the running event loop, if there is one.
+    """
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client, _client_loop = None, None
@@ -0,0 +1,113 @@
+"""
+Migration of string `_id`s to native ObjectIds.
+
+Before the domain models switched to `PyObjectId` (see `src.domain.object_id`), documents were stored with the hex
+string of an ObjectId as `_id`. This migration rewrites every such document of the database with the equivalent
+ObjectId. `_id` can't be updated in place, so each batch is inserted again under the new id and the old documents are
+deleted afterwards; an interrupted run can simply be started again.
+
+An original is only deleted once its ObjectId copy is confirmed to be in the collection. A copy that already exists
+(left by an interrupted run) counts as migrated; any other write error, e.g. a duplicate on another unique index,
+keeps the original and stops the migration with the error.
+
+Only hex strings of 24 characters are converted, so collections keyed by names (e.g. `scheduler_leases`) are left
+alone. The response cache and the in-memory search index are keyed by the id's string, which doesn't change.
+
+Functions:
+- migrate_collection: Converts the string ids of one collection.
+- migrate: Converts the string ids of every collection in the database.
+
+Run `python -m src.services.id_migration [--collection NAME ...]` to migrate an existing database, before starting
+the API on it.
+"""
+
+import argparse
+
+from bson import ObjectId
+from pymongo.database import Database
+from pymongo.errors import BulkWriteError
+
+from src.services import db
+
+MIGRATION_BATCH_SIZE = 1000
+
+DUPLICATE_KEY = 11000
+
+
+def _insert_migrated(database: Database, collection: str, documents: list[dict]) -> list[dict]:
+    """
+    Inserts the ObjectId copies and returns the write errors (empty if every copy was inserted).
+    """
+    try:
+        database[collection].insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        return e.details['writeErrors']
+    return []
+
+
+def _already_migrated(error: dict, stored: set[ObjectId]) -> bool:
+    # A duplicate `_id` means the copy exists from an earlier run; servers (and mongomock) that don't report the
+    # `keyPattern` are covered by checking that the copy is really stored
+    return (error['code'] == DUPLICATE_KEY and error.get('keyPattern', {'_id': 1}) == {'_id': 1}
+            and error['op']['_id'] in stored)
+
+
+def migrate_collection(database: Database, collection: str, batch_size: int = MIGRATION_BATCH_SIZE) -> int:
+    """
+    Replaces the documents of `collection` whose `_id` is the hex string of an ObjectId with copies keyed by the
+    ObjectId, `batch_size` documents at a time.
+
+    Returns:
+        int: Number of migrated documents.
+
+    Raises:
+        BulkWriteError: If a copy couldn't be written for another reason than already existing; the originals of
+            the failed copies are kept.
+    """
+    count = 0
+    batch = []
+
+    def flush():
+        originals = {ObjectId(document['_id']): document['_id'] for document in batch}
+        errors = _insert_migrated(database, collection,
+                                  [{**document, '_id': ObjectId(document['_id'])} for document in batch])
+        stored = set(database[collection].distinct('_id', {'_id': {'$in': list(originals)}}))
+        database[collection].delete_many({'_id': {'$in': [originals[_id] for _id in stored]}})
+
+        failed = [error for error in errors if not _already_migrated(error, stored)]
+        if failed:
+            raise BulkWriteError({'writeErrors': failed, 'nInserted': len(batch) - len(errors)})
+        return len(stored)
+
+    for document in database[collection].find({'_id': {'$type': 'string'}}):
+        if not ObjectId.is_valid(document['_id']):
+            continue
+        batch.append(document)
+        if len(batch) >= batch_size:
+            count += flush()
+            batch = []
+    if batch:
+        count += flush()
+    return count
+
+
+def migrate(collections: list[str] | None = None) -> dict[str, int]:
+    """
+    Converts the string ids of the given collections, by default of every collection in the database.
+
+    Returns:
+        dict[str, int]: Number of migrated documents per collection.
+    """
+    database = db.process
+    migrated = {}
+    for collection in collections or sorted(database.list_collection_names()):
+        migrated[collection] = migrate_collection(database, collection)
+        print(f"Migrated {migrated[collection]} ids: {collection}")
+    return migrated
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert string _ids to native ObjectIds.')
+    parser.add_argument('--collection', action='append', help='migrate only this collection (repeatable)')
+    args = parser.parse_args()
+    migrate(args.collection)
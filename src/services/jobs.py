@@ -0,0 +1,96 @@
+"""
+Periodic background jobs on an APScheduler `AsyncIOScheduler` running on the app's event loop.
+
+Jobs are coroutine functions awaited on the same loop as the requests, so they share the app's HTTP client
+(`src.services.http_client`) and don't need threads or event loops of their own. Every run is recorded in a bounded
+per-job history (start, duration, status and error), which the admin API exposes together with the next run time.
+
+A job reports a skipped run (e.g. another worker holds its lease, see `src.services.leases`) by returning False.
+
+Functions:
+- schedule: Adds a coroutine function as an interval job and starts the scheduler.
+- shutdown: Stops the scheduler; called on app shutdown.
+- job_status: Returns the schedule and recent runs of every job.
+"""
+
+import asyncio
+import datetime
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+logger = logging.getLogger(__name__)
+
+JOB_HISTORY_SIZE = 20  # Runs kept per job, newest first
+
+_scheduler: AsyncIOScheduler | None = None
+_scheduler_loop: asyncio.AbstractEventLoop | None = None
+_history: dict[str, deque] = {}
+
+
+async def _run(job_id: str, function: Callable[[], Awaitable[object]]):
+    started_at = datetime.datetime.now(datetime.timezone.utc)
+    start = time.perf_counter()
+    status, error = 'succeeded', None
+    try:
+        if await function() is False:
+            status = 'skipped'
+    except Exception as e:
+        status, error = 'failed', str(e) or type(e).__name__
+        logger.exception('Job %s failed', job_id)
+
+    duration = time.perf_counter() - start
+    _history[job_id].appendleft({
+        'started_at': started_at,
+        'duration_seconds': round(duration, 3),
+        'status': status,
+        'error': error,
+    })
+    logger.info('Job %s %s in %.3f s', job_id, status, duration)
+
+
+def schedule(job_id: str, function: Callable[[], Awaitable[object]], interval: datetime.timedelta):
+    """
+    Runs `function` every `interval` on the running event loop, starting the scheduler if it isn't running yet.
+
+    Scheduling the same `job_id` again replaces the job. Runs that were missed (e.g. the loop was busy) are coalesced
+    into one, and a job never runs twice at the same time.
+    """
+    global _scheduler, _scheduler_loop
+    loop = asyncio.get_running_loop()
+    if _scheduler is None or _scheduler_loop is not loop:
+        _scheduler = AsyncIOScheduler(event_loop=loop, timezone=datetime.timezone.utc)
+        _scheduler_loop = loop
+        _scheduler.start()
+
+    _history.setdefault(job_id, deque(maxlen=JOB_HISTORY_SIZE))
+    _scheduler.add_job(_run, 'interval', args=(job_id, function), seconds=interval.total_seconds(), id=job_id,
+                       replace_existing=True, coalesce=True, max_instances=1)
+
+
+def shutdown():
+    """
+    Stops the scheduler without waiting for running jobs.
+    """
+    global _scheduler, _scheduler_loop
+    if _scheduler is not None and _scheduler.running:
+        _scheduler.shutdown(wait=False)
+    _scheduler, _scheduler_loop = None, None
+
+
+def job_status() -> list[dict]:
+    """
+    Returns every scheduled job with its interval, next run time and recent runs (newest first).
+    """
+    return [
+        {
+            'id': job.id,
+            'interval_seconds': job.trigger.interval.total_seconds(),
+            'next_run_time': job.next_run_time,
+            'runs': list(_history.get(job.id, ())),
+        }
+        for job in (_scheduler.get_jobs() if _scheduler is not None else ())
+    ]
@@ -1,32 +1,39 @@
 import asyncio
-import time
+import logging
 from fastapi import  HTTPException
-from datetime import datetime
-from apscheduler.schedulers.background import BackgroundScheduler
+from datetime import datetime, timedelta
 
-import requests
+import httpx
 
 from src import env
 from src.domain.language_data import LanguageData
-from src.services import db
+from src.services import db, http_client, jobs, leases
+
+logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3  # Maximum number of retries for each page if a request fails
 RETRY_SLEEP_TIME = 2  # Time (in seconds) to wait before retrying a failed request, with exponential backoff
 MAX_PAGES = 25  # Maximum number of pages allowed (as per StackOverflow API limitations)
+TAGS_JOB = 'update_stackoverflow_tags'  # Lease name of the tag update, shared by all workers
+TAGS_INTERVAL = timedelta(hours=24)  # The tags are updated once per interval across all workers
+
+_update_lock = asyncio.Lock()  # Single-flight: one tag update at a time within this worker
+
 
 # Function to fetch tags from StackOverflow API
-def fetch_stackoverflow_tags():
+async def fetch_stackoverflow_tags():
     """
     Fetches tags from the StackOverflow API and processes the data.
 
-    The function fetches tags from multiple pages of the API, up to the limit of MAX_PAGES.
-    In case of request failures, it retries up to MAX_RETRIES times with exponential backoff.
-    Tags are inserted into the database after fetching all pages.
+    The function fetches tags from multiple pages of the API, up to the limit of MAX_PAGES, with the app's shared
+    HTTP client. In case of request failures, it retries up to MAX_RETRIES times with exponential backoff.
+    Tags are inserted into the database (in a worker thread) after fetching all pages.
 
     Returns:
         A list of filtered tags (LanguageData objects) inserted into the database.
     """
     url_template = env.STACK_URL  # URL template with placeholders for the page number
+    client = http_client.get_client()
     page = 1  # Start from the first page
     filtered_tags = []  # List to store fetched tags
     total_fetched = 0  # Counter to keep track of the total number of fetched tags
@@ -34,13 +41,13 @@ def fetch_stackoverflow_tags():
     # Loop through pages, up to the allowed MAX_PAGES limit
     while page <= MAX_PAGES:
         url = url_template.format(page)  # Format the URL with the current page number
-        print(f"Fetching page {page} from StackOverflow API...")
+        logger.debug('Fetching page %s from StackOverflow API', page)
 
         retries = 0  # Initialize the retry counter for each page
         while retries < MAX_RETRIES:
             try:
                 # Send the request to StackOverflow API with a timeout of 10 seconds
-                response = requests.get(url, timeout=10)
+                response = await client.get(url, timeout=10)
 
                 # If the response status is not 200 (OK), raise an HTTPException
                 if response.status_code != 200:
@@ -59,7 +66,7 @@ def fetch_stackoverflow_tags():
 
                 # Track how many items were fetched from this page
                 total_fetched += len(data.get('items', []))
-                print(f"Fetched {len(data.get('items', []))} items, total fetched so far: {total_fetched}")
+                logger.debug('Fetched %s items, total fetched so far: %s', len(data.get('items', [])), total_fetched)
 
                 # Add each tag from the fetched items to the filtered_tags list
                 for item in data.get('items', []):
@@ -67,7 +74,6 @@ def fetch_stackoverflow_tags():
                     tag_count = item['count']  # Get the count of occurrences for this tag
                     language_data = LanguageData(tag=tag_name, count=tag_count)
                     filtered_tags.append(language_data)
-                    print(f"Found tag: {tag_name} with count: {tag_count}")
 
                 # Move to the next page
                 page += 1
@@ -75,31 +81,44 @@ def fetch_stackoverflow_tags():
                 # Handle API rate-limiting by honoring the 'backoff' time if provided
                 if 'backoff' in data:
                     backoff_time = data['backoff']
-                    print(f"Rate limited, backing off for {backoff_time} seconds")
-                    time.sleep(backoff_time)
+                    logger.warning('Rate limited, backing off for %s seconds', backoff_time)
+                    await asyncio.sleep(backoff_time)
 
                 # Break out of the retry loop if the request is successful
                 break
 
-            except requests.exceptions.RequestException as e:
+            except httpx.RequestError as e:
                 # Handle request-related exceptions (network errors, timeouts, etc.)
                 retries += 1
-                print(f"Request failed (attempt {retries}/{MAX_RETRIES}), error: {e}")
+                logger.warning('Request failed (attempt %s/%s): %s', retries, MAX_RETRIES, e)
                 if retries >= MAX_RETRIES:
                     # If maximum retries are exhausted, raise an exception
                     raise HTTPException(status_code=500, detail=f"Failed to fetch data after {MAX_RETRIES} retries.")
                 # Wait before retrying (exponential backoff)
-                time.sleep(RETRY_SLEEP_TIME * retries)
+                await asyncio.sleep(RETRY_SLEEP_TIME * retries)
+
+            except HTTPException:
+                raise
 
             except Exception as e:
                 # Handle unexpected errors
-                print(f"Unexpected error: {e}")
+                logger.exception('Unexpected error while fetching StackOverflow tags')
                 raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
-    print(f"Total tags fetched from page 1 to {MAX_PAGES}: {len(filtered_tags)}")
+    logger.info('Fetched %s tags from pages 1 to %s', len(filtered_tags), MAX_PAGES)
+
+    # Insert or update the fetched tags in the database, without blocking the event loop
+    return await asyncio.to_thread(store_tags, filtered_tags)
+
+
+def store_tags(filtered_tags: list[LanguageData]) -> list[LanguageData]:
+    """
+    Replaces the tags in the language_data collection with the fetched ones.
 
-    # Insert or update the fetched tags in the database
-    tags_dict = [tag.dict(by_alias=True) for tag in filtered_tags]  # Convert the tags to dictionary format for insertion
+    Returns:
+        The inserted tags.
+    """
+    tags_dict = [tag.model_dump(by_alias=True) for tag in filtered_tags]  # Convert the tags to dictionary format for insertion
 
     if tags_dict:  # Proceed only if there are tags to insert
         db.process.language_data.delete_many({})  # Clear old data in the language_data collection
@@ -112,32 +131,56 @@ def fetch_stackoverflow_tags():
                 {"$set": {"last_update": datetime.utcnow()}},
                 upsert=True  # If the document doesn't exist, create it
             )
-            print(f"Inserted {len(insert_result.inserted_ids)} tags into the database.")
+            logger.info('Inserted %s tags into the database', len(insert_result.inserted_ids))
             return filtered_tags  # Return the inserted tags
         else:
             # Handle database insertion failure
             raise HTTPException(status_code=500, detail="Failed to insert tags into the database.")
     else:
         # If no tags were found, raise an error
-        print("No tags found after pagination.")
+        logger.warning('No tags found after pagination')
         raise HTTPException(status_code=404, detail="No tags found.")
 
 
-# Function to trigger the update of tags in the database (runs in a thread to avoid blocking the event loop)
-async def update_tags_in_db():
-    print('Updating Stack Overflow tags in the database...')
-    try:
-        await asyncio.to_thread(fetch_stackoverflow_tags)  # Run the function in a separate thread
-        print('Tags updated successfully')
-    except Exception as e:
-        print(f'Error updating tags: {str(e)}')
+# Function to trigger the update of tags in the database
+async def update_tags_in_db(owner: str | None = None) -> bool:
+    """
+    Updates the Stack Overflow tags, unless another worker already did within TAGS_INTERVAL.
 
+    The worker holding the TAGS_JOB lease (see `src.services.leases`) runs the update; all others skip it. The
+    scheduler uses the default owner (the worker's `leases.instance_id()`), so it renews its own lease;
+    request-triggered runs pass `leases.call_owner()`, which can't renew a lease taken by an earlier run. Within a
+    process only one update runs at a time, concurrent calls are skipped. A failed update releases the lease, so the
+    next attempt of any worker retries it, and raises the error.
 
-# Function to start a background scheduler that updates the tags every 24 hours
+    Returns:
+        bool: True if the tags were updated, False if the update was skipped.
+    """
+    if _update_lock.locked():
+        logger.info('Skipping the Stack Overflow tag update, it is already running in this worker')
+        return False
+
+    async with _update_lock:
+        if not await asyncio.to_thread(leases.acquire, TAGS_JOB, TAGS_INTERVAL, owner):
+            logger.info('Skipping the Stack Overflow tag update, another worker holds the lease')
+            return False
+
+        logger.info('Updating Stack Overflow tags in the database')
+        try:
+            await fetch_stackoverflow_tags()
+        except Exception:
+            await asyncio.to_thread(leases.release, TAGS_JOB, owner)
+            raise
+    logger.info('Tags updated successfully')
+    return True
+
+
+# Function to schedule the update of the tags every 24 hours
 def start_scheduler():
     """
-    Starts the background scheduler that updates the Stack Overflow tags every 24 hours.
+    Schedules the Stack Overflow tag update every TAGS_INTERVAL (24 hours) on the app's event loop.
+
+    Every worker schedules the job, but only the one holding the tag update lease runs the update. Runs, durations
+    and the next run time are listed by GET /admin/jobs.
     """
-    scheduler = BackgroundScheduler()  # Initialize the scheduler
-    scheduler.add_job(lambda: asyncio.run(update_tags_in_db()), 'interval', hours=24)  # Schedule the job to run every 24 hours
-    scheduler.start()  # Start the scheduler
+    jobs.schedule(TAGS_JOB, update_tags_in_db, TAGS_INTERVAL)
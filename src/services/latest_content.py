@@ -0,0 +1,63 @@
+"""
+Most recent articles and QA across all technologies.
+
+With per-technology collections every collection returns its own newest `limit` documents (sorted by `datum_vnosa`,
+then `_id`, from an index), and the sorted streams are merged until `limit` documents are taken. With unified
+storage it is a single sorted query per kind. The result is cached until the next write to any article or QA
+collection.
+"""
+
+import datetime
+import heapq
+from itertools import islice
+
+from src.domain.latest_content import LatestArticle, LatestContent, LatestQA
+from src.services import cache, db
+from src.services.content_storage import NEWEST_FIRST, UNIFIED_ARTICLES, UNIFIED_QA, is_unified
+from src.services.technologies import ARTICLE_COLLECTIONS, QA_COLLECTIONS, TECHNOLOGIES, article_collection, \
+    qa_collection
+
+LATEST_CONTENT_MAX = 50  # Upper bound for `limit`, which also bounds the number of cache entries
+
+cache.depends_on('latest_content', ARTICLE_COLLECTIONS + QA_COLLECTIONS)
+
+
+def _newest(collection: str, limit: int, technology: str | None = None):
+    cursor = db.process[collection].find().sort(NEWEST_FIRST).limit(limit)
+    for document in cursor:
+        if technology is not None:
+            document['technology'] = technology
+        yield document
+
+
+def _sort_key(document: dict):
+    return document.get('datum_vnosa') or datetime.datetime.min, str(document['_id'])
+
+
+def newest_documents(kind: str, limit: int) -> list[dict]:
+    """
+    Returns the `limit` newest documents of one kind ('article' or 'qa') across all technologies, newest first.
+
+    Every document gets a `technology` field.
+    """
+    if is_unified():
+        return list(_newest(UNIFIED_ARTICLES if kind == 'article' else UNIFIED_QA, limit))
+
+    collection_for = article_collection if kind == 'article' else qa_collection
+    streams = [_newest(collection_for(technology), limit, technology) for technology in TECHNOLOGIES]
+    return list(islice(heapq.merge(*streams, key=_sort_key, reverse=True), limit))
+
+
+def latest_content(limit: int, kind: str | None = None) -> LatestContent:
+    """
+    Returns the `limit` newest articles and/or QA across all technologies, cached until the next write.
+    """
+    def compute():
+        content = LatestContent()
+        if kind in (None, 'article'):
+            content.articles = [LatestArticle(**document) for document in newest_documents('article', limit)]
+        if kind in (None, 'qa'):
+            content.qa = [LatestQA(**document) for document in newest_documents('qa', limit)]
+        return content
+
+    return cache.cached('latest_content', (kind, limit), compute)
@@ -0,0 +1,101 @@
+"""
+MongoDB leases that let only one worker run a periodic job.
+
+With several uvicorn/gunicorn workers (or several nodes) every process starts its own scheduler. Before a job runs,
+its process takes the job's lease: a document in the `scheduler_leases` collection naming the owner and until when the
+lease holds. Taking it is a single atomic upsert that only succeeds when the lease is free, expired or already owned
+by the same process; everyone else skips the run. The holder keeps the lease for the job's interval, so the job runs
+once per interval across all workers, and when the holder dies another worker takes over once the lease expires.
+
+Lease expiry is compared with each process's own clock, so the clocks of the nodes should be synchronized (NTP).
+
+Functions:
+- acquire: Takes or renews a lease.
+- release: Gives up a lease, so another worker may take it right away.
+- holder: Returns the current lease document of a job.
+- instance_id: Returns the owner id of this process.
+- call_owner: Returns an owner token for one run that shouldn't renew the process's leases.
+"""
+
+import datetime
+import logging
+import os
+import socket
+import uuid
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from src.services import db
+
+logger = logging.getLogger(__name__)
+
+LEASE_COLLECTION = 'scheduler_leases'
+
+# (pid, owner id) of this process; see instance_id
+_instance: tuple[int, str] | None = None
+
+
+def instance_id() -> str:
+    """
+    Returns the id identifying this process among all workers and nodes: `<host>:<pid>:<random>`.
+
+    It is created on first use in each process, not at import: with `gunicorn --preload` the app is imported in the
+    master before it forks, and an id computed there would be shared by every worker. The random part keeps ids
+    unique when a pid is reused (e.g. in containers, where every worker may be pid 1 of its own namespace).
+    """
+    global _instance
+    pid = os.getpid()
+    if _instance is None or _instance[0] != pid:
+        _instance = (pid, f'{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:12]}')
+    return _instance[1]
+
+
+def call_owner() -> str:
+    """
+    Returns a new owner token for a single run (e.g. one triggered by a request). Unlike `instance_id()` it never
+    matches a lease taken by an earlier run of the same process, so it can't renew that lease and run the job again
+    early.
+    """
+    return f'{instance_id()}:{uuid.uuid4().hex}'
+
+
+def acquire(name: str, ttl: datetime.timedelta, owner: str | None = None) -> bool:
+    """
+    Takes the lease `name` for `ttl` if it is free, expired or already held by `owner` (which renews it). The owner
+    defaults to this process (`instance_id()`).
+
+    Returns:
+        bool: True if `owner` holds the lease now, False if another owner holds an unexpired lease.
+    """
+    owner = owner or instance_id()
+    now = datetime.datetime.utcnow()
+    try:
+        lease = db.process[LEASE_COLLECTION].find_one_and_update(
+            {'_id': name, '$or': [{'expires_at': {'$lte': now}}, {'owner': owner}]},
+            {'$set': {'owner': owner, 'acquired_at': now, 'expires_at': now + ttl}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except DuplicateKeyError:
+        # The lease exists and is held by someone else, so the upsert tried to insert a second one
+        return False
+    return lease['owner'] == owner
+
+
+def release(name: str, owner: str | None = None) -> bool:
+    """
+    Releases the lease `name` if `owner` (by default this process) holds it.
+
+    Returns:
+        bool: True if the lease was released.
+    """
+    owner = owner or instance_id()
+    return db.process[LEASE_COLLECTION].delete_one({'_id': name, 'owner': owner}).deleted_count == 1
+
+
+def holder(name: str) -> dict | None:
+    """
+    Returns the lease document of `name` (owner, acquired_at, expires_at), or None if nobody ever took it.
+    """
+    return db.process[LEASE_COLLECTION].find_one({'_id': name})
@@ -0,0 +1,149 @@
+"""
+Structured, non-blocking logging.
+
+`configure` installs a single `QueueHandler` on the root logger: a log call only puts the record on an in-memory
+queue, while a `QueueListener` thread formats it and writes it to stdout. Request handlers therefore never block on
+log I/O. Every record gets the ID of the request it was logged in (`RequestIdMiddleware` takes it from the
+`X-Request-ID` header or generates one, and echoes it in the response), and records are written as JSON lines
+(`LOG_FORMAT=json`, default) or as plain text (`LOG_FORMAT=text`).
+
+Functions:
+- configure: Sets up the queue-based root handler (idempotent).
+- current_request_id: Returns the ID of the request being handled, or '-'.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from src import env
+
+REQUEST_ID_HEADER = 'x-request-id'
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s'
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is added to the JSON line
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'request_id'}
+
+_request_id: ContextVar[str] = ContextVar('request_id', default='-')
+_listener: QueueListener | None = None
+
+
+def current_request_id() -> str:
+    return _request_id.get()
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Adds the current request ID to every record; runs in the calling thread, before the record is queued.
+    """
+
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats a record as one JSON object per line, including fields passed with `extra=`.
+    """
+
+    def format(self, record):
+        line = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', '-'),
+            'message': record.getMessage(),
+        }
+        line.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        # Records from the queue carry the exception already formatted (see ExceptionQueueHandler)
+        exception = self.formatException(record.exc_info) if record.exc_info else record.exc_text
+        if exception:
+            line['exception'] = exception
+        return json.dumps(line, default=str, ensure_ascii=False)
+
+
+class ExceptionQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the exception of a record apart from its message.
+
+    `QueueHandler.prepare` formats the traceback into the message and drops `exc_info` (tracebacks can't cross the
+    queue). This handler formats the traceback into `exc_text` instead, so the JSON line still has an `exception`
+    field and the text format appends the traceback as usual.
+    """
+
+    def prepare(self, record):
+        exc_text = record.exc_text
+        if record.exc_info:
+            exc_text = exc_text or logging.Formatter().formatException(record.exc_info)
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+
+def configure(level: str = env.LOG_LEVEL, fmt: str = env.LOG_FORMAT):
+    """
+    Routes all logging through a queue to a background thread writing to stdout; calling it again is a no-op.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if fmt == 'json' else logging.Formatter(TEXT_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    handler = ExceptionQueueHandler(log_queue)
+    handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level.upper())
+
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+class RequestIdMiddleware:
+    """
+    Pure ASGI middleware binding a request ID to everything logged while the request is handled.
+
+    The ID is taken from the `X-Request-ID` header (so it can be correlated with a proxy) or generated, and is sent
+    back in the `X-Request-ID` response header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next(
+            (value.decode('latin-1')[:64] for name, value in scope['headers'] if name == REQUEST_ID_HEADER.encode()),
+            None,
+        ) or uuid.uuid4().hex
+
+        async def send_with_request_id(message):
+            if message['type'] == 'http.response.start':
+                message['headers'] = [*message.get('headers', []), (REQUEST_ID_HEADER.encode(), request_id.encode())]
+            await send(message)
+
+        token = _request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            _request_id.reset(token)
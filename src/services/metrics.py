@@ -0,0 +1,144 @@
+"""
+Request-level performance metrics in the Prometheus text format.
+
+`MetricsMiddleware` records, per route template (e.g. `/blog/{_id}`), the request latency, the number of requests in
+flight, the response size and the time spent in MongoDB. The Mongo time comes from pymongo command monitoring:
+`MongoCommandTimer` is registered on the client in `src.services.db` and adds the duration of every command to the
+request that issued it. `render` returns all metrics for the `/metrics` endpoint.
+"""
+
+import time
+from contextvars import ContextVar
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from pymongo import monitoring
+from starlette.routing import Match
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+ROUTE_CACHE_SIZE = 4096  # Resolved (method, path) -> route template entries kept before the cache is reset
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Time from receiving the request until the response is sent.',
+    ['method', 'route', 'status'], buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight', 'Requests currently being processed.', ['method', 'route'],
+)
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes', 'Size of the response body.', ['method', 'route'], buckets=SIZE_BUCKETS,
+)
+MONGO_TIME = Histogram(
+    'http_request_mongo_duration_seconds', 'Time spent in MongoDB commands per request.',
+    ['method', 'route'], buckets=LATENCY_BUCKETS,
+)
+MONGO_COMMANDS = Counter(
+    'http_request_mongo_commands_total', 'MongoDB commands issued while handling requests.', ['method', 'route'],
+)
+
+
+class _MongoTime:
+    __slots__ = ('seconds', 'commands')
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.commands = 0
+
+
+# Mongo time of the request being handled; a mutable holder, so commands run in the threadpool are counted too
+_request_mongo_time: ContextVar[_MongoTime | None] = ContextVar('request_mongo_time', default=None)
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """
+    pymongo command listener that adds the duration of every command to the current request's Mongo time.
+    """
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event)
+
+    def failed(self, event):
+        self._record(event)
+
+    @staticmethod
+    def _record(event):
+        mongo_time = _request_mongo_time.get()
+        if mongo_time is not None:
+            mongo_time.seconds += event.duration_micros / 1_000_000
+            mongo_time.commands += 1
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency, in-flight requests, response size and Mongo time per route template.
+
+    Paths are resolved to their route template against the app's router (cached per method and path), so metrics
+    stay grouped by route instead of by concrete URL.
+    """
+
+    def __init__(self, app, router):
+        self.app = app
+        self.router = router
+        self._routes: dict[tuple[str, str], str] = {}
+
+    def _route(self, scope) -> str:
+        key = (scope['method'], scope['path'])
+        route = self._routes.get(key)
+        if route is None:
+            route = 'unmatched'
+            for candidate in self.router.routes:
+                match, _ = candidate.matches(scope)
+                if match == Match.FULL:
+                    route = candidate.path
+                    break
+                if match == Match.PARTIAL and route == 'unmatched':
+                    route = candidate.path
+            if len(self._routes) >= ROUTE_CACHE_SIZE:
+                self._routes.clear()
+            self._routes[key] = route
+        return route
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        route = self._route(scope)
+        status = 500
+        size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status, size
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body':
+                size += len(message.get('body', b''))
+            await send(message)
+
+        mongo_time = _MongoTime()
+        token = _request_mongo_time.set(mongo_time)
+        in_flight = REQUESTS_IN_FLIGHT.labels(method, route)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight.dec()
+            _request_mongo_time.reset(token)
+
+            REQUEST_LATENCY.labels(method, route, str(status)).observe(elapsed)
+            RESPONSE_SIZE.labels(method, route).observe(size)
+            MONGO_TIME.labels(method, route).observe(mongo_time.seconds)
+            MONGO_COMMANDS.labels(method, route).inc(mongo_time.commands)
+
+
+def render() -> tuple[bytes, str]:
+    """
+    Returns all metrics in the Prometheus text exposition format, with the matching content type.
+    """
+    return generate_latest(), CONTENT_TYPE_LATEST
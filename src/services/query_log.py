@@ -0,0 +1,196 @@
+"""
+MongoDB command monitoring and slow-query log.
+
+`QueryLogListener` is a pymongo command listener registered on the client in `src.services.db`. For every command it
+records the latency per (collection, command), both as a Prometheus histogram and as in-memory totals. Commands slower
+than `SLOW_QUERY_MS` are added to a bounded ring buffer with the shape of their filter (values replaced by `?`), and
+their query plan is explained once per shape in the background, which tells whether the query used a COLLSCAN.
+
+Functions:
+- filter_shape: Replaces the values of a filter with `?`, keeping its structure.
+- slow_queries: Returns the ring buffer, newest first.
+- command_stats: Returns the latency totals per (collection, command), slowest total first.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from prometheus_client import Histogram
+from pymongo import monitoring
+
+from src import env
+from src.services import db
+from src.services.metrics import LATENCY_BUCKETS
+
+# Commands that can be explained, and where their filter is found
+EXPLAINABLE = {
+    'find': lambda command: command.get('filter', {}),
+    'count': lambda command: command.get('query', {}),
+    'distinct': lambda command: command.get('query', {}),
+    'findAndModify': lambda command: command.get('query', {}),
+    'aggregate': lambda command: command.get('pipeline', []),
+    'update': lambda command: [update.get('q', {}) for update in command.get('updates', [])],
+    'delete': lambda command: [delete.get('q', {}) for delete in command.get('deletes', [])],
+}
+
+COMMAND_LATENCY = Histogram(
+    'mongo_command_duration_seconds', 'Latency of MongoDB commands.', ['collection', 'command'],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def filter_shape(value):
+    """
+    Replaces every value in a filter (or pipeline) with `?`, keeping field names and operators.
+
+    Example:
+        {'tag': {'$in': ['python', 'vue']}, '_id': 'abc'} -> {'tag': {'$in': ['?']}, '_id': '?'}
+    """
+    if isinstance(value, dict):
+        return {key: filter_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = filter_shape(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return '?'
+
+
+def _plan_stages(explain: dict) -> list[str]:
+    """
+    Collects the stage names of every winning plan in an explain output (find and aggregate layouts).
+    """
+    stages = []
+
+    def walk(node, in_plan=False):
+        if isinstance(node, dict):
+            if in_plan and 'stage' in node:
+                stages.append(node['stage'])
+            for key, item in node.items():
+                walk(item, in_plan or key == 'winningPlan')
+        elif isinstance(node, list):
+            for item in node:
+                walk(item, in_plan)
+
+    walk(explain)
+    return stages
+
+
+class QueryLogListener(monitoring.CommandListener):
+    """
+    pymongo command listener keeping per-(collection, command) latency totals and a ring buffer of slow commands.
+    """
+
+    def __init__(self, threshold_ms: int = env.SLOW_QUERY_MS, size: int = env.SLOW_QUERY_LOG_SIZE):
+        self.threshold_micros = threshold_ms * 1000
+        self.entries: deque[dict] = deque(maxlen=size)
+        self.stats: dict[tuple[str, str], dict] = {}
+        self._started: dict[tuple, tuple[str, str, dict]] = {}  # (connection, request_id) -> started command
+        self._plans: dict[tuple[str, str, str], dict] = {}  # (collection, command, shape) -> explained plan
+        self._lock = threading.Lock()
+        self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='query-explain')
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if event.command_name == 'getMore':
+            collection = event.command.get('collection')
+        self._started[(event.connection_id, event.request_id)] = (
+            collection if isinstance(collection, str) else '-', event.database_name, event.command,
+        )
+
+    def succeeded(self, event):
+        self._record(event)
+
+    def failed(self, event):
+        self._record(event)
+
+    def _record(self, event):
+        started = self._started.pop((event.connection_id, event.request_id), None)
+        if started is None or event.command_name == 'explain':
+            return
+        collection, database, command = started
+
+        COMMAND_LATENCY.labels(collection, event.command_name).observe(event.duration_micros / 1_000_000)
+        with self._lock:
+            stats = self.stats.setdefault((collection, event.command_name), {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stats['count'] += 1
+            stats['total_ms'] += event.duration_micros / 1000
+            stats['max_ms'] = max(stats['max_ms'], event.duration_micros / 1000)
+
+        if event.duration_micros >= self.threshold_micros:
+            self._log_slow(event, collection, database, command)
+
+    def _log_slow(self, event, collection: str, database: str, command: dict):
+        filter_of = EXPLAINABLE.get(event.command_name)
+        shape = filter_shape(filter_of(command)) if filter_of else None
+        entry = {
+            'at': time.time(),
+            'database': database,
+            'collection': collection,
+            'command': event.command_name,
+            'duration_ms': round(event.duration_micros / 1000, 3),
+            'filter_shape': shape,
+            'plan': None,
+            'collscan': None,
+        }
+        self.entries.append(entry)
+
+        if filter_of is not None:
+            key = (collection, event.command_name, repr(shape))
+            plan = self._plans.get(key)
+            if plan is None:
+                self._plans[key] = plan = {'stages': None}
+                self._explainer.submit(self._explain, database, command, plan)
+            entry['plan'] = plan
+
+    @staticmethod
+    def _explain(database: str, command: dict, plan: dict):
+        explainable = {key: value for key, value in command.items()
+                       if not key.startswith('$') and key not in ('lsid', 'txnNumber')}
+        try:
+            explain = db.client[database].command('explain', explainable, verbosity='queryPlanner')
+            plan['stages'] = _plan_stages(explain)
+        except Exception as e:
+            plan['error'] = str(e)
+
+    def slow_queries(self) -> list[dict]:
+        """
+        Returns the logged slow commands, newest first, with their plan stages and COLLSCAN flag once explained.
+        """
+        queries = []
+        for entry in reversed(self.entries):
+            plan = entry['plan'] or {}
+            stages = plan.get('stages')
+            queries.append({
+                **entry,
+                'plan': stages,
+                'collscan': 'COLLSCAN' in stages if stages is not None else None,
+            })
+        return queries
+
+    def command_stats(self) -> list[dict]:
+        """
+        Returns the latency totals per (collection, command), slowest total first.
+        """
+        with self._lock:
+            rows = [
+                {'collection': collection, 'command': command, **stats,
+                 'avg_ms': round(stats['total_ms'] / stats['count'], 3)}
+                for (collection, command), stats in self.stats.items()
+            ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+
+listener = QueryLogListener()
+
+
+def slow_queries() -> list[dict]:
+    return listener.slow_queries()
+
+
+def command_stats() -> list[dict]:
+    return listener.command_stats()
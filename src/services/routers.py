@@ -4,7 +4,8 @@
 
 # General routes (index, blog, etc.)
 from src.routes import (
-    index, blog, login, experiences, links, contact, projects, github, book, language, dev_to_api, user
+    index, blog, login, experiences, links, contact, projects, github, book, language, dev_to_api, user, search, content,
+    admin, stats
 )
 
 # QA (Questions & Answers) routes for different technologies
@@ -103,6 +104,16 @@ routers = [
     # -------------------------
     (language.router, '/language', ['Language']),
 
+    # -------------------------
+    # Search across all article and QA collections
+    # -------------------------
+    (search.router, '/search', ['Search']),
+
+    # -------------------------
+    # Cross-technology content (latest articles and QA)
+    # -------------------------
+    (content.router, '/content', ['Content']),
+
     # -------------------------
     # Other resource routes
     # -------------------------
@@ -112,4 +123,6 @@ routers = [
     (user.router, '/user', ['User']),  # User management
     (login.router, '/login', ['Login']),  # Authentication/login
     (contact.router, '/contact', ['Contact']),  # Contact form/messages
+    (admin.router, '/admin', ['Admin']),  # Admin panel and database diagnostics
+    (stats.router, '/stats', ['Stats']),  # Content counts for the admin dashboard
 ]
@@ -0,0 +1,202 @@
+"""
+Full-text search across the blog and all article and QA collections.
+
+The `blog` collection and every `<technology>_articles` and `<technology>_qa` collection get a MongoDB text index.
+A search runs the `$text` query against every targeted collection concurrently, merges the hits by their
+`textScore` and returns one page of results with a highlighted snippet for each hit.
+
+Functions:
+- search_targets: Lists the logical (kind, technology, collection) triples a search runs against.
+- ensure_text_indexes: Creates the text index on every searchable collection (idempotent).
+- search: Runs a ranked, paginated search across the targeted collections.
+- highlight: Builds a short snippet around the first matching term and wraps the matches in <mark> tags.
+"""
+
+import contextvars
+import heapq
+import html
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from pymongo import TEXT
+
+from src.domain.search import SearchHit, SearchResponse
+from src.services import db
+from src.services.content_storage import resolve
+from src.services.technologies import TECHNOLOGIES, article_collection, qa_collection
+
+TEXT_INDEX_NAME = 'content_text'
+
+# Indexed fields and their weights per content kind; the first field is used as the hit title and the last one
+# as the snippet source
+TEXT_INDEX_FIELDS = {
+    'article': {'title': 10, 'subtitle': 5, 'content': 1},
+    'qa': {'question': 5, 'answer': 1},
+    'blog': {'title': 10, 'podnaslov': 5, 'vsebina': 1},
+}
+
+SNIPPET_WIDTH = 160  # Number of characters shown around the first match
+
+# Shared pool so the per-collection queries of one search run concurrently; each query runs in a copy of the caller's
+# context, so its Mongo time counts toward the request's metrics and its logs carry the request ID
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='search')
+
+
+def search_targets(kind: str | None = None, technology: str | None = None) -> list[tuple[str, str | None, str]]:
+    """
+    Returns the (kind, technology, collection) triples to search, optionally narrowed to one kind and/or technology.
+
+    The blog isn't tied to a technology, so it is left out whenever a technology is requested.
+    """
+    targets = []
+    if kind in (None, 'article'):
+        targets += [('article', t, article_collection(t)) for t in TECHNOLOGIES if technology in (None, t)]
+    if kind in (None, 'qa'):
+        targets += [('qa', t, qa_collection(t)) for t in TECHNOLOGIES if technology in (None, t)]
+    if kind in (None, 'blog') and technology is None:
+        targets.append(('blog', None, 'blog'))
+    return targets
+
+
+def _physical_targets(targets: list[tuple[str, str | None, str]]) -> list[tuple[str, str | None, str, dict]]:
+    """
+    Maps logical targets to the (kind, technology, physical collection, filter) queries that cover them.
+
+    With `CONTENT_STORAGE=unified` all technologies of one kind share a collection, so they are covered by a single
+    query; the technology of a hit is then read from the document itself.
+    """
+    grouped: dict[tuple[str, str], list[tuple[str | None, dict]]] = {}
+    for kind, technology, collection in targets:
+        physical, base_filter = resolve(collection)
+        grouped.setdefault((kind, physical), []).append((technology, base_filter))
+
+    queries = []
+    for (kind, physical), members in grouped.items():
+        if len(members) == 1:
+            technology, base_filter = members[0]
+            queries.append((kind, technology, physical, base_filter))
+        else:
+            technologies = [technology for technology, _ in members]
+            base_filter = {} if len(technologies) == len(TECHNOLOGIES) else {'technology': {'$in': technologies}}
+            queries.append((kind, None, physical, base_filter))
+    return queries
+
+
+def ensure_text_indexes():
+    """
+    Creates the weighted text index on the blog and every article and QA collection.
+
+    The content is written in Slovenian, which MongoDB can't stem, so the index uses `default_language='none'`
+    (plain tokenization without stemming or stop words). Creating an index that already exists is a no-op.
+    """
+    for kind, _, collection, _ in _physical_targets(search_targets()):
+        fields = TEXT_INDEX_FIELDS[kind]
+        db.process[collection].create_index(
+            [(field, TEXT) for field in fields],
+            weights=fields,
+            default_language='none',
+            name=TEXT_INDEX_NAME,
+        )
+
+
+def _terms(query: str) -> list[str]:
+    """
+    Extracts the plain search terms from a `$search` string, ignoring negations and quote characters.
+    """
+    return [term.strip('"').lower() for term in query.split() if term.strip('"') and not term.startswith('-')]
+
+
+def highlight(text: str, terms: list[str], width: int = SNIPPET_WIDTH) -> str:
+    """
+    Returns an HTML-escaped snippet of `text` around the first matching term, with every match wrapped in <mark>.
+
+    Parameters:
+        text (str): The full text of the field used as the snippet source.
+        terms (list[str]): Lower-cased search terms.
+        width (int): Approximate number of characters in the snippet.
+
+    Returns:
+        str: The highlighted snippet, prefixed/suffixed with an ellipsis when the text was cut.
+    """
+    if not terms:
+        return html.escape(text[:width])
+
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(text)
+    start = max(0, match.start() - width // 3) if match else 0
+    end = min(len(text), start + width)
+    window = text[start:end]
+
+    snippet = ''
+    last = 0
+    for found in pattern.finditer(window):
+        snippet += html.escape(window[last:found.start()]) + f'<mark>{html.escape(found.group())}</mark>'
+        last = found.end()
+    snippet += html.escape(window[last:])
+
+    return ('…' if start > 0 else '') + snippet + ('…' if end < len(text) else '')
+
+
+def _search_collection(kind: str, technology: str | None, collection_name: str, base_filter: dict, query: str,
+                       limit: int):
+    """
+    Runs the `$text` query against one collection and returns (total matches, top `limit` scored documents).
+    """
+    collection = db.process[collection_name]
+    text_filter = {'$text': {'$search': query}, **base_filter}
+    fields = TEXT_INDEX_FIELDS[kind]
+    projection = {'score': {'$meta': 'textScore'}, 'datum_vnosa': 1, 'technology': 1, **{field: 1 for field in fields}}
+
+    cursor = collection.find(text_filter, projection).sort([('score', {'$meta': 'textScore'})]).limit(limit)
+    documents = list(cursor)
+    total = collection.count_documents(text_filter) if len(documents) == limit else len(documents)
+    return total, [(kind, technology or document.get('technology'), document) for document in documents]
+
+
+def search(query: str, kind: str | None = None, technology: str | None = None, page: int = 1,
+           page_size: int = 10) -> SearchResponse:
+    """
+    Searches the blog and all article and QA collections (or only the given kind / technology) and returns one
+    ranked page.
+
+    Each targeted collection returns at most `page * page_size` best hits, so the merged ranking of the requested
+    page is exact while no collection is read past what the page needs.
+
+    Parameters:
+        query (str): The search string, in MongoDB `$search` syntax (phrases in quotes, `-term` to exclude).
+        kind (str | None): Restrict the search to 'article', 'qa' or 'blog'.
+        technology (str | None): Restrict the search to one technology (e.g. 'python').
+        page (int): 1-based page number.
+        page_size (int): Number of hits per page.
+
+    Returns:
+        SearchResponse: The requested page of hits ordered by descending score, plus the total number of hits.
+    """
+    limit = page * page_size
+
+    queries = _physical_targets(search_targets(kind, technology))
+    futures = [
+        _executor.submit(contextvars.copy_context().run, _search_collection, target_kind, target_technology,
+                         collection, base_filter, query, limit)
+        for target_kind, target_technology, collection, base_filter in queries
+    ]
+    results = [future.result() for future in futures]
+
+    total = sum(count for count, _ in results)
+    ranked = heapq.nlargest(limit, (hit for _, hits in results for hit in hits), key=lambda hit: hit[2]['score'])
+
+    terms = _terms(query)
+    hits = []
+    for hit_kind, hit_technology, document in ranked[(page - 1) * page_size:]:
+        fields = list(TEXT_INDEX_FIELDS[hit_kind])
+        hits.append(SearchHit(
+            _id=str(document['_id']),
+            kind=hit_kind,
+            technology=hit_technology,
+            title=document.get(fields[0], ''),
+            snippet=highlight(document.get(fields[-1], ''), terms),
+            score=document['score'],
+            datum_vnosa=document.get('datum_vnosa'),
+        ))
+
+    return SearchResponse(query=query, page=page, page_size=page_size, total=total, results=hits)
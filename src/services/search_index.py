@@ -0,0 +1,287 @@
+"""
+In-memory inverted index with BM25 ranking over the blog and all article and QA collections.
+
+This is the `SEARCH_BACKEND=memory` alternative to the MongoDB text indexes in `src.services.search`. The index is
+built once at startup (`build`) and kept up to date by the write helpers in `src.utils.router_helpers`
+(`index_document` / `remove_document`), so a search never touches the database.
+
+Posting lists are stored as pairs of `array` objects (document numbers and term frequencies) instead of lists of
+Python ints. Replaced or deleted documents are tombstoned and dropped from the posting lists on the next compaction.
+
+Functions:
+- tokenize: Splits text into lower-cased alphanumeric tokens using nltk.
+- build: Builds the index from the database (called on startup).
+- index_document: Adds or replaces one document in the index.
+- remove_document: Removes one document from the index.
+- search: Runs a ranked, paginated BM25 search and returns the same response as the MongoDB backend.
+"""
+
+import heapq
+import math
+import threading
+from array import array
+from operator import itemgetter
+
+from src.domain.search import SearchHit, SearchResponse
+from src.services import db
+from src.services.content_storage import resolve
+from src.services.search import TEXT_INDEX_FIELDS, highlight, search_targets
+
+K1 = 1.2  # BM25 term frequency saturation
+B = 0.75  # BM25 document length normalization
+MAX_TERM_FREQUENCY = 65535  # Term frequencies are stored as unsigned shorts
+COMPACT_MIN_TOMBSTONES = 64  # Compact once at least this many documents are tombstoned...
+COMPACT_RATIO = 0.25  # ...and they make up at least this share of all stored documents
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits text into lower-cased alphanumeric tokens (punctuation is dropped, letters like č/š/ž are kept).
+    """
+    from nltk.tokenize import wordpunct_tokenize  # nltk takes ~0.3 s to import; only the memory backend needs it
+
+    return [token for token in wordpunct_tokenize(text.lower()) if token.isalnum()]
+
+
+class InvertedIndex:
+    """
+    Inverted index with compact, array-backed posting lists and BM25 scoring.
+
+    Documents are identified by a (collection, _id) key and internally by a document number, which is the position
+    of the document in the per-document arrays. A document is added with a list of (text, weight) fields; a token in
+    a field with weight 10 counts as 10 occurrences, so matches in titles rank above matches in the body.
+    """
+
+    def __init__(self, k1: float = K1, b: float = B):
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, tuple[array, array]] = {}  # term -> (document numbers, term frequencies)
+        self._df: dict[str, int] = {}  # term -> number of live documents containing it
+        self._keys: list[tuple[str, str] | None] = []  # document number -> key, None once tombstoned
+        self._terms: list[tuple[str, ...] | None] = []  # document number -> distinct terms, for df bookkeeping
+        self._stored: list[dict | None] = []  # document number -> stored fields returned with a hit
+        self._lengths = array('I')  # document number -> weighted token count
+        self._numbers: dict[tuple[str, str], int] = {}  # key -> document number of live documents
+        self._total_length = 0
+        self._tombstones = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._numbers)
+
+    def add(self, collection: str, _id: str, fields: list[tuple[str, int]], stored: dict):
+        """
+        Adds a document to the index, replacing the previous version of the same (collection, _id) if present.
+        """
+        frequencies: dict[str, int] = {}
+        length = 0
+        for text, weight in fields:
+            for token in tokenize(text):
+                frequencies[token] = frequencies.get(token, 0) + weight
+                length += weight
+
+        with self._lock:
+            self._remove((collection, _id))
+
+            number = len(self._keys)
+            self._keys.append((collection, _id))
+            self._terms.append(tuple(frequencies))
+            self._stored.append(stored)
+            self._lengths.append(length)
+            self._numbers[(collection, _id)] = number
+            self._total_length += length
+
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array('I'), array('H'))
+                postings[0].append(number)
+                postings[1].append(min(frequency, MAX_TERM_FREQUENCY))
+                self._df[term] = self._df.get(term, 0) + 1
+
+    def remove(self, collection: str, _id: str):
+        """
+        Removes a document from the index; unknown keys are ignored.
+        """
+        with self._lock:
+            self._remove((collection, _id))
+
+    def search(self, query: str, collections: set[str] | None = None, limit: int = 10):
+        """
+        Scores the documents matching any term of the query with BM25.
+
+        Words prefixed with `-` exclude every document containing them. Only documents stored under one of
+        `collections` are considered when it is given.
+
+        Returns:
+            tuple[int, list[tuple[float, tuple[str, str], dict]]]: The number of matching documents and the
+            `limit` best (score, key, stored fields) triples ordered by descending score.
+        """
+        words = query.split()
+        terms = set(tokenize(' '.join(word for word in words if not word.startswith('-'))))
+        excluded_terms = set(tokenize(' '.join(word[1:] for word in words if word.startswith('-'))))
+
+        with self._lock:
+            if not self._numbers:
+                return 0, []
+
+            document_count = len(self._numbers)
+            average_length = self._total_length / document_count or 1
+
+            excluded = set()
+            for term in excluded_terms:
+                if term in self._postings:
+                    excluded.update(self._postings[term][0])
+
+            scores: dict[int, float] = {}
+            for term in terms:
+                df = self._df.get(term)
+                if not df:
+                    continue
+                idf = math.log(1 + (document_count - df + 0.5) / (df + 0.5))
+                numbers, frequencies = self._postings[term]
+                for number, frequency in zip(numbers, frequencies):
+                    key = self._keys[number]
+                    if key is None or number in excluded or (collections is not None and key[0] not in collections):
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[number] / average_length)
+                    scores[number] = scores.get(number, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+            best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+            return len(scores), [(score, self._keys[number], self._stored[number]) for number, score in best]
+
+    def _remove(self, key: tuple[str, str]):
+        number = self._numbers.pop(key, None)
+        if number is None:
+            return
+
+        for term in self._terms[number]:
+            self._df[term] -= 1
+            if not self._df[term]:
+                del self._df[term]
+
+        self._total_length -= self._lengths[number]
+        self._keys[number] = None
+        self._terms[number] = None
+        self._stored[number] = None
+        self._tombstones += 1
+
+        if self._tombstones >= COMPACT_MIN_TOMBSTONES and self._tombstones >= COMPACT_RATIO * len(self._keys):
+            self._compact()
+
+    def _compact(self):
+        """
+        Renumbers the live documents and rewrites every posting list without the tombstoned documents.
+        """
+        renumbered = {}
+        keys, terms, stored, lengths = [], [], [], array('I')
+        for number, key in enumerate(self._keys):
+            if key is None:
+                continue
+            renumbered[number] = len(keys)
+            keys.append(key)
+            terms.append(self._terms[number])
+            stored.append(self._stored[number])
+            lengths.append(self._lengths[number])
+
+        for term, (numbers, frequencies) in list(self._postings.items()):
+            live_numbers, live_frequencies = array('I'), array('H')
+            for number, frequency in zip(numbers, frequencies):
+                if number in renumbered:
+                    live_numbers.append(renumbered[number])
+                    live_frequencies.append(frequency)
+            if live_numbers:
+                self._postings[term] = (live_numbers, live_frequencies)
+            else:
+                del self._postings[term]
+
+        self._keys, self._terms, self._stored, self._lengths = keys, terms, stored, lengths
+        self._numbers = {key: number for number, key in enumerate(keys)}
+        self._tombstones = 0
+
+
+index = InvertedIndex()
+_built = False
+
+# collection -> (kind, technology) for every searchable collection
+_TARGETS = {collection: (kind, technology) for kind, technology, collection in search_targets()}
+
+
+def _add(target: InvertedIndex, collection: str, document: dict):
+    fields = TEXT_INDEX_FIELDS[_TARGETS[collection][0]]
+    names = list(fields)
+    target.add(
+        collection,
+        str(document['_id']),
+        [(str(document.get(name) or ''), weight) for name, weight in fields.items()],
+        {'title': document.get(names[0], ''), 'text': document.get(names[-1], ''),
+         'datum_vnosa': document.get('datum_vnosa')},
+    )
+
+
+def build():
+    """
+    Builds a fresh index from the blog and every article and QA collection and swaps it in.
+    """
+    global index, _built
+
+    fresh = InvertedIndex()
+    for kind, _, collection in search_targets():
+        projection = {field: 1 for field in TEXT_INDEX_FIELDS[kind]} | {'datum_vnosa': 1}
+        physical, base_filter = resolve(collection)
+        for document in db.process[physical].find(base_filter, projection):
+            _add(fresh, collection, document)
+
+    index = fresh
+    _built = True
+
+
+def index_document(collection: str, document: dict):
+    """
+    Adds or replaces a document after it was written; a no-op until the index is built or for other collections.
+    """
+    if _built and collection in _TARGETS:
+        _add(index, collection, document)
+
+
+def remove_document(collection: str, _id: str):
+    """
+    Removes a document after it was deleted; a no-op until the index is built or for other collections.
+    """
+    if _built and collection in _TARGETS:
+        index.remove(collection, str(_id))
+
+
+def search(query: str, kind: str | None = None, technology: str | None = None, page: int = 1,
+           page_size: int = 10) -> SearchResponse:
+    """
+    Searches the in-memory index (optionally narrowed to one kind / technology) and returns one ranked page.
+
+    Parameters:
+        query (str): The search string; words prefixed with `-` exclude documents containing them.
+        kind (str | None): Restrict the search to 'article', 'qa' or 'blog'.
+        technology (str | None): Restrict the search to one technology (e.g. 'python').
+        page (int): 1-based page number.
+        page_size (int): Number of hits per page.
+
+    Returns:
+        SearchResponse: The requested page of hits ordered by descending BM25 score, plus the total number of hits.
+    """
+    collections = {collection for _, _, collection in search_targets(kind, technology)}
+    total, ranked = index.search(query, collections, page * page_size)
+
+    terms = tokenize(' '.join(word for word in query.split() if not word.startswith('-')))
+    hits = []
+    for score, (collection, _id), stored in ranked[(page - 1) * page_size:]:
+        hit_kind, hit_technology = _TARGETS[collection]
+        hits.append(SearchHit(
+            _id=_id,
+            kind=hit_kind,
+            technology=hit_technology,
+            title=stored['title'],
+            snippet=highlight(stored['text'], terms),
+            score=score,
+            datum_vnosa=stored['datum_vnosa'],
+        ))
+
+    return SearchResponse(query=query, page=page, page_size=page_size, total=total, results=hits)
@@ -0,0 +1,138 @@
+"""
+Pre-aggregated content counters, so dashboards get counts without scanning collections.
+
+The counters live in a single document (`_id: 'counters'`) of the `stats` collection:
+
+- `collections.<collection>`: documents per content collection (blog, book, ... and every article / QA collection)
+- `subscribers.confirmed`, `subscribers.pending`: newsletter subscribers by confirmation
+- `messages.received`: messages sent through the contact form
+
+The write paths keep them current with `$inc` (`add_data` / `delete_data`, the subscriber and contact routes), so
+reading the counts is one document read. `rebuild` recounts everything from the collections; it runs after the bulk
+writes that bypass those paths (seeding, the synthetic fill and the storage migrations), when the counters document
+doesn't exist yet (the increments don't create it) and on demand to repair drift caused by other direct writes.
+
+Functions:
+- count_document: Counts a document added to (1) or deleted from (-1) a content collection.
+- count_subscriber: Counts a subscriber added or deleted.
+- move_subscriber: Moves a subscriber between pending and confirmed.
+- count_message: Counts a received contact message.
+- rebuild: Recounts every counter from the collections.
+- counters: Returns the counts, grouped for the /stats endpoint.
+
+Run `python -m src.services.stats` to rebuild the counters of an existing database.
+"""
+
+import datetime
+
+from src.services import content_storage, db
+from src.services.technologies import ARTICLE_COLLECTIONS, QA_COLLECTIONS, TECHNOLOGIES, article_collection, \
+    qa_collection
+
+STATS_COLLECTION = 'stats'
+COUNTERS_ID = 'counters'
+
+# Content collections with a document counter (the collections written through add_data / delete_data)
+CONTENT_COLLECTIONS = ['blog', 'book', 'experiences', 'links', 'projects']
+COUNTED_COLLECTIONS = [*CONTENT_COLLECTIONS, *ARTICLE_COLLECTIONS, *QA_COLLECTIONS]
+
+SUBSCRIBER_COLLECTION = 'subscriber'
+MESSAGE_COLLECTION = 'email'  # Where the contact route stores the received messages
+
+
+def _increment(increments: dict[str, int]):
+    # No upsert: without a counters document there is nothing to keep current, `counters` rebuilds it when read
+    db.process[STATS_COLLECTION].update_one(
+        {'_id': COUNTERS_ID},
+        {'$inc': increments, '$set': {'updated_at': datetime.datetime.now()}},
+    )
+
+
+def count_document(collection: str, amount: int = 1):
+    """
+    Adds `amount` to the document counter of `collection`; collections without a counter are ignored.
+    """
+    if collection in COUNTED_COLLECTIONS:
+        _increment({f'collections.{collection}': amount})
+
+
+def count_subscriber(confirmed: bool, amount: int = 1):
+    """
+    Adds `amount` to the confirmed or pending subscribers.
+    """
+    _increment({f"subscribers.{'confirmed' if confirmed else 'pending'}": amount})
+
+
+def move_subscriber(confirmed: bool):
+    """
+    Moves one subscriber to confirmed (`confirmed=True`) or back to pending.
+    """
+    _increment({'subscribers.confirmed': 1 if confirmed else -1, 'subscribers.pending': -1 if confirmed else 1})
+
+
+def count_message(amount: int = 1):
+    """
+    Adds `amount` to the received contact messages.
+    """
+    _increment({'messages.received': amount})
+
+
+def rebuild() -> dict:
+    """
+    Recounts every counter from the collections (one count per collection) and replaces the counters document.
+
+    Returns:
+        dict: The new counters document.
+    """
+    collections = {}
+    for collection in COUNTED_COLLECTIONS:
+        physical, base_filter = content_storage.resolve(collection)
+        collections[collection] = db.process[physical].count_documents(base_filter)
+
+    subscribers = db.process[SUBSCRIBER_COLLECTION]
+    confirmed = subscribers.count_documents({'confirmed': True})
+    now = datetime.datetime.now()
+    document = {
+        '_id': COUNTERS_ID,
+        'collections': collections,
+        'subscribers': {'confirmed': confirmed, 'pending': subscribers.count_documents({}) - confirmed},
+        'messages': {'received': db.process[MESSAGE_COLLECTION].count_documents({})},
+        'rebuilt_at': now,
+        'updated_at': now,
+    }
+    db.process[STATS_COLLECTION].replace_one({'_id': COUNTERS_ID}, document, upsert=True)
+    return document
+
+
+def counters() -> dict:
+    """
+    Returns the counts with one document read (rebuilding the counters first if they don't exist yet):
+
+        {
+            'articles': {'total': 120, 'by_technology': {'python': 10, ...}},
+            'qa': {'total': 90, 'by_technology': {'python': 8, ...}},
+            'content': {'blog': 12, 'book': 3, ...},
+            'subscribers': {'confirmed': 40, 'pending': 2, 'total': 42},
+            'messages': {'received': 17},
+            'updated_at': datetime,
+        }
+    """
+    document = db.process[STATS_COLLECTION].find_one({'_id': COUNTERS_ID}) or rebuild()
+    collections = document['collections']
+    articles = {technology: collections.get(article_collection(technology), 0) for technology in TECHNOLOGIES}
+    qa = {technology: collections.get(qa_collection(technology), 0) for technology in TECHNOLOGIES}
+    subscribers = document['subscribers']
+    return {
+        'articles': {'total': sum(articles.values()), 'by_technology': articles},
+        'qa': {'total': sum(qa.values()), 'by_technology': qa},
+        'content': {collection: collections.get(collection, 0) for collection in CONTENT_COLLECTIONS},
+        'subscribers': {**subscribers, 'total': subscribers['confirmed'] + subscribers['pending']},
+        'messages': document['messages'],
+        'updated_at': document['updated_at'],
+    }
+
+
+if __name__ == '__main__':
+    counts = rebuild()
+    print(f"Rebuilt the counters of {len(counts['collections'])} collections, {counts['subscribers']} subscribers "
+          f"and {counts['messages']['received']} messages")
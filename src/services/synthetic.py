@@ -0,0 +1,249 @@
+"""
+Synthetic data generator for load and performance testing.
+
+Fills the blog, book, projects, every article and QA collection, `language_data` and `subscriber` with configurable
+volumes of generated documents. Documents have the fields of their domain model and realistic sizes (articles of a few
+KB, blog posts of ~5 KB of HTML, QA answers of ~1 KB) with spread-out `datum_vnosa` values, so sorting, paging and
+streaming behave like on a real database. Documents are generated lazily and inserted in unordered `insert_many`
+batches, and the collections are filled in parallel.
+
+Functions:
+- generate: Yields the generated documents of one collection.
+- volumes_per_collection: Splits the requested volumes into per-collection counts.
+- fill: Inserts the requested volumes into the database.
+
+Run `python -m src.services.synthetic --articles 100000 --qa 50000 [--drop]` to fill the database.
+"""
+
+import argparse
+import datetime
+import random
+from functools import partial
+from itertools import islice
+from typing import Iterator
+
+from bson import ObjectId
+
+from src.services import content_storage, db, stats
+from src.services.technologies import TECHNOLOGIES, article_collection, qa_collection
+
+SYNTHETIC_BATCH_SIZE = 1000  # Documents per insert_many
+DATE_SPREAD_DAYS = 3 * 365  # datum_vnosa values are spread over this many days before now
+
+# Default number of documents per collection group; articles and QA are split evenly across the technologies
+DEFAULT_VOLUMES = {
+    'articles': 15_000,
+    'qa': 15_000,
+    'blog': 1_000,
+    'book': 500,
+    'projects': 200,
+    'language_data': 5_000,
+    'subscriber': 10_000,
+}
+
+WORDS = (
+    'aplikacija podatki funkcija razred komponenta strežnik odjemalec baza poizvedba indeks zbirka dokument '
+    'polje vrednost seznam slovar modul paket knjižnica ogrodje testiranje napaka izjema zanka pogoj spremenljivka '
+    'konstanta objekt metoda lastnost vmesnik tip generik asinhrono sočasno nit proces pomnilnik predpomnilnik '
+    'zmogljivost optimizacija razvoj uporabnik avtentikacija žeton usmerjevalnik pot zahteva odgovor glava telo '
+    'stanje shramba dogodek poslušalec vtičnik konfiguracija okolje namestitev kontejner slika omrežje vrata'
+).split()
+AUTHORS = ['Danilo Jezernik', 'Ana Novak', 'Marko Horvat', 'Eva Kovačič', 'Luka Krajnc', 'Nina Zupan']
+FIRST_NAMES = ['Ana', 'Marko', 'Eva', 'Luka', 'Nina', 'Jan', 'Maja', 'Tim', 'Sara', 'Žiga', 'Špela', 'Matej']
+SURNAMES = ['Novak', 'Horvat', 'Kovačič', 'Krajnc', 'Zupan', 'Potočnik', 'Kos', 'Vidmar', 'Golob', 'Turk']
+CATEGORIES = ['beginner', 'intermediate', 'advanced']
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choices(WORDS, k=words)).capitalize() + '.'
+
+
+def _text(rng: random.Random, size: int) -> str:
+    """
+    Generates roughly `size` characters of sentences.
+    """
+    sentences = []
+    length = 0
+    while length < size:
+        sentence = _sentence(rng, rng.randint(6, 18))
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return ' '.join(sentences)
+
+
+def _html(rng: random.Random, size: int) -> str:
+    paragraphs = max(1, size // 600)
+    return ''.join(f'<p>{_text(rng, size // paragraphs)}</p>' for _ in range(paragraphs))
+
+
+def _base(rng: random.Random, now: datetime.datetime) -> dict:
+    return {
+        '_id': ObjectId(),
+        'datum_vnosa': now - datetime.timedelta(seconds=rng.randrange(DATE_SPREAD_DAYS * 24 * 3600)),
+    }
+
+
+def _article(rng, now, number, technology):
+    return {
+        **_base(rng, now),
+        'title': f'{technology.capitalize()}: {_sentence(rng, rng.randint(3, 8))}',
+        'subtitle': _sentence(rng, rng.randint(6, 14)),
+        'content': _text(rng, rng.randint(2_000, 8_000)),
+        'author': rng.choice(AUTHORS),
+    }
+
+
+def _qa(rng, now, number, technology):
+    return {
+        **_base(rng, now),
+        'question': _sentence(rng, rng.randint(6, 16)).rstrip('.') + '?',
+        'answer': _text(rng, rng.randint(300, 1_500)),
+        'language': technology,
+    }
+
+
+def _blog(rng, now, number):
+    return {
+        **_base(rng, now),
+        'title': _sentence(rng, rng.randint(3, 8)),
+        'kategorija': rng.choice(TECHNOLOGIES),
+        'podnaslov': _sentence(rng, rng.randint(6, 14)),
+        'vsebina': _html(rng, rng.randint(3_000, 7_000)),
+        'author': rng.choice(AUTHORS),
+    }
+
+
+def _book(rng, now, number):
+    return {
+        **_base(rng, now),
+        'naslov': _sentence(rng, rng.randint(2, 6)),
+        'podnaslov': _sentence(rng, rng.randint(5, 12)),
+        'tehnologija': rng.choice(TECHNOLOGIES),
+        'vsebina': _text(rng, rng.randint(500, 2_000)),
+        'author': rng.choice(AUTHORS),
+        'buy_url': 'https://www.amazon.com/',
+        'image': f'book{rng.randrange(100)}.jpg',
+    }
+
+
+def _project(rng, now, number):
+    return {
+        **_base(rng, now),
+        'title': _sentence(rng, rng.randint(2, 5)),
+        'subtitle': _sentence(rng, rng.randint(5, 10)),
+        'category': rng.choice(CATEGORIES),
+        'content': _text(rng, rng.randint(300, 1_500)),
+        'github': 'https://github.com/',
+        'website': '',
+        'image': f'project{rng.randrange(100)}.jpg',
+    }
+
+
+def _language_data(rng, now, number):
+    return {
+        '_id': ObjectId(),
+        'tag': f'{rng.choice(WORDS)}-{number}',
+        'count': int(2_500_000 / (number + 1)) + rng.randrange(100),  # Zipf-like: few popular tags, a long tail
+        'last_updated': now,
+    }
+
+
+def _subscriber(rng, now, number):
+    name, surname = rng.choice(FIRST_NAMES), rng.choice(SURNAMES)
+    return {
+        **_base(rng, now),
+        'name': name,
+        'surname': surname,
+        'email': f'{name.lower()}.{surname.lower()}.{number}@example.com',
+        'confirmed': rng.random() < 0.8,
+    }
+
+
+def generate(collection: str, count: int, seed: int = 0) -> Iterator[dict]:
+    """
+    Lazily yields `count` generated documents for one (logical) collection; the same seed gives the same content.
+    """
+    rng = random.Random(f'{seed}:{collection}')
+    now = datetime.datetime.now()
+
+    technology = collection.rsplit('_', 1)[0]
+    if collection == article_collection(technology):
+        make = partial(_article, technology=technology)
+    elif collection == qa_collection(technology):
+        make = partial(_qa, technology=technology)
+    else:
+        make = {'blog': _blog, 'book': _book, 'projects': _project, 'language_data': _language_data,
+                'subscriber': _subscriber}[collection]
+
+    for number in range(count):
+        yield make(rng, now, number)
+
+
+def _insert(collection: str, count: int, seed: int, batch_size: int) -> int:
+    physical, base_filter = content_storage.resolve(collection)
+    documents = generate(collection, count, seed)
+    inserted = 0
+    while batch := [{**document, **base_filter} for document in islice(documents, batch_size)]:
+        db.process[physical].insert_many(batch, ordered=False)
+        inserted += len(batch)
+    return inserted
+
+
+def volumes_per_collection(volumes: dict[str, int]) -> dict[str, int]:
+    """
+    Expands group volumes ('articles', 'qa', ...) into per-collection counts, splitting articles and QA evenly
+    across the technologies.
+    """
+    counts = {}
+    for group, collection_of in (('articles', article_collection), ('qa', qa_collection)):
+        share, remainder = divmod(volumes.get(group, 0), len(TECHNOLOGIES))
+        for number, technology in enumerate(TECHNOLOGIES):
+            counts[collection_of(technology)] = share + (number < remainder)
+    for collection in ('blog', 'book', 'projects', 'language_data', 'subscriber'):
+        counts[collection] = volumes.get(collection, 0)
+    return {collection: count for collection, count in counts.items() if count}
+
+
+def fill(volumes: dict[str, int] = DEFAULT_VOLUMES, seed: int = 0, batch_size: int = SYNTHETIC_BATCH_SIZE,
+         drop: bool = False) -> dict[str, float]:
+    """
+    Inserts the requested volumes of generated documents, filling the collections in parallel.
+
+    Parameters:
+        volumes (dict[str, int]): Documents per group: 'articles', 'qa' (both split across technologies), 'blog',
+            'book', 'projects', 'language_data' and 'subscriber'.
+        seed (int): Seed of the generated content.
+        batch_size (int): Documents per insert_many.
+        drop (bool): Drop the target collections first.
+
+    Returns:
+        dict[str, float]: Seconds spent filling each collection.
+    """
+    counts = volumes_per_collection(volumes)
+    if drop:
+        for physical in {content_storage.resolve(collection)[0] for collection in counts}:
+            db.process.drop_collection(physical)
+
+    timings = db.run_parallel('Generated', {
+        collection: partial(_insert, collection, count, seed, batch_size) for collection, count in counts.items()
+    })
+    content_storage.ensure_indexes()
+    # The bulk inserts bypass the `$inc` write paths
+    stats.rebuild()
+    return timings
+
+
+if __name__ == '__main__':
+    from src.services import logs
+
+    parser = argparse.ArgumentParser(description='Fill the database with synthetic content for load testing.')
+    for group, default in DEFAULT_VOLUMES.items():
+        parser.add_argument(f"--{group.replace('_', '-')}", type=int, default=default, dest=group,
+                            help=f'number of {group} documents (default {default})')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated content')
+    parser.add_argument('--batch-size', type=int, default=SYNTHETIC_BATCH_SIZE, help='documents per insert_many')
+    parser.add_argument('--drop', action='store_true', help='drop the target collections first')
+    args = parser.parse_args()
+
+    logs.configure(fmt='text')
+    fill({group: getattr(args, group) for group in DEFAULT_VOLUMES}, args.seed, args.batch_size, args.drop)
@@ -0,0 +1,29 @@
+"""
+Technologies that have their own article and QA collections.
+
+Every technology listed here is served under `/article/<technology>` and `/qa/<technology>` and stored in
+the `<technology>_articles` and `<technology>_qa` collections.
+"""
+
+TECHNOLOGIES = [
+    'angular', 'vue', 'javascript', 'typescript', 'python', 'mongodb', 'cypress', 'django',
+    'docker', 'nuxt', 'pytest', 'tailwind', 'sql', 'fastapi', 'playwright',
+]
+
+
+def article_collection(technology: str) -> str:
+    """
+    Returns the name of the article collection for the given technology (e.g. `python_articles`).
+    """
+    return f'{technology}_articles'
+
+
+def qa_collection(technology: str) -> str:
+    """
+    Returns the name of the QA collection for the given technology (e.g. `python_qa`).
+    """
+    return f'{technology}_qa'
+
+
+ARTICLE_COLLECTIONS = [article_collection(technology) for technology in TECHNOLOGIES]
+QA_COLLECTIONS = [qa_collection(technology) for technology in TECHNOLOGIES]
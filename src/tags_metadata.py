@@ -43,5 +43,21 @@ tags_metadata = [
     {
         "name": "Comment",
         "description": "Route je namenjen pregledu prejetih komentarjev",
+    },
+    {
+        "name": "Search",
+        "description": "Iskanje po vseh člankih in vprašanjih (QA) vseh tehnologij",
+    },
+    {
+        "name": "Content",
+        "description": "Najnovejši članki in vprašanja (QA) vseh tehnologij v enem klicu",
+    },
+    {
+        "name": "Admin",
+        "description": "Administracija in diagnostika baze (počasne poizvedbe, statistika ukazov)",
+    },
+    {
+        "name": "Stats",
+        "description": "Števci vsebine: članki in QA po tehnologijah, naročniki in prejeta sporočila",
     }
 ]
@@ -1,10 +1,36 @@
+import os
+
 import pytest
+from src import env
 from src.services import db
-from src.database.book import book
+from src.services.fixtures import read_fixture
+
+
+@pytest.fixture(scope='session', autouse=True)
+def test_database():
+    """
+    Gives every pytest-xdist worker its own database, `<DB_PROCESS>_test_<worker>`, seeded from the fixtures and
+    dropped after the session, so workers never see each other's writes. With `TEST_DB_BACKEND=mongomock` the
+    database lives in the worker's memory instead.
+    """
+    worker = os.getenv('PYTEST_XDIST_WORKER') or 'main'
+    if env.TEST_DB_BACKEND == 'mongomock':
+        import mongomock
+        db.MongoClient = mongomock.MongoClient
+
+    env.DB_PROCESS = f'{env.DB_PROCESS}_test_{worker}'
+    process = db.connect()
+    assert process.name == env.DB_PROCESS, "The database was connected before the test database was selected."
+
+    db.drop_all_collections()
+    db.seed()
+    db.seed_user()
+    yield process
+    db.client.drop_database(process.name)
 
 
 @pytest.fixture(scope='session')
-def mongodb():
+def mongodb(test_database):
     client = db.client
 
     assert client.admin.command('ping')['ok'] != 0.0, "Unable to connect to MongoDB."
@@ -12,4 +38,4 @@ def mongodb():
 
 @pytest.fixture(scope='class')
 def book_data():
-    return book
+    return list(read_fixture('book'))
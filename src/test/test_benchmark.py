@@ -0,0 +1,40 @@
+from src.benchmark.runner import compare, measure, summarize
+
+
+def test_summarize_reports_percentiles_and_throughput():
+    summary = summarize([i / 1000 for i in range(1, 101)])  # 1..100 ms
+
+    assert summary['iterations'] == 100
+    assert summary['p50_ms'] == 50.5
+    assert summary['p99_ms'] == 99.01
+    assert summary['rps'] == round(100 / 5.05, 1)
+
+
+def test_measure_and_compare_flag_regressions():
+    calls = []
+    assert len(measure(lambda: calls.append(1), iterations=3, warmup=2)) == 3
+    assert len(calls) == 5
+
+    baseline = {'blog.all': {'p50_ms': 10, 'p99_ms': 20}, 'login': {'p50_ms': 100, 'p99_ms': 120}}
+    results = {'blog.all': {'p50_ms': 13, 'p99_ms': 21}, 'login': {'p50_ms': 90, 'p99_ms': 110},
+               'new': {'p50_ms': 1, 'p99_ms': 1}}
+    assert compare(results, baseline) == ['blog.all: p50_ms 10 -> 13 (+30%)']
+
+
+def test_stub_paginates_and_fails_on_request():
+    from fastapi.testclient import TestClient
+    from src.benchmark.stubs import StubConfig, create_app
+
+    config = StubConfig(github_repos=45)
+    client = TestClient(create_app(config))
+
+    assert len(client.get('/github/users/stub/repos', params={'per_page': 30, 'page': 2}).json()) == 15
+    assert len(client.get('/devto/articles', params={'tag': 'python'}).json()) == config.devto_articles
+
+    config.rate_limit_rate = 1
+    response = client.get('/devto/articles')
+    assert response.status_code == 429 and response.headers['Retry-After'] == '1'
+    assert client.get('/stackoverflow/tags').json()['error_name'] == 'throttle_violation'
+
+    config.error_rate = 1
+    assert client.get('/github/users/stub/repos').status_code == 500
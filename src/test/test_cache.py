@@ -0,0 +1,28 @@
+from src.services import cache
+
+
+def test_value_computed_during_an_invalidation_is_not_cached():
+    cache.depends_on('test_cache', ['test_cache_source'])
+    calls = []
+
+    def compute_while_written():
+        calls.append(1)
+        cache.invalidate('test_cache_source')  # A write lands while the value is computed from the old data
+        return 'stale'
+
+    assert cache.cached('test_cache', 'key', compute_while_written) == 'stale'
+    assert cache.cached('test_cache', 'key', lambda: 'fresh') == 'fresh'
+    assert cache.cached('test_cache', 'key', lambda: 'recomputed') == 'fresh'  # Cached now
+    assert calls == [1]
+
+    cache.invalidate('test_cache_source')
+    assert cache.cached('test_cache', 'key', lambda: 'after write') == 'after write'
+
+
+def test_value_computed_during_a_clear_is_not_cached():
+    def compute_while_cleared():
+        cache.clear()
+        return 'stale'
+
+    cache.cached('test_cache_clear', 'key', compute_while_cleared)
+    assert cache.cached('test_cache_clear', 'key', lambda: 'fresh') == 'fresh'
@@ -0,0 +1,64 @@
+import asyncio
+import gzip
+
+from fastapi.testclient import TestClient
+
+from src.__main__ import app
+from src.services import cache, compression
+from src.services.compression import accepted_encoding
+
+client = TestClient(app)
+
+
+def test_accepted_encoding_prefers_available_encodings_and_honors_q_zero():
+    assert accepted_encoding('gzip, deflate') == 'gzip'
+    assert accepted_encoding('gzip;q=0, deflate') is None
+    assert accepted_encoding('identity') is None
+    assert accepted_encoding('*') == compression.ENCODINGS[0]
+
+
+def test_large_and_streamed_responses_are_compressed_small_ones_are_not():
+    plain = client.get('/blog/', headers={'Accept-Encoding': 'identity'})
+    compressed = client.get('/blog/', headers={'Accept-Encoding': 'gzip'})
+    assert 'content-encoding' not in plain.headers
+    assert compressed.headers['content-encoding'] == 'gzip'
+    assert compressed.headers['vary'] == 'Accept-Encoding'
+    assert compressed.json() == plain.json()
+
+    streamed = client.get('/blog/', params={'stream': True}, headers={'Accept-Encoding': 'gzip'})
+    assert streamed.headers['content-encoding'] == 'gzip'
+    assert len(streamed.text.splitlines()) == len(plain.json())
+
+    assert 'content-encoding' not in client.get('/healthy', headers={'Accept-Encoding': 'gzip'}).headers
+
+
+def test_cached_body_is_compressed_once_per_write(monkeypatch):
+    calls = []
+    monkeypatch.setattr(compression, 'compress', lambda body, encoding: calls.append(encoding) or gzip.compress(body))
+    cache.invalidate('blog')
+
+    first = client.get('/blog/', headers={'Accept-Encoding': 'gzip'})
+    second = client.get('/blog/', headers={'Accept-Encoding': 'gzip'})
+    assert first.content == second.content
+    assert calls == ['gzip']
+
+    cache.invalidate('blog')  # What every write to the collection does
+    client.get('/blog/', headers={'Accept-Encoding': 'gzip'})
+    assert calls == ['gzip', 'gzip']
+
+
+def test_cached_body_is_compressed_off_the_event_loop(monkeypatch):
+    loops = []
+
+    def compress(body, encoding):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return gzip.compress(body)
+
+    monkeypatch.setattr(compression, 'compress', compress)
+    cache.invalidate('blog')
+
+    assert client.get('/blog/', headers={'Accept-Encoding': 'gzip'}).headers['content-encoding'] == 'gzip'
+    assert loops == [None]
@@ -0,0 +1,76 @@
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from src import env
+from src.domain.article import Article
+from src.services import content_storage, db, stats
+from src.utils.router_helpers import add_data, all_data, data_by_id, delete_data, edit_data, limited_data
+
+ARTICLE = {'title': 'Enotna zbirka', 'subtitle': 's', 'content': 'c', 'author': 'Ana'}
+
+
+@pytest.fixture
+def unified(monkeypatch):
+    monkeypatch.setattr(env, 'CONTENT_STORAGE', 'unified')
+    yield
+    monkeypatch.undo()
+    for collection in content_storage.UNIFIED_COLLECTIONS:
+        db.process[collection].drop()
+    stats.rebuild()  # Recount from the per-technology collections again
+
+
+def test_resolve_maps_logical_collections(unified):
+    assert content_storage.resolve('python_articles') == ('articles', {'technology': 'python'})
+    assert content_storage.resolve('vue_qa') == ('qa', {'technology': 'vue'})
+    assert content_storage.resolve('blog') == ('blog', {})
+
+
+def test_resolve_keeps_collections_by_default():
+    assert content_storage.resolve('python_articles') == ('python_articles', {})
+
+
+def test_migrate_upserts_by_id_and_drops_the_source(unified, monkeypatch):
+    sources = {'storage_test_python': ('storage_test_articles', 'python'),
+               'storage_test_vue': ('storage_test_articles', 'vue')}
+    monkeypatch.setattr(content_storage, '_UNIFIED', sources)
+    ids = [ObjectId() for _ in range(3)]
+    db.process.storage_test_python.insert_many([{'_id': ids[0], 'title': 'a'}, {'_id': ids[1], 'title': 'b'}])
+    db.process.storage_test_vue.insert_one({'_id': ids[2], 'title': 'c'})
+    db.process.storage_test_articles.insert_one({'_id': ids[0], 'title': 'stale'})  # From an earlier run
+
+    assert content_storage.migrate() == {'storage_test_python': 2, 'storage_test_vue': 1}
+    assert content_storage.migrate() == {'storage_test_python': 2, 'storage_test_vue': 1}
+
+    target = db.process.storage_test_articles
+    assert target.count_documents({}) == 3
+    assert target.find_one({'_id': ids[0]}) == {'_id': ids[0], 'title': 'a', 'technology': 'python'}
+    assert target.find_one({'_id': ids[2]})['technology'] == 'vue'
+    assert {'storage_test_python', 'storage_test_vue'} <= set(db.process.list_collection_names())
+
+    content_storage.migrate(drop_source=True)
+    assert not {'storage_test_python', 'storage_test_vue'} & set(db.process.list_collection_names())
+    assert target.count_documents({}) == 3
+    target.drop()
+
+
+def test_crud_helpers_work_through_the_unified_collection(unified):
+    created = add_data('python_articles', Article(**ARTICLE), Article)
+    _id = str(created.id)
+
+    stored = db.process.articles.find_one({'_id': created.id})
+    assert stored['technology'] == 'python' and stored['title'] == ARTICLE['title']
+    assert data_by_id('python_articles', Article, _id).title == ARTICLE['title']
+    assert [article.id for article in limited_data('python_articles', Article, 5)] == [created.id]
+    assert all_data('vue_articles', Article) == []
+    with pytest.raises(HTTPException):
+        data_by_id('vue_articles', Article, _id)
+
+    edited = edit_data(_id, 'python_articles', Article(**{**ARTICLE, 'title': 'Nov naslov'}), Article)
+    assert edited.title == 'Nov naslov'
+    assert edit_data(_id, 'vue_articles', Article(**{**ARTICLE, 'title': 'Drug'}), Article) is None
+
+    with pytest.raises(HTTPException):
+        delete_data(_id, 'vue_articles')
+    delete_data(_id, 'python_articles')
+    assert db.process.articles.count_documents({}) == 0
@@ -0,0 +1,60 @@
+import datetime
+
+import httpx
+from bson import ObjectId
+
+from src import env
+from src.benchmark.stubs import StubConfig, create_app
+from src.domain.dev_api import DevAritcle
+from src.services import db, dev_articles, http_client
+from src.test.utils.helpers import client
+
+
+def _article(slug: str, day: int) -> DevAritcle:
+    return DevAritcle(type_of='article', title=slug, description='d', url=f'https://dev.to/a/{slug}',
+                      published_at=datetime.datetime(2024, 1, day), tag_list=['python'],
+                      user={'name': 'n', 'profile_image': 'i'})
+
+
+def test_articles_of_several_feeds_are_stored_once():
+    db.process[dev_articles.DEV_ARTICLES].drop()
+    dev_articles.store('python', [_article('shared', 2), _article('python-only', 1)])
+    dev_articles.store('webdev', [_article('shared', 2), _article('webdev-only', 3)])
+
+    stored = db.process[dev_articles.DEV_ARTICLES]
+    assert stored.count_documents({}) == 3
+    assert sorted(stored.find_one({'url': 'https://dev.to/a/shared'})['tags']) == ['python', 'webdev']
+    assert [article['title'] for article in dev_articles.feed('webdev')] == ['webdev-only', 'shared']
+    assert 'tags' not in dev_articles.feed('webdev')[0]
+
+    dev_articles.store('python', [_article('python-new', 4)])
+    assert [article['title'] for article in dev_articles.feed('python')] == ['python-new']
+    assert stored.find_one({'url': 'https://dev.to/a/shared'})['tags'] == ['webdev']
+    assert stored.find_one({'url': 'https://dev.to/a/python-only'}) is None
+
+
+def test_route_stores_the_feed_and_falls_back_to_it(monkeypatch):
+    db.process[dev_articles.DEV_ARTICLES].drop()
+    stub = StubConfig(devto_articles=5)
+    monkeypatch.setattr(env, 'DEV_TO_API_URL', 'http://stub/devto')
+    monkeypatch.setattr(http_client, 'get_client', lambda: httpx.AsyncClient(transport=httpx.ASGITransport(
+        app=create_app(stub)), base_url='http://stub'))
+
+    response = client.get('/dev/python')
+    assert response.status_code == 200 and len(response.json()) == 5
+    assert isinstance(response.json()[0]['_id'], str) and 'tags' not in response.json()[0]
+
+    stub.error_rate = 1
+    assert client.get('/dev/python').json() == response.json()
+    assert client.get('/dev/vue').status_code == 500
+
+
+def test_legacy_tag_collections_are_merged_by_url():
+    db.process[dev_articles.DEV_ARTICLES].drop()
+    for tag in ('python', 'vue'):
+        legacy = {**_article('shared', 1).model_dump(by_alias=True), '_id': str(ObjectId())}
+        db.process[f'dev_api_{tag}'].insert_one(legacy)
+
+    assert dev_articles.migrate(drop_source=True) == {'dev_api_python': 1, 'dev_api_vue': 1}
+    assert [sorted(article['tags']) for article in db.process[dev_articles.DEV_ARTICLES].find()] == [['python', 'vue']]
+    assert 'dev_api_python' not in db.process.list_collection_names()
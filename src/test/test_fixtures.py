@@ -0,0 +1,43 @@
+import gzip
+
+import pytest
+
+from src.services import cache, db
+from src.services.fixtures import FixtureError, fixture_collections, read_fixture
+
+
+def test_read_fixture_validates_and_fills_defaults(tmp_path):
+    (tmp_path / 'python_qa.ndjson').write_text(
+        '{"question": "Kaj je GIL?", "answer": "Globalni zaklep.", "language": "python"}\n\n', encoding='utf-8'
+    )
+    with gzip.open(tmp_path / 'blog.ndjson.gz', 'wt', encoding='utf-8') as file:
+        file.write('{"title": "Naslov", "kategorija": "vue", "podnaslov": "P", "author": "A", "vsebina": "V", '
+                   '"image": "i.jpg"}\n')
+
+    assert fixture_collections(tmp_path) == ['blog', 'python_qa']
+
+    [question] = read_fixture('python_qa', tmp_path)
+    assert question['question'] == 'Kaj je GIL?' and question['_id'] and question['datum_vnosa']
+    assert [blog['title'] for blog in read_fixture('blog', tmp_path)] == ['Naslov']
+
+
+def test_read_fixture_reports_invalid_line(tmp_path):
+    (tmp_path / 'vue_qa.ndjson').write_text(
+        '{"question": "Q", "answer": "A", "language": "vue"}\n{"question": "Q"}\n', encoding='utf-8'
+    )
+
+    with pytest.raises(FixtureError, match='vue_qa.ndjson:2'):
+        list(read_fixture('vue_qa', tmp_path))
+
+
+def test_parallel_seed_inserts_every_fixture_exactly_once():
+    expected = {collection: sum(1 for _ in read_fixture(collection)) for collection in db._seed_collections()}
+
+    try:
+        for _ in range(2):
+            db.drop()
+            timings = db.seed()
+            assert set(timings) == set(expected)
+            assert {collection: db.process[collection].count_documents({}) for collection in expected} == expected
+    finally:
+        cache.clear()  # Cached responses still hold the documents (and ids) of the previous seed
@@ -0,0 +1,56 @@
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from src.domain.blog import Blog
+from src.services import db, id_migration
+from src.test.utils.helpers import client
+
+
+def test_string_ids_are_migrated_to_object_ids():
+    collection = db.process.id_migration_test
+    ids = [ObjectId() for _ in range(5)]
+    collection.insert_many([{'_id': str(_id), 'number': number} for number, _id in enumerate(ids)])
+    collection.insert_one({'_id': 'not-an-object-id'})
+    collection.insert_one({'_id': ids[0], 'number': 0})  # Left behind by an interrupted run
+
+    assert id_migration.migrate_collection(db.process, 'id_migration_test', batch_size=2) == 5
+
+    assert sorted(document['_id'] for document in collection.find({'_id': {'$type': 'objectId'}})) == sorted(ids)
+    assert [document['_id'] for document in collection.find({'_id': {'$type': 'string'}})] == ['not-an-object-id']
+    assert id_migration.migrate_collection(db.process, 'id_migration_test') == 0
+    collection.drop()
+
+
+def test_original_is_kept_when_its_copy_hits_another_unique_index(monkeypatch):
+    collection = db.process.id_migration_unique_test
+    kept, moved = ObjectId(), ObjectId()
+    collection.insert_many([{'_id': str(kept), 'url': 'taken'}, {'_id': str(moved), 'url': 'free'}])
+    insert_many = type(collection).insert_many
+
+    def conflicting_insert_many(self, documents, ordered=True):
+        # The server rejects the copy of `kept` on a unique `url` index and inserts the rest
+        insert_many(self, [document for document in documents if document['url'] != 'taken'], ordered=ordered)
+        raise BulkWriteError({'writeErrors': [{'index': 0, 'code': id_migration.DUPLICATE_KEY,
+                                               'keyPattern': {'url': 1}, 'op': documents[0]}], 'nInserted': 1})
+
+    monkeypatch.setattr(type(collection), 'insert_many', conflicting_insert_many)
+    with pytest.raises(BulkWriteError):
+        id_migration.migrate_collection(db.process, 'id_migration_unique_test')
+    monkeypatch.undo()
+
+    assert collection.find_one({'_id': str(kept)}) == {'_id': str(kept), 'url': 'taken'}  # Not deleted without a copy
+    assert collection.find_one({'_id': kept}) is None
+    assert collection.find_one({'_id': moved}) == {'_id': moved, 'url': 'free'}
+    assert collection.find_one({'_id': str(moved)}) is None
+    collection.drop()
+
+
+def test_ids_are_stored_as_object_ids_and_served_as_strings():
+    blog = db.process.blog.find_one()
+    assert isinstance(blog['_id'], ObjectId)
+    assert Blog.model_validate(blog).model_dump(mode='json', by_alias=True)['_id'] == str(blog['_id'])
+
+    response = client.get(f"/blog/{blog['_id']}")
+    assert response.status_code == 200 and response.json()['_id'] == str(blog['_id'])
+    assert client.get('/blog/not-an-object-id').status_code == 404
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must import on their own (their CLIs import them first), not only after `src.services.db`
+MODULES = [
+    'src.services.content_storage',
+    'src.services.fixtures',
+    'src.services.synthetic',
+    'src.services.stats',
+    'src.services.query_log',
+    'src.services.dev_articles',
+    'src.services.id_migration',
+    'src.benchmark.serialization',
+]
+
+
+@pytest.mark.parametrize('module', MODULES)
+def test_module_imports_in_a_fresh_interpreter(module):
+    result = subprocess.run([sys.executable, '-c', f'import {module}'], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,35 @@
+import asyncio
+import datetime
+
+from src.services import jobs
+
+
+def test_scheduled_job_runs_on_the_loop_and_records_its_history():
+    outcomes = iter([True, False, RuntimeError('upstream down')])
+
+    async def job():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def run_three_times():
+        # The interval never elapses during the test: the scheduled call is run directly instead of waited for
+        jobs._history.pop('test_job', None)
+        jobs.schedule('test_job', job, datetime.timedelta(hours=1))
+        scheduled = jobs._scheduler.get_job('test_job')
+        for _ in range(3):
+            await scheduled.func(*scheduled.args)
+        status = jobs.job_status()
+        jobs.shutdown()
+        return status
+
+    status = asyncio.run(run_three_times())
+    [test_job] = [job for job in status if job['id'] == 'test_job']
+
+    assert test_job['interval_seconds'] == 3600
+    assert test_job['next_run_time'] is not None
+    assert [run['status'] for run in test_job['runs']] == ['failed', 'skipped', 'succeeded']
+    assert test_job['runs'][0]['error'] == 'upstream down'
+    assert test_job['runs'][2]['error'] is None
+    assert jobs.job_status() == []
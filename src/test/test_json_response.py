@@ -0,0 +1,34 @@
+import datetime
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.domain.article import Article
+from src.domain.dev_api import DevAritcle
+from src.services.json_response import ORJSONResponse, dumps
+
+
+def test_orjson_output_matches_the_default_encoding():
+    article = Article(title='Čebula', subtitle='Š', content='ž', author='Ana',
+                      datum_vnosa=datetime.datetime(2024, 5, 1, 8, 30, 15, 123456))
+    content = {'articles': [article], 'aware': datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)}
+
+    expected = JSONResponse(jsonable_encoder(content)).body
+    assert ORJSONResponse(jsonable_encoder(content)).body == expected
+    assert dumps(content) == expected
+
+
+def test_dumps_encodes_object_ids_as_strings():
+    _id = ObjectId()
+    assert dumps({'_id': _id}) == f'{{"_id":"{_id}"}}'.encode()
+
+
+def test_dumps_matches_the_default_encoding_of_models_with_aware_datetimes():
+    article = DevAritcle(type_of='article', title='t', description='d', url='https://dev.to/a',
+                         published_at='2024-01-01T00:00:00Z', tag_list=['python'],
+                         user={'name': 'n', 'profile_image': 'i'})
+
+    expected = JSONResponse(jsonable_encoder([article])).body
+    assert dumps([article]) == expected
+    assert dumps([article.model_dump(mode='json', by_alias=True)]) == expected
@@ -0,0 +1,95 @@
+import asyncio
+import datetime
+import os
+
+import pytest
+
+from src.services import db, language_manager, leases
+
+TTL = datetime.timedelta(minutes=5)
+
+
+def test_only_one_owner_holds_a_lease_until_it_is_released():
+    assert leases.acquire('test_job', TTL, owner='worker-1')
+    assert not leases.acquire('test_job', TTL, owner='worker-2')
+    assert leases.acquire('test_job', TTL, owner='worker-1')  # The holder renews it
+
+    assert not leases.release('test_job', owner='worker-2')
+    assert leases.release('test_job', owner='worker-1')
+    assert leases.acquire('test_job', TTL, owner='worker-2')
+    assert leases.holder('test_job')['owner'] == 'worker-2'
+
+
+def test_expired_lease_is_taken_over():
+    expired = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+    db.process[leases.LEASE_COLLECTION].insert_one({'_id': 'expired_job', 'owner': 'dead-worker', 'expires_at': expired})
+
+    assert leases.acquire('expired_job', TTL, owner='worker-1')
+    assert leases.holder('expired_job')['owner'] == 'worker-1'
+
+
+def test_tag_update_is_skipped_by_other_workers_and_retried_after_a_failure(monkeypatch):
+    calls = []
+
+    def failing_fetch():
+        calls.append(1)
+        raise RuntimeError('StackOverflow is down')
+
+    monkeypatch.setattr(language_manager, 'fetch_stackoverflow_tags', failing_fetch)
+    db.process[leases.LEASE_COLLECTION].delete_many({})
+
+    assert leases.acquire(language_manager.TAGS_JOB, TTL, owner='other-worker')
+    assert asyncio.run(language_manager.update_tags_in_db()) is False
+    assert calls == []
+
+    leases.release(language_manager.TAGS_JOB, owner='other-worker')
+    with pytest.raises(RuntimeError):
+        asyncio.run(language_manager.update_tags_in_db())
+    assert calls == [1]
+    assert leases.holder(language_manager.TAGS_JOB) is None  # Released after the failure
+
+
+def test_concurrent_tag_updates_in_one_worker_run_once(monkeypatch):
+    calls = []
+
+    async def scenario():
+        started, finish = asyncio.Event(), asyncio.Event()
+
+        async def slow_fetch():
+            calls.append(1)
+            started.set()
+            await finish.wait()
+
+        monkeypatch.setattr(language_manager, 'fetch_stackoverflow_tags', slow_fetch)
+        # Same owner for both: without the single-flight lock the second call would renew the lease and run too
+        first = asyncio.create_task(language_manager.update_tags_in_db())
+        await started.wait()
+        second = await language_manager.update_tags_in_db()
+        finish.set()
+        return await first, second
+
+    db.process[leases.LEASE_COLLECTION].delete_many({})
+    assert asyncio.run(scenario()) == (True, False)
+    assert calls == [1]
+
+    # A request-triggered run can't renew the lease the previous run took
+    assert asyncio.run(language_manager.update_tags_in_db(owner=leases.call_owner())) is False
+    assert calls == [1]
+    db.process[leases.LEASE_COLLECTION].delete_many({})
+
+
+def test_forked_workers_get_their_own_owner_id():
+    parent = leases.instance_id()  # Created before the fork, as with `gunicorn --preload`
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write, leases.instance_id().encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child = os.read(read, 200).decode()
+    os.close(read)
+    os.close(write)
+
+    assert leases.instance_id() == parent
+    assert child and child != parent
+    assert child.split(':')[1] == str(pid)
@@ -0,0 +1,29 @@
+import json
+import logging
+import queue
+
+from src.services.logs import TEXT_FORMAT, ExceptionQueueHandler, JsonFormatter, RequestIdFilter
+
+
+def test_queued_exception_keeps_its_traceback():
+    log_queue = queue.SimpleQueue()
+    handler = ExceptionQueueHandler(log_queue)
+    handler.addFilter(RequestIdFilter())
+    logger = logging.getLogger('test_logs')
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        try:
+            raise ValueError('bad value')
+        except ValueError:
+            logger.exception('Failed to %s', 'parse', extra={'item': 42})
+    finally:
+        logger.removeHandler(handler)
+
+    record = log_queue.get_nowait()
+    line = json.loads(JsonFormatter().format(record))
+    assert line['message'] == 'Failed to parse'
+    assert line['item'] == 42
+    assert 'ValueError: bad value' in line['exception']
+    assert 'Traceback' not in line['message']
+    assert logging.Formatter(TEXT_FORMAT).format(record).endswith('ValueError: bad value')
@@ -8,9 +8,10 @@ from src.domain.experiences import Experiences
 from src.domain.links import Links
 from src.domain.projects import Projects
 from src import env
+from src.services import db
 
 from src.test.utils.helpers import check_status_response_for, check_health, check_status_response_by_id_for, \
-    login_success_helper, login_failed_helper
+    check_stream_response_for, login_success_helper, login_failed_helper
 
 from src.__main__ import app
 
@@ -22,6 +23,15 @@ def test_return_healthy_check(mongodb):
     check_health('healthy')
 
 
+# Metrics
+def test_metrics_records_route_template(mongodb):
+    client.get('/blog/does-not-exist')
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert 'http_request_duration_seconds_count{method="GET",route="/blog/{_id}",status="404"}' in response.text
+
+
 # Blog
 def test_route_blog(mongodb):
     check_status_response_for('blog', Blog)
@@ -31,6 +41,10 @@ def test_route_blog_by_id(mongodb):
     check_status_response_by_id_for('blog', Blog)
 
 
+def test_route_blog_stream(mongodb):
+    check_stream_response_for('blog', Blog)
+
+
 # Book
 def test_route_book(mongodb):
     check_status_response_for('book', Book)
@@ -96,6 +110,28 @@ def test_route_qa_python_by_id(mongodb):
     check_status_response_by_id_for('/qa/python', Language)
 
 
+def test_route_qa_python_stream(mongodb):
+    check_stream_response_for('/qa/python', Language)
+
+
+def test_route_qa_python_limited_newest_first(mongodb):
+    response = client.get('/qa/python/limited/', params={'limit': 2})
+    dates = [document['datum_vnosa'] for document in response.json()]
+
+    assert response.status_code == 200
+    assert len(dates) <= 2
+    assert dates == sorted(dates, reverse=True)
+
+
+def test_route_limited_reads_the_startup_index(mongodb, monkeypatch):
+    def create_index(*args, **kwargs):
+        raise AssertionError('limited_data must not create indexes')
+
+    monkeypatch.setattr(type(db.process.python_qa), 'create_index', create_index)  # pymongo or mongomock
+    assert client.get('/qa/python/limited/', params={'limit': 2}).status_code == 200
+    assert 'datum_vnosa_-1__id_-1' in db.process.python_qa.index_information()
+
+
 ## Article
 def test_route_article_python(mongodb):
     check_status_response_for('/article/python', Article)
@@ -349,3 +385,35 @@ def test_login_success(monkeypatch):
 
 def test_login_failure(monkeypatch):
     login_failed_helper(monkeypatch, 'napaka', 'napaka')
+
+
+# Latest content across all technologies
+def test_route_latest_content(mongodb):
+    response = client.get('/content/latest/', params={'limit': 5})
+    assert response.status_code == 200
+
+    articles = response.json()['articles']
+    dates = [article['datum_vnosa'] for article in articles]
+    assert len(articles) <= 5
+    assert dates == sorted(dates, reverse=True)
+    assert all(article['technology'] for article in articles)
+
+
+# Request IDs for structured logging
+def test_request_id_is_echoed_or_generated():
+    response = client.get('/healthy', headers={'X-Request-ID': 'abc-123'})
+    assert response.headers['x-request-id'] == 'abc-123'
+
+    generated = client.get('/healthy').headers['x-request-id']
+    assert len(generated) == 32 and generated != 'abc-123'
+
+
+# Command-line interface
+def test_cli_serves_by_default_and_passes_extra_arguments_to_pytest():
+    from src.__main__ import parse_args, serve, test
+
+    args = parse_args([])
+    assert args.command is serve and args.workers == env.WORKERS and args.port == env.PORT
+
+    args = parse_args(['test', '-k', 'blog'])
+    assert args.command is test and args.pytest_args == ['-k', 'blog']
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from src.services.query_log import QueryLogListener, _plan_stages, filter_shape
+
+
+def _run(listener, command_name, command, duration_ms, request_id=1):
+    listener.started(SimpleNamespace(command=command, command_name=command_name, database_name='test',
+                                     connection_id=('localhost', 27017), request_id=request_id))
+    listener.succeeded(SimpleNamespace(command_name=command_name, duration_micros=int(duration_ms * 1000),
+                                       connection_id=('localhost', 27017), request_id=request_id))
+
+
+def test_filter_shape_hides_values():
+    shape = filter_shape({'tag': {'$in': ['python', 'vue']}, '_id': 'abc', 'n': {'$gt': 3}})
+    assert shape == {'tag': {'$in': ['?']}, '_id': '?', 'n': {'$gt': '?'}}
+
+
+def test_plan_stages_reads_winning_plan():
+    explain = {'queryPlanner': {'winningPlan': {'stage': 'LIMIT', 'inputStage': {'stage': 'COLLSCAN'}},
+                                'rejectedPlans': [{'stage': 'IXSCAN'}]}}
+    assert _plan_stages(explain) == ['LIMIT', 'COLLSCAN']
+
+
+def test_listener_keeps_stats_and_logs_only_slow_commands(monkeypatch):
+    listener = QueryLogListener(threshold_ms=50, size=2)
+    monkeypatch.setattr(listener, '_explain', lambda database, command, plan: plan.update(stages=['COLLSCAN']))
+    monkeypatch.setattr(listener._explainer, 'submit', lambda function, *args: function(*args))
+
+    _run(listener, 'find', {'find': 'blog', 'filter': {'_id': 'a'}}, 10, request_id=1)
+    _run(listener, 'find', {'find': 'blog', 'filter': {'_id': 'b'}}, 80, request_id=2)
+    _run(listener, 'insert', {'insert': 'blog', 'documents': [{}]}, 60, request_id=3)
+    _run(listener, 'find', {'find': 'vue_qa', 'filter': {}}, 70, request_id=4)
+
+    stats = {(row['collection'], row['command']): row for row in listener.command_stats()}
+    assert stats[('blog', 'find')]['count'] == 2
+    assert stats[('blog', 'find')]['max_ms'] == 80
+
+    slow = listener.slow_queries()
+    assert [(entry['collection'], entry['command']) for entry in slow] == [('vue_qa', 'find'), ('blog', 'insert')]
+    assert slow[0]['filter_shape'] == {} and slow[0]['collscan'] is True
+    assert slow[1]['filter_shape'] is None and slow[1]['collscan'] is None
@@ -0,0 +1,145 @@
+import pytest
+
+from src import env
+from src.domain.search import SearchResponse
+from src.routes import search as search_routes
+from src.services import db, metrics, search, search_index
+from src.services.technologies import TECHNOLOGIES
+from src.test.utils.helpers import client
+
+requires_text_search = pytest.mark.skipif(env.TEST_DB_BACKEND == 'mongomock',
+                                          reason='mongomock does not implement $text')
+
+
+def _no_hits(kind, technology, collection_name, base_filter, query, limit):
+    return 0, []
+
+
+def test_highlight_marks_every_match_around_the_first_one():
+    text = 'Uvod. ' + 'x' * 100 + ' Python <3 je jezik, python pa tudi kača.'
+    snippet = search.highlight(text, ['python'], width=60)
+
+    assert snippet.startswith('…')
+    assert snippet.count('<mark>') == 2
+    assert '<mark>Python</mark> &lt;3' in snippet
+    assert search.highlight('brez zadetka', ['python']) == 'brez zadetka'
+    assert search.highlight('<b>', []) == '&lt;b&gt;'
+
+
+def test_targets_per_collection_and_unified(monkeypatch):
+    assert search.search_targets('qa', 'python') == [('qa', 'python', 'python_qa')]
+    assert ('blog', None, 'blog') not in search.search_targets(technology='python')
+    assert search._physical_targets(search.search_targets('qa', 'python')) == [('qa', 'python', 'python_qa', {})]
+
+    monkeypatch.setattr(env, 'CONTENT_STORAGE', 'unified')
+    assert search._physical_targets(search.search_targets('qa', 'python')) == \
+           [('qa', 'python', 'qa', {'technology': 'python'})]
+    assert search._physical_targets(search.search_targets()) == \
+           [('article', None, 'articles', {}), ('qa', None, 'qa', {}), ('blog', None, 'blog', {})]
+    some = search._physical_targets([('article', t, f'{t}_articles') for t in TECHNOLOGIES[:2]])
+    assert some == [('article', None, 'articles', {'technology': {'$in': TECHNOLOGIES[:2]}})]
+
+
+def test_hits_are_ranked_across_collections(monkeypatch):
+    scores = {'python_qa': [9.0, 2.0], 'vue_qa': [5.0], 'blog': [7.0, 1.0]}
+    limits = []
+
+    def search_collection(kind, technology, collection_name, base_filter, query, limit):
+        limits.append(limit)
+        documents = [{'_id': f'{collection_name}-{score}', 'score': score, 'question': collection_name,
+                      'title': collection_name, 'answer': 'odgovor o pythonu', 'vsebina': 'python'}
+                     for score in scores.get(collection_name, [])][:limit]
+        return len(scores.get(collection_name, [])), [(kind, technology, document) for document in documents]
+
+    monkeypatch.setattr(search, '_search_collection', search_collection)
+
+    first = search.search('python', page=1, page_size=2)
+    assert first.total == 5
+    assert [hit.id for hit in first.results] == ['python_qa-9.0', 'blog-7.0']
+    assert first.results[0].technology == 'python' and first.results[1].kind == 'blog'
+    assert '<mark>python</mark>' in first.results[0].snippet
+
+    second = search.search('python', page=2, page_size=2)
+    assert [hit.id for hit in second.results] == ['vue_qa-5.0', 'python_qa-2.0']
+    assert set(limits) == {2, 4}  # Every collection is read only up to the end of the requested page
+
+
+def test_collection_queries_count_toward_the_request_metrics(monkeypatch):
+    seen = []
+
+    def search_collection(*args):
+        seen.append(metrics._request_mongo_time.get())
+        return _no_hits(*args)
+
+    monkeypatch.setattr(search, '_search_collection', search_collection)
+    mongo_time = metrics._MongoTime()
+    token = metrics._request_mongo_time.set(mongo_time)
+    try:
+        search.search('python', kind='qa')
+    finally:
+        metrics._request_mongo_time.reset(token)
+
+    assert seen and all(holder is mongo_time for holder in seen)
+
+
+@requires_text_search
+def test_text_search_ranks_title_matches_first():
+    search.ensure_text_indexes()
+    blog = db.process.blog.insert_one({'title': 'Zlatorog', 'podnaslov': '', 'vsebina': 'O planinah.'}).inserted_id
+    qa = db.process.python_qa.insert_one({'question': 'Kaj je to?', 'answer': 'Zlatorog je kozorog.'}).inserted_id
+    try:
+        response = search.search('zlatorog')
+        assert [hit.id for hit in response.results[:2]] == [str(blog), str(qa)]
+        assert response.results[1].technology == 'python'
+        assert '<mark>Zlatorog</mark>' in response.results[1].snippet
+    finally:
+        db.process.blog.delete_one({'_id': blog})
+        db.process.python_qa.delete_one({'_id': qa})
+
+
+@pytest.mark.parametrize('params', [
+    {'q': 'p'},
+    {'q': 'python', 'page': 0},
+    {'q': 'python', 'page': search_routes.SEARCH_MAX_PAGE + 1},
+    {'q': 'python', 'page_size': 51},
+    {'q': 'python', 'kind': 'video'},
+])
+def test_search_route_validates_the_query(params):
+    assert client.get('/search/', params=params).status_code == 422
+
+
+def test_search_route_passes_the_filters_to_the_backend(monkeypatch):
+    calls = []
+
+    def fake_search(q, **kwargs):
+        calls.append((q, kwargs))
+        return SearchResponse(query=q, page=kwargs['page'], page_size=kwargs['page_size'], total=0, results=[])
+
+    monkeypatch.setattr(search, 'search', fake_search)
+    response = client.get('/search/', params={'q': 'python', 'kind': 'qa', 'technology': 'python', 'page': 2,
+                                               'page_size': 5})
+
+    assert response.status_code == 200
+    assert response.json() == {'query': 'python', 'page': 2, 'page_size': 5, 'total': 0, 'results': []}
+    assert calls == [('python', {'kind': 'qa', 'technology': 'python', 'page': 2, 'page_size': 5})]
+    assert client.get('/search/', params={'q': 'python', 'technology': 'cobol'}).status_code == 404
+
+
+def test_search_route_returns_ranked_hits_of_the_requested_kind(monkeypatch):
+    monkeypatch.setattr(env, 'SEARCH_BACKEND', 'memory')
+    monkeypatch.setattr(search_index, 'index', search_index.index)
+    monkeypatch.setattr(search_index, '_built', search_index._built)
+    search_index.build()
+    answer = db.process.python_qa.find_one()['answer']  # The answer is the snippet source of QA hits
+    term = max(search_index.tokenize(answer), key=len)
+
+    response = client.get('/search/', params={'q': term, 'kind': 'qa', 'technology': 'python'})
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body['total'] >= 1 and body['results']
+    assert {(hit['kind'], hit['technology']) for hit in body['results']} == {('qa', 'python')}
+    assert set(body['results'][0]) == {'_id', 'kind', 'technology', 'title', 'snippet', 'score', 'datum_vnosa'}
+    scores = [hit['score'] for hit in body['results']]
+    assert scores == sorted(scores, reverse=True)
+    assert any('<mark>' in hit['snippet'] for hit in body['results'])
@@ -0,0 +1,33 @@
+from src.services.search_index import InvertedIndex, tokenize
+
+
+def test_tokenize_keeps_slovenian_letters():
+    assert tokenize('Čudovit Python-framework, žar!') == ['čudovit', 'python', 'framework', 'žar']
+
+
+def test_index_ranks_title_matches_first_and_excludes_terms():
+    index = InvertedIndex()
+    index.add('python_articles', '1', [('Uvod v Python', 10), ('Vsebina o jezikih', 1)], {'title': 'Uvod v Python'})
+    index.add('python_articles', '2', [('Drugi naslov', 10), ('Python in Django', 1)], {'title': 'Drugi naslov'})
+    index.add('vue_articles', '3', [('Vue', 10), ('Python backend', 1)], {'title': 'Vue'})
+
+    total, ranked = index.search('python')
+    assert total == 3
+    assert ranked[0][1] == ('python_articles', '1')
+
+    total, ranked = index.search('python -django', collections={'python_articles'})
+    assert total == 1
+    assert [key for _, key, _ in ranked] == [('python_articles', '1')]
+
+
+def test_index_replaces_and_removes_documents():
+    index = InvertedIndex()
+    index.add('blog', '1', [('asyncio', 1)], {})
+    index.add('blog', '1', [('threading', 1)], {})
+
+    assert index.search('asyncio') == (0, [])
+    assert index.search('threading')[0] == 1
+
+    index.remove('blog', '1')
+    assert len(index) == 0
+    assert index.search('threading') == (0, [])
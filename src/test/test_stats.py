@@ -0,0 +1,108 @@
+import asyncio
+import sys
+
+import pytest
+
+from src.__main__ import app
+from src.domain.subscriber import Subscriber
+from src.routes import subscriber as subscriber_routes
+from src.services import db, emails, stats, synthetic
+from src.services.security import get_current_user
+from src.test.utils.helpers import client
+
+BLOG = {'title': 'Števci', 'kategorija': 'test', 'podnaslov': 'p', 'vsebina': 'v', 'author': 'Ana'}
+
+
+@pytest.fixture
+def logged_in():
+    app.dependency_overrides[get_current_user] = lambda: None
+    yield
+    app.dependency_overrides.pop(get_current_user)
+
+
+def _counts() -> dict:
+    return client.get('/stats/').json()
+
+
+def test_stats_are_rebuilt_from_the_collections(logged_in):
+    db.process[stats.STATS_COLLECTION].drop()
+
+    counts = _counts()
+    assert counts['content']['blog'] == db.process.blog.count_documents({})
+    assert counts['articles']['by_technology']['python'] == db.process.python_articles.count_documents({})
+    assert counts['qa']['total'] == sum(counts['qa']['by_technology'].values())
+    assert client.post('/stats/rebuild').json()['content'] == counts['content']
+
+
+def test_writes_keep_the_counters_current(logged_in, monkeypatch):
+    before = _counts()
+
+    created = client.post('/blog/', json=BLOG).json()
+    assert _counts()['content']['blog'] == before['content']['blog'] + 1
+    client.delete(f"/blog/{created['_id']}")
+    assert _counts()['content']['blog'] == before['content']['blog']
+
+    monkeypatch.setattr(emails, 'send_email', lambda **kwargs: True)
+    client.post('/contact/', json={'full_name': 'Ana', 'email': 'ana@example.com', 'message': 'Živjo'})
+    assert _counts()['messages']['received'] == before['messages']['received'] + 1
+
+    subscriber = Subscriber(name='Ana', surname='Novak', email='ana@example.com')
+    asyncio.run(subscriber_routes.post_subscriber(subscriber))
+    confirmed = subscriber.model_copy(update={'confirmed': True})
+    asyncio.run(subscriber_routes.edit_subscriber(str(subscriber.id), confirmed))
+    assert _counts()['subscribers']['confirmed'] == before['subscribers']['confirmed'] + 1
+    assert _counts()['subscribers']['pending'] == before['subscribers']['pending']
+    asyncio.run(subscriber_routes.delete_subscriber(str(subscriber.id)))
+    assert _counts()['subscribers'] == before['subscribers']
+
+    incremental = stats.counters()
+    stats.rebuild()
+    assert {**stats.counters(), 'updated_at': None} == {**incremental, 'updated_at': None}
+
+
+def test_stats_count_synthetic_fill(logged_in):
+    volumes = {'articles': len(stats.TECHNOLOGIES), 'blog': 3, 'subscriber': 2}
+    collections = list(synthetic.volumes_per_collection(volumes))
+    existing = {collection: db.process[collection].distinct('_id') for collection in collections}
+    before = _counts()
+
+    synthetic.fill(volumes, batch_size=2)
+    try:
+        counts = _counts()
+        assert counts['content']['blog'] == before['content']['blog'] + 3
+        assert counts['articles']['total'] == before['articles']['total'] + len(stats.TECHNOLOGIES)
+        assert counts['subscribers']['total'] == before['subscribers']['total'] + 2
+    finally:
+        for collection, ids in existing.items():
+            db.process[collection].delete_many({'_id': {'$nin': ids}})
+        stats.rebuild()
+
+
+def test_concurrent_subscriber_confirmations_move_the_counters_once(logged_in, monkeypatch):
+    subscriber = Subscriber(name='Bor', surname='Kos', email='bor@example.com')
+    asyncio.run(subscriber_routes.post_subscriber(subscriber))
+    before = _counts()['subscribers']
+    confirmed = subscriber.model_copy(update={'confirmed': True, 'name': 'Borut'})
+    collection_type = type(db.process.subscriber)
+    find_one = collection_type.find_one
+    racing = []
+
+    def find_one_then_concurrent_edit(self, *args, **kwargs):
+        # Another request confirms the subscriber right after a read made by the route, before the route's update
+        document = find_one(self, *args, **kwargs)
+        if sys._getframe(1).f_globals['__name__'] == subscriber_routes.__name__ and not racing:
+            racing.append(1)
+            db.process.subscriber.update_one({'_id': subscriber.id}, {'$set': {'confirmed': True, 'name': 'Bor'}})
+            stats.move_subscriber(True)
+        return document
+
+    monkeypatch.setattr(collection_type, 'find_one', find_one_then_concurrent_edit)
+    first = asyncio.run(subscriber_routes.edit_subscriber(str(subscriber.id), confirmed))
+    monkeypatch.undo()
+    assert asyncio.run(subscriber_routes.edit_subscriber(str(subscriber.id), confirmed)) is None  # Unchanged
+
+    counts = _counts()['subscribers']
+    assert counts['confirmed'] == before['confirmed'] + 1
+    assert counts['pending'] == before['pending'] - 1
+    assert first.name == 'Borut' and first.confirmed
+    asyncio.run(subscriber_routes.delete_subscriber(str(subscriber.id)))
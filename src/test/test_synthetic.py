@@ -0,0 +1,28 @@
+from src.domain.article import Article
+from src.domain.blog import Blog
+from src.domain.language import Language
+from src.domain.language_data import LanguageData
+from src.domain.subscriber import Subscriber
+from src.services.synthetic import generate, volumes_per_collection
+
+
+def test_volumes_are_split_across_technologies():
+    counts = volumes_per_collection({'articles': 31, 'qa': 0, 'blog': 5})
+
+    assert sum(count for collection, count in counts.items() if collection.endswith('_articles')) == 31
+    assert counts['python_articles'] in (2, 3)
+    assert counts['blog'] == 5
+    assert 'python_qa' not in counts
+
+
+def test_generated_documents_match_domain_models():
+    for collection, model in (('vue_articles', Article), ('vue_qa', Language), ('blog', Blog),
+                              ('language_data', LanguageData), ('subscriber', Subscriber)):
+        documents = list(generate(collection, 5, seed=1))
+        assert len(documents) == 5
+        for document in documents:
+            assert model.model_validate(document).model_dump(by_alias=True) == document
+
+    assert [document['question'] for document in generate('vue_qa', 3, seed=1)] == \
+           [document['question'] for document in generate('vue_qa', 3, seed=1)]
+    assert len(next(generate('python_articles', 1))['content']) >= 2_000
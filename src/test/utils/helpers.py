@@ -1,7 +1,9 @@
+import json
 from typing import Type
 from pydantic import BaseModel
 from fastapi.testclient import TestClient
 from src.services import db
+from src.services.content_storage import resolve
 from src.__main__ import app
 from fastapi import status
 from typing import Optional
@@ -21,7 +23,23 @@ def normalize_data(data, model: Type[BaseModel]):
     :param model: Pydantic model class to apply normalization
     :return: List of dictionaries representing the normalized data
     """
-    return [model(**doc).dict(by_alias=True) for doc in data]
+    return [model(**doc).model_dump(by_alias=True) for doc in data]
+
+
+def collection_for_route(route: str) -> str:
+    """
+    Map an API route to the MongoDB collection it is served from.
+
+    :param route: The API endpoint (e.g., "/blog", "/qa/python", "/article/vue").
+    :return: The collection name with the proper `_qa` / `_articles` suffix.
+    """
+    parts = route.split('/')
+    if len(parts) >= 3:
+        if parts[1] == 'qa':
+            return f"{parts[2]}_qa"
+        elif parts[1] == 'article':
+            return f"{parts[2]}_articles"
+    return parts[-1]
 
 
 def check_status_response_for(route: str, model: Type[BaseModel]):
@@ -40,18 +58,10 @@ def check_status_response_for(route: str, model: Type[BaseModel]):
     response = client.get(route)
 
     # Extract collection name from route with proper suffix
-    parts = route.split('/')
-    if len(parts) >= 3:
-        if parts[1] == 'qa':
-            collection_name = f"{parts[2]}_qa"
-        elif parts[1] == 'article':
-            collection_name = f"{parts[2]}_articles"
-        else:
-            collection_name = parts[-1]
-    else:
-        collection_name = parts[-1]
+    collection_name = collection_for_route(route)
 
-    cursor = db.process[collection_name].find()
+    physical, base_filter = resolve(collection_name)
+    cursor = db.process[physical].find(base_filter)
 
     expected_data = normalize_data(cursor, model)
     response_data = normalize_data(response.json(), model)
@@ -82,19 +92,11 @@ def check_status_response_by_id_for(route: str, model: Type[BaseModel]):
     """
 
     # Extract collection name from route with proper suffix
-    parts = route.split('/')
-    if len(parts) >= 3:
-        if parts[1] == 'qa':
-            collection_name = f"{parts[2]}_qa"
-        elif parts[1] == 'article':
-            collection_name = f"{parts[2]}_articles"
-        else:
-            collection_name = parts[-1]
-    else:
-        collection_name = parts[-1]
+    collection_name = collection_for_route(route)
 
     # Find the first document in the collection
-    first_document = db.process[collection_name].find_one()
+    physical, base_filter = resolve(collection_name)
+    first_document = db.process[physical].find_one(base_filter)
 
     if not first_document:
         print(f"No data found in collection for route: {route}")
@@ -106,8 +108,8 @@ def check_status_response_by_id_for(route: str, model: Type[BaseModel]):
     response = client.get(f"{route}/{document_id}")
 
     # Fetch the expected document using find_one
-    expected_data = model(**db.process[collection_name].find_one({"_id": document_id})).dict(by_alias=True)
-    response_data = model(**response.json()).dict(by_alias=True)
+    expected_data = model(**db.process[physical].find_one({"_id": document_id})).model_dump(by_alias=True)
+    response_data = model(**response.json()).model_dump(by_alias=True)
 
     """
     Print both to report
@@ -119,6 +121,30 @@ def check_status_response_by_id_for(route: str, model: Type[BaseModel]):
     assert response.status_code == 200
 
 
+def check_stream_response_for(route: str, model: Type[BaseModel]):
+    """
+    Test the streamed (NDJSON) variant of a list route against the database data.
+
+    - Sends a GET request with `stream=true` to the specified route.
+    - Parses every non-empty line of the response body as one JSON document.
+    - Normalizes both the database and streamed data using the provided Pydantic model and compares them.
+
+    :param route: The API endpoint to test (e.g., "/blog", "/qa/python").
+    :param model: The Pydantic model corresponding to the expected data structure.
+    """
+    response = client.get(route, params={'stream': 'true'})
+
+    physical, base_filter = resolve(collection_for_route(route))
+    cursor = db.process[physical].find(base_filter)
+
+    expected_data = normalize_data(cursor, model)
+    response_data = normalize_data([json.loads(line) for line in response.text.splitlines() if line], model)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    assert response_data == expected_data
+
+
 def check_health(route: str, message: Optional[str] = None):
     """
     Checks the health status of a main API route.
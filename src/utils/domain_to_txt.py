@@ -1,4 +1,14 @@
 import datetime
+import types
+import typing
+
+
+def _inner_type(annotation):
+    # Unwraps Optional[X] and List[X] to X, so optional fields and lists are typed by their items
+    while typing.get_origin(annotation) in (typing.Union, types.UnionType, list):
+        annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    return annotation
+
 
 def write_fields_to_txt(models):
     """
@@ -47,11 +57,11 @@ def write_fields_to_txt(models):
         for model in models:
             model_name = model.__name__  # Get the name of the model class
             f.write(f'export interface {model_name} {{\n')  # Write the model name as a TypeScript interface
-            for field_name, field_info in model.__fields__.items():
+            for field_name, field_info in model.model_fields.items():
                 if field_name == 'id':
                     f.write(" '_id'?: string;\n")  # Write _id field with type 'str'
                     continue
-                field_type = field_info.type_  # Get the type of the field
+                field_type = _inner_type(field_info.annotation)  # Get the type of the field
 
                 # Map field types to TypeScript types
                 if field_type is bool:
@@ -5,17 +5,40 @@ or delete documents, while converting data to/from Pydantic models.
 
 Functions:
 - all_data: Retrieves all documents from a collection and converts them into Pydantic model instances.
-- limited_data: Retrieves a limited number of documents from a collection and converts them into Pydantic model instances.
+- cached_all_data: Returns the serialized and compressed response of all_data, cached until the next write.
+- stream_data: Streams all documents from a collection as NDJSON, validating them batch by batch straight from the cursor.
+- limited_data: Retrieves the first documents of a collection in a given sort order (newest first by default), backed by an index.
 - data_by_id: Retrieves a single document by its _id from a collection and converts it into a Pydantic model instance.
 - add_data: Inserts a new document into a collection and returns the newly created Pydantic model instance with its assigned _id.
 - edit_data: Updates an existing document in a collection and returns the updated Pydantic model instance.
 - delete_data: Deletes a document from a collection by its _id and returns a success message or raises an error if not found.
+
+Collections are addressed by their logical name (e.g. `python_articles`); `content_storage.resolve` maps it to the
+physical collection and filter, so the helpers work unchanged with `CONTENT_STORAGE=unified`.
+
+Every successful write goes through `_after_write`, which keeps in-process state derived from the collections
+(the response cache and the in-memory search index) in sync.
 """
 
+from functools import lru_cache
 from typing import Type
-from pydantic import BaseModel
-from src.services import db
+from pydantic import BaseModel, TypeAdapter
+from src import env
+from src.domain.object_id import object_id
+from src.services import cache, db, search_index, stats
+from src.services.compression import PrecompressedBody, PrecompressedResponse
+from src.services.content_storage import NEWEST_FIRST, resolve
+from src.services.json_response import dumps
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+LIMITED_DATA_MAX = 100  # Upper bound for the `limit` of limited_data
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    # Validator of list[model], built once per model: a whole result list is validated in one pydantic-core call
+    return TypeAdapter(list[model])
 
 
 # All the data: Retrieves all documents from a collection and converts them into Pydantic model instances.
@@ -31,27 +54,92 @@ def all_data(collection: str, model: Type[BaseModel]):
     Returns:
         List[model]: A list of Pydantic model instances representing each document.
     """
-    cursor = db.process[collection].find()
-    return [model(**document) for document in cursor]
+    physical, base_filter = resolve(collection)
+    cursor = db.process[physical].find(base_filter)
+    return _list_adapter(model).validate_python(list(cursor))
 
 
-# Limited data: Retrieves a limited number of documents from a collection and converts them into Pydantic model instances.
-def limited_data(collection: str, model: Type[BaseModel], limit: int):
+# Cached all data: The response of all_data, serialized and compressed once per write instead of once per request.
+def cached_all_data(collection: str, model: Type[BaseModel]) -> PrecompressedResponse:
     """
-    Retrieves a limited number of documents from the specified collection in the database and
-    transforms each document into an instance of the provided Pydantic model.
+    Returns all documents of the collection like `all_data`, as a cached, precompressed JSON response.
+
+    The serialized body is cached until the next write to the collection (or CACHE_TTL), and its gzip / brotli
+    variants are kept next to it, so every variant is compressed once per write.
+
+    Parameters:
+        collection (str): The name of the collection to query.
+        model (Type[BaseModel]): The Pydantic model class to use for validation and transformation.
+
+    Returns:
+        PrecompressedResponse: The JSON list, compressed according to the request's Accept-Encoding.
+    """
+    namespace = f'all_data:{collection}'
+    cache.depends_on(namespace, [collection])
+    body = cache.cached(namespace, collection, lambda: PrecompressedBody(
+        dumps([document.model_dump(mode='json', by_alias=True) for document in all_data(collection, model)])
+    ))
+    return PrecompressedResponse(body)
+
+
+# Stream data: Streams all documents from a collection as NDJSON without building the full list in memory.
+def stream_data(collection: str, model: Type[BaseModel], query: dict | None = None,
+                batch_size: int = env.STREAM_BATCH_SIZE):
+    """
+    Streams the documents from the specified collection as newline-delimited JSON (NDJSON).
+
+    Documents are read from the Mongo cursor in batches of `batch_size`, validated through the provided
+    Pydantic model, serialized with orjson and written to the response one batch at a time, so memory per
+    request is bounded by the batch size instead of the collection size.
+
+    Parameters:
+        collection (str): The name of the collection to query.
+        model (Type[BaseModel]): The Pydantic model class to use for validation and serialization.
+        query (dict | None): Optional MongoDB filter applied to the cursor.
+        batch_size (int): Number of documents fetched per cursor batch and written per chunk.
+
+    Returns:
+        StreamingResponse: An `application/x-ndjson` response with one JSON document per line.
+    """
+    physical, base_filter = resolve(collection)
+    cursor = db.process[physical].find({**base_filter, **(query or {})}).batch_size(batch_size)
+
+    def ndjson_chunks():
+        chunk = []
+        for document in cursor:
+            chunk.append(dumps(model.model_validate(document).model_dump(mode='json', by_alias=True)))
+            if len(chunk) >= batch_size:
+                yield b'\n'.join(chunk) + b'\n'
+                chunk = []
+        if chunk:
+            yield b'\n'.join(chunk) + b'\n'
+
+    return StreamingResponse(ndjson_chunks(), media_type='application/x-ndjson')
+
+
+# Limited data: Retrieves the first documents of a collection in a given sort order (newest first by default).
+def limited_data(collection: str, model: Type[BaseModel], limit: int, sort: list[tuple[str, int]] = NEWEST_FIRST):
+    """
+    Retrieves a limited number of documents from the specified collection in the database, in the given sort order,
+    and transforms each document into an instance of the provided Pydantic model.
+
+    The default sort is backed by an index (created by `content_storage.ensure_indexes` on startup), so MongoDB reads
+    only the first `limit` index entries instead of sorting or scanning the collection. `limit` is clamped to 1..LIMITED_DATA_MAX.
 
     Parameters:
         collection (str): The name of the collection to query.
         model (Type[BaseModel]): The Pydantic model class to use for validation and transformation.
         limit (int): The maximum number of documents to retrieve.
+        sort (list[tuple[str, int]]): Sort keys, newest `datum_vnosa` first (ties broken by `_id`) by default.
 
     Returns:
         List[model]: A list of Pydantic model instances representing each document retrieved,
                      up to the specified limit.
     """
-    cursor = db.process[collection].find().limit(limit)
-    return [model(**document) for document in cursor]
+    limit = min(max(limit, 1), LIMITED_DATA_MAX)
+    physical, base_filter = resolve(collection)
+    cursor = db.process[physical].find(base_filter).sort(sort).limit(limit)
+    return _list_adapter(model).validate_python(list(cursor))
 
 
 # Data by ID: Retrieves a single document by its _id from a collection and converts it into a Pydantic model instance.
@@ -71,11 +159,24 @@ def data_by_id(collection: str, model: Type[BaseModel], _id: str):
     Raises:
         HTTPException: If a document with the provided ID is not found in the collection.
     """
-    cursor = db.process[collection].find_one({'_id': _id})
+    physical, base_filter = resolve(collection)
+    cursor = db.process[physical].find_one({'_id': object_id(_id), **base_filter})
     if cursor is None:
         raise HTTPException(status_code=404, detail=f'{collection} by ID: ({_id}) does not exist')
     else:
-        return model(**cursor)
+        return model.model_validate(cursor)
+
+
+# After write: Keeps in-process state derived from the collections in sync after a document was written or deleted.
+def _after_write(collection: str, _id: str, document: dict | None = None):
+    """
+    Called after every successful add/edit/delete with the written document, or with None when it was deleted.
+    """
+    cache.invalidate(collection)
+    if document is None:
+        search_index.remove_document(collection, _id)
+    else:
+        search_index.index_document(collection, document)
 
 
 # Add new data: Inserts a new document into a collection and returns the created Pydantic model instance with its _id.
@@ -91,10 +192,13 @@ def add_data(collection: str, data: BaseModel, model: Type[BaseModel]):
     Returns:
         model | None: The newly created model instance (with the _id) if the insertion was successful; otherwise, None.
     """
-    model_dict = data.dict(by_alias=True)
-    insert_result = db.process[collection].insert_one(model_dict)
+    physical, base_filter = resolve(collection)
+    model_dict = {**data.model_dump(by_alias=True), **base_filter}
+    insert_result = db.process[physical].insert_one(model_dict)
     if insert_result.acknowledged:
         model_dict['_id'] = str(insert_result.inserted_id)
+        _after_write(collection, model_dict['_id'], model_dict)
+        stats.count_document(collection)
         return model(**model_dict)
     else:
         return None
@@ -123,13 +227,15 @@ def edit_data(_id: str, collection: str, data: BaseModel, model: Type[BaseModel]
         5. Convert the '_id' field to a string and return the updated document as an instance of the model.
         6. If no modifications were made, return None.
     """
-    model_dict = data.dict(by_alias=True)
+    model_dict = data.model_dump(by_alias=True)
     del model_dict['_id']
-    cursor = db.process[collection].update_one({'_id': _id}, {'$set': model_dict})
+    physical, base_filter = resolve(collection)
+    cursor = db.process[physical].update_one({'_id': object_id(_id), **base_filter}, {'$set': model_dict})
     if cursor.modified_count > 0:
-        updated_document = db.process[collection].find_one({'_id': _id})
+        updated_document = db.process[physical].find_one({'_id': object_id(_id)})
         if updated_document:
             updated_document['_id'] = str(updated_document['_id'])
+            _after_write(collection, _id, updated_document)
             return model(**updated_document)
     return None
 
@@ -149,8 +255,11 @@ def delete_data(_id: str, collection: str):
     Raises:
         HTTPException: If no document is found with the provided _id, a 404 error is raised.
     """
-    delete_result = db.process[collection].delete_one({'_id': _id})
+    physical, base_filter = resolve(collection)
+    delete_result = db.process[physical].delete_one({'_id': object_id(_id), **base_filter})
     if delete_result.deleted_count > 0:
+        _after_write(collection, _id)
+        stats.count_document(collection, -1)
         return {'message': f'{collection} deleted successfully!'}
     else:
         raise HTTPException(status_code=404, detail=f'{collection} by ID: ({_id}) not found!')